@@ -0,0 +1,48 @@
+'''
+Startup benchmark: how long a fresh game takes to reach the first prompt, with locations and events loaded
+lazily (the normal game) and with every registered type loaded up front (how the game used to start).
+Each run is a new interpreter, so imports are counted.
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 10
+'''
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+#Runs in the child interpreter: start a game the way rungame.py does and stop at the first prompt
+CHILD = '''
+import sys, time
+start = time.perf_counter()
+import game.headless as headless
+import game.display as display
+import game.registry as registry
+if {eager}:
+    for entry in list(registry.locations) + list(registry.events):
+        entry.load()
+headless.new_game(display.ScriptedInput([]), display.null_sink, seed=1)
+print(time.perf_counter() - start, len(sys.modules))
+'''
+
+def run(eager):
+    out = subprocess.run([sys.executable, "-c", CHILD.format(eager=eager)], cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), int(out[1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a fresh game's startup.")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case (the best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'loading':>8} {'best ms':>10} {'modules':>8}")
+    for eager in [False, True]:
+        runs = [run(eager) for i in range(args.repeat)]
+        best = min(t for t, n in runs)
+        print(f"{'eager' if eager else 'lazy':>8} {best*1000:>10.2f} {runs[0][1]:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+'''
+World generation benchmark: how long World() takes to build maps of different sizes with many islands.
+
+    python benchmarks/bench_worldgen.py
+    python benchmarks/bench_worldgen.py --sizes 25,1000,10000 --islands 1,100,500
+'''
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import game.world as world
+
+def build(size, islands, seed):
+    world.World.island_list = ["island"] * islands
+    start = time.perf_counter()
+    world.World(None, seed, worldsize=size)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Time world generation.")
+    parser.add_argument("--sizes", default="25,1000,10000", help="comma separated world sizes")
+    parser.add_argument("--islands", default="1,100,500", help="comma separated island counts")
+    parser.add_argument("--repeat", type=int, default=3, help="builds per case (the best is reported)")
+    args = parser.parse_args()
+
+    islands_before = world.World.island_list
+    print(f"{'size':>8} {'islands':>8} {'best ms':>10}")
+    try:
+        for size in [int(s) for s in args.sizes.split(",")]:
+            for islands in [int(n) for n in args.islands.split(",")]:
+                try:
+                    best = min(build(size, islands, seed) for seed in range(args.repeat))
+                    print(f"{size:>8} {islands:>8} {best*1000:>10.2f}")
+                except world.worldgen.WorldGenError:
+                    print(f"{size:>8} {islands:>8} {'no room':>10}")
+    finally:
+        world.World.island_list = islands_before
+
+if __name__ == "__main__":
+    main()
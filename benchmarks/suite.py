@@ -0,0 +1,264 @@
+'''
+Benchmark suite for the game's hot paths, with stored baselines to catch slowdowns.
+
+    python benchmarks/suite.py                      # time every case
+    python benchmarks/suite.py world combat-8v16    # just these cases
+    python benchmarks/suite.py --save               # time and store as the new baseline
+    python benchmarks/suite.py --compare            # fail (exit 1) if a case got slower than the baseline allows
+
+Every case is timed over a few runs (--repeat, 5 by default). The baseline lives in
+benchmarks/baseline.json next to this file.
+
+Timings depend on the machine and on how busy it is, so a fixed calibration loop (plain Python: calls,
+dicts, strings, like the game) is timed just before every run, and --compare goes by each case's median
+time relative to the loop's median. A baseline saved on one machine can then be compared against on
+another, CI included. The "change" column is that calibrated change; the microseconds are the fastest
+run on this machine. A case fails --compare when its calibrated time is more than (1 + threshold) times
+its baseline's. --threshold sets the threshold for every case, and a case can have its own in the
+baseline file: the microsecond-scale cases and the ones that jump around more from run to run do.
+
+To regenerate the baseline, after a change that is meant to change the timings or when a case is added:
+
+    python benchmarks/suite.py --save --repeat 7
+
+That stores every case's new timings and keeps the per-case thresholds. Use a quiet machine and commit
+baseline.json along with the change.
+'''
+
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import game.config as config
+import game.display as display
+import game.fog as fog
+import game.headless as headless
+import game.items as items
+import game.player as player
+import game.simulate as simulate
+import game.snapshot as snapshot
+import game.world as world
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+THRESHOLD = 0.25
+
+def quiet_game(source, seed):
+    '''A new game that reads from source, throws its output away and doesn't record a score.'''
+    p = headless.new_game(source, display.null_sink, seed)
+    p.score_log = None
+    return p
+
+#Each case is set up by a function returning what to call; only the calls are timed.
+
+def bench_world():
+    seeds = iter(range(10**9))
+    return lambda: world.World(None, next(seeds))
+
+def bench_day():
+    '''A full day at sea (start_day, process_day, end_day) with a bot giving the orders.
+    A game that ends is replaced by a new one, so every call is a day.'''
+    rng = random.Random(1)
+    source = headless.RandomSailor(rng).source()
+    game = [quiet_game(source, 1)]
+    def day():
+        #the game ends with sys.exit, from the day itself or when notdone finds everyone dead
+        try:
+            headless.sea_state_update()
+            over = not game[0].notdone()
+        except SystemExit:
+            over = True
+        if over:
+            game[0] = quiet_game(source, rng.randrange(2**32))
+    return day
+
+#Combat cases cycle through this many seeds, and run a multiple of it per run, so every run plays the same
+# fights (how long a fight lasts depends a lot on the dice)
+FIGHT_SEEDS = 10
+
+def bench_combat(crew, monsters):
+    def setup():
+        seeds = itertools.cycle(range(1, FIGHT_SEEDS + 1))
+        def fight():
+            simulate.simulate_chunk(crew, None, [f"game.combat:Drowned*{monsters}"], 1, next(seeds))
+        return fight
+    return setup
+
+def bench_dispatch():
+    '''Player.get_interaction reading and running one command.'''
+    commands = display.CallbackInput(lambda prompt: "inventory")
+    p = quiet_game(commands, 1)
+    contexts = [p, p.ship]
+    return lambda: player.Player.get_interaction(contexts)
+
+def bench_map(size):
+    '''Drawing the player's map from scratch (nothing cached), with a ring of the map explored.'''
+    def setup():
+        p = quiet_game(display.ScriptedInput([]), 1)
+        w = world.World(p.ship, 1, worldsize=size)
+        p.world = w
+        p.seen = fog.Fog(size)
+        for i in range(0, size, 2):
+            p.seen.reveal(i, i, 2)
+        def draw():
+            p.map_view.rows = []
+            p.map_view.render(w, p.seen, p.ship.get_loc())
+        return draw
+    return setup
+
+def bench_loot():
+    '''Picking up an item (and equipping it and putting it back) with thousands already in the hold.'''
+    p = quiet_game(display.ScriptedInput([]), 1)
+    kinds = [items.Cutlass, items.BelayingPin, items.Flintlock]
+    for i in range(3000):
+        p.add_to_inventory([kinds[i % 3]()])
+    pirate = p.pirates[0]
+    def loot():
+        p.add_to_inventory([items.Cutlass()])
+        pirate.process_verb("equip", ["equip", "flintlock"], {})
+        pirate.process_verb("unequip", ["unequip", "flintlock"], {})
+    return loot
+
+def bench_save_load():
+    p = quiet_game(display.ScriptedInput([]), 1)
+    return lambda: snapshot.loads(snapshot.dumps(p))
+
+def bench_calibration():
+    '''A fixed amount of interpreter work that never changes with the game's code, to measure the machine.'''
+    class Cell:
+        def __init__(self, x):
+            self.x = x
+        def step(self):
+            return self.x + 1
+    def work():
+        total = 0
+        table = {}
+        for i in range(2000):
+            c = Cell(i)
+            table[str(i)] = c.step()
+            total += table[str(i)] % 7
+        return total
+    return work
+
+#name -> (setup, calls per run)
+CASES = {
+    "world": (bench_world, 50),
+    "day": (bench_day, 200),
+    "combat-4v4": (bench_combat(4, 4), 50),
+    "combat-8v16": (bench_combat(8, 16), 10),
+    "combat-32v64": (bench_combat(32, 64), 10),
+    "dispatch": (bench_dispatch, 2000),
+    "map-25": (bench_map(25), 500),
+    "map-1000": (bench_map(1000), 5),
+    "loot": (bench_loot, 500),
+    "save-load": (bench_save_load, 50),
+}
+
+def measure(setup, number, repeat, calibrate):
+    '''(best time per call, time per call relative to the calibration loop) over repeat runs of number calls.
+    The calibration loop is timed just before each run, so the two see the machine in the same state, and
+    the relative time is the ratio of the medians: a fast or slow spell shows up in both or in neither.'''
+    fn = setup()
+    times = []
+    machine = []
+    for r in range(repeat):
+        start = time.perf_counter()
+        calibrate()
+        machine.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        for i in range(number):
+            fn()
+        times.append((time.perf_counter() - start) / number)
+    return min(times), statistics.median(times) / statistics.median(machine)
+
+def run(names, repeat):
+    '''name -> (seconds per call, time per call relative to the calibration loop) for each case.'''
+    calibrate = bench_calibration()
+    results = {}
+    for name in names:
+        setup, number = CASES[name]
+        results[name] = measure(setup, number, repeat, calibrate)
+    config.the_display = None
+    return results
+
+def read_baseline(path=BASELINE):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def change(result, base):
+    '''How much slower result is than base, as a fraction (0.1 is 10% slower). Compares the calibrated times,
+    or the plain seconds if the baseline predates calibration.'''
+    seconds, relative = result
+    if "relative" in base:
+        return relative / base["relative"] - 1
+    return seconds / base["seconds"] - 1
+
+def compare(results, baseline, threshold=THRESHOLD):
+    '''The cases slower than their baseline allows, as (name, change, allowed change).
+    Cases with no baseline are skipped.'''
+    slow = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        allowed = base.get("threshold", threshold)
+        if change(result, base) > allowed:
+            slow.append((name, change(result, base), allowed))
+    return slow
+
+def save_baseline(results, path=BASELINE):
+    baseline = read_baseline(path)
+    for name, (seconds, relative) in results.items():
+        entry = baseline.setdefault(name, {})
+        entry["seconds"] = seconds
+        entry["relative"] = relative
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+def fmt(seconds):
+    return f"{seconds*1e6:,.1f}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the game's hot paths.")
+    parser.add_argument("cases", nargs="*", help=f"cases to run (default all: {', '.join(CASES)})")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case")
+    parser.add_argument("--save", action="store_true", help="store the timings as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="exit 1 if a case regressed past its threshold")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown for cases without their own, 0.25 is 25%% slower")
+    args = parser.parse_args()
+    for name in args.cases:
+        if name not in CASES:
+            parser.error(f"unknown case {name}")
+
+    results = run(args.cases or list(CASES), args.repeat)
+    baseline = read_baseline()
+    print(f"{'case':<14} {'us/call':>14} {'baseline us':>14} {'change':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<14} {fmt(result[0]):>14} {'-':>14} {'-':>8}")
+        else:
+            print(f"{name:<14} {fmt(result[0]):>14} {fmt(base['seconds']):>14} {100*change(result, base):>+7.1f}%")
+
+    if args.save:
+        save_baseline(results)
+        print(f"saved baseline to {BASELINE}")
+    if args.compare:
+        slow = compare(results, baseline, args.threshold)
+        for name, slower, allowed in slow:
+            print(f"REGRESSION {name}: {100*slower:+.1f}% against the baseline, {100*allowed:.0f}% allowed")
+        if len(slow):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+'''
+Vectorized batch combat resolver.
+
+Runs N independent fights at once with NumPy. Every fight is a row: health, speed, cur_move and the
+attack options of each combatant live in arrays, and each step moves one combatant in every fight
+that is still going, drawing hit rolls and damage for all of them in one go.
+
+It follows the same rules as Combat.combat (initiative by speed, ties broken at random, one target
+per attack, flintlocks only fire once per fight) and the same crew policy as game/simulate.py (best
+expected damage, random target), so the two report the same numbers, this one much faster. Defending
+and lucky rolls are not modelled.
+
+    python -m game.batchcombat --crew 4 --monster game.combat:Drowned*4 --trials 1000000
+
+NumPy is an optional dependency of the game (pip install numpy): only this module needs it.
+
+Monsters roll their stats when they are made, so each monster type is sampled by making a pool of
+them up front; fights draw their monsters from that pool.
+'''
+
+import argparse
+import random
+import time
+
+import numpy
+
+import game.config as config
+import game.items as items
+from game.simulate import CombatStats, load_monsters, load_item
+
+SKILLS = ["brawling", "swords", "melee", "guns", "cannons", "swimming"]
+#Same kit as CrewMate.__init__
+DEFAULT_LOADOUT = [items.Cutlass, items.Flintlock]
+#Monsters made per monster type to sample stats from
+POOL_SIZE = 4096
+
+def crew_options(loadout):
+    '''Attack options a crewmate gets from their items plus punching, as (skill, low, high, charges).
+    charges is -1 for weapons that never run out.'''
+    options = []
+    for cls in loadout:
+        itm = cls()
+        if itm.damage[1] > 0 and itm.verb is not None and itm.verb2 is not None and itm.skill in SKILLS:
+            charges = itm.charges if itm.firearm else -1
+            options.append((itm.skill, itm.damage[0], itm.damage[1], charges))
+    options.append(("brawling", 1, 11, -1))
+    return options
+
+def monster_pool(make, size):
+    '''Makes size monsters and returns their stats as arrays: health, speed, and per-attack
+    success/low/high, padded to the largest number of attacks (valid marks the real ones).'''
+    monsters = [make(n+1) for n in range(size)]
+    k = max(len(m.actions) for m in monsters)
+    pool = {"health": numpy.array([m.health for m in monsters], dtype=float),
+            "speed": numpy.array([m.speed for m in monsters], dtype=float),
+            "success": numpy.zeros((size, k)),
+            "low": numpy.zeros((size, k), dtype=numpy.int64),
+            "high": numpy.zeros((size, k), dtype=numpy.int64),
+            "valid": numpy.zeros((size, k), dtype=bool)}
+    for i, m in enumerate(monsters):
+        for j, a in enumerate(m.actions):
+            pool["success"][i, j] = a.action.success
+            pool["low"][i, j] = a.action.damage_range[0]
+            pool["high"][i, j] = a.action.damage_range[1]
+            pool["valid"][i, j] = True
+    return pool
+
+def pick(mask, u):
+    '''For each column of mask, the row of a random True entry (u holds one uniform draw per column).
+    Columns with no True entry get the last row. Works down the short first axis only, which keeps it
+    fast for very wide batches.'''
+    counts = mask.sum(axis=0)
+    k = (u*counts).astype(numpy.int64)
+    return numpy.minimum((numpy.cumsum(mask, axis=0) <= k).sum(axis=0), len(mask) - 1)
+
+class BatchCombat ():
+    '''n fights between a crew of crew_size and the same kinds of monsters, resolved together.
+    Arrays are laid out combatant first (combatant, fight) and option first (option, combatant, fight),
+    so every per-fight reduction runs over a short axis.'''
+
+    def __init__(self, n, crew_size, loadout, pools, rng):
+        self.rng = rng
+        opts = crew_options(loadout)
+        m = sum(count for pool, count in pools)
+        k = max([len(opts)] + [pool["success"].shape[1] for pool, count in pools])
+        c = crew_size
+        p = c + m
+        self.crew_size = c
+
+        self.health = numpy.zeros((p, n))
+        self.speed = numpy.zeros((p, n))
+        self.cur = numpy.zeros((p, n))
+        self.success = numpy.zeros((k, p, n), dtype=numpy.int32)
+        self.low = numpy.zeros((k, p, n), dtype=numpy.int32)
+        self.high = numpy.zeros((k, p, n), dtype=numpy.int32)
+        self.charges = numpy.full((k, p, n), -1, dtype=numpy.int32)
+        self.valid = numpy.zeros((k, p, n), dtype=bool)
+        self.is_crew = numpy.zeros(p, dtype=bool)
+        self.is_crew[:c] = True
+
+        #Crew: the same rolls as CrewMate.__init__
+        self.health[:c] = 100
+        self.speed[:c] = 100 + rng.integers(-20, 21, (c, n))
+        skills = {s: rng.integers(10, 101, (c, n)) for s in SKILLS}
+        for j, (skill, lo, hi, charges) in enumerate(opts):
+            self.success[j, :c] = skills[skill]
+            self.low[j, :c] = lo
+            self.high[j, :c] = hi
+            self.charges[j, :c] = charges
+            self.valid[j, :c] = True
+
+        #Monsters: drawn from the pools
+        row = c
+        for pool, count in pools:
+            pick = rng.integers(0, len(pool["health"]), (count, n))
+            kk = pool["success"].shape[1]
+            self.health[row:row+count] = pool["health"][pick]
+            self.speed[row:row+count] = pool["speed"][pick]
+            for j in range(kk):
+                self.success[j, row:row+count] = pool["success"][pick, j]
+                self.low[j, row:row+count] = pool["low"][pick, j]
+                self.high[j, row:row+count] = pool["high"][pick, j]
+                self.valid[j, row:row+count] = pool["valid"][pick, j]
+            row += count
+
+        #Crew always pick the option with the best expected damage
+        self.expected = numpy.where(self.valid, self.success*(self.low + self.high)/2, -numpy.inf).astype(numpy.float32)
+        self.start_hp = self.health[:c].sum(axis=0)
+        self.turns = numpy.zeros(n, dtype=numpy.int64)
+
+    def alive(self):
+        return self.health > 0
+
+    def step(self, going):
+        '''One action in every fight. Fights that are over (going is False) are left as they are.'''
+        rng = self.rng
+        n = len(going)
+        cols = numpy.arange(n)
+        alive = self.health > 0
+
+        #Initiative: whoever reaches 100 first moves, everyone else advances by the same time.
+        #The dead have speed 0 and cur_move -inf, so they never reach it.
+        with numpy.errstate(divide="ignore"):
+            t = (100 - self.cur)/self.speed
+        dt = t.min(axis=0)
+        self.cur += self.speed*dt
+        mover = pick(t == dt, rng.random(n))
+        self.cur[mover, cols] = 0
+        crew_moves = self.is_crew[mover]
+
+        #Action: crew use their best ready attack, monsters pick a ready one at random
+        charges = self.charges[:, mover, cols]
+        ready = self.valid[:, mover, cols] & (charges != 0)
+        best = numpy.where(ready, self.expected[:, mover, cols], -numpy.inf).argmax(axis=0)
+        choice = numpy.where(crew_moves, best, pick(ready, rng.random(n)))
+
+        #Target: a random living enemy
+        enemy = alive & (self.is_crew[:, None] != crew_moves[None, :])
+        target = pick(enemy, rng.random(n))
+
+        #Resolve, like ActionResolver.resolve
+        hit = going & (rng.integers(0, 100, n) < self.success[choice, mover, cols])
+        damage = rng.integers(self.low[choice, mover, cols], self.high[choice, mover, cols] + 1)
+        health = self.health[target, cols] - numpy.where(hit, damage, 0)
+        self.health[target, cols] = health
+        self.speed[target, cols] = numpy.where(health > 0, self.speed[target, cols], 0)
+        self.cur[target, cols] = numpy.where(health > 0, self.cur[target, cols], -numpy.inf)
+        used = charges[choice, cols]
+        self.charges[choice, mover, cols] = numpy.where(going & (used > 0), used - 1, used)
+        self.turns += going
+
+    def keep(self, cols):
+        '''Drops every fight not in cols from the arrays.'''
+        for name in ["health", "speed", "cur", "success", "low", "high", "charges", "valid", "expected", "start_hp", "turns"]:
+            setattr(self, name, getattr(self, name)[..., cols])
+
+    def run(self):
+        '''Resolves every fight and returns the CombatStats. Finished fights are tallied and
+        dropped from the arrays once enough of them pile up, so later steps work on fewer fights.'''
+        c = self.crew_size
+        stats = CombatStats()
+        while len(self.turns):
+            alive = self.alive()
+            going = alive[:c].any(axis=0) & alive[c:].any(axis=0)
+            live = numpy.count_nonzero(going)
+            if live < 0.75*len(going):
+                stats.add(self.stats(~going))
+                self.keep(going)
+                if live == 0:
+                    break
+                going = going[going]
+            self.step(going)
+        return stats
+
+    def stats(self, cols):
+        '''CombatStats for the finished fights in cols.'''
+        c = self.crew_size
+        alive = self.alive()[:, cols]
+        turns = self.turns[cols]
+        stats = CombatStats()
+        stats.fights = len(turns)
+        stats.wins = int((~alive[c:].any(axis=0)).sum())
+        stats.turns = int(turns.sum())
+        stats.turns_sq = int((turns**2).sum())
+        lost = self.start_hp[cols] - numpy.maximum(self.health[:c, cols], 0).sum(axis=0)
+        stats.hp_lost = float(lost.sum())
+        stats.hp_lost_sq = float((lost**2).sum())
+        stats.crew = len(turns) * c
+        stats.deaths = int((~alive[:c]).sum())
+        return stats
+
+def simulate(crew_size, monsters, trials, loadout=None, seed=None, batch=100000):
+    '''Same interface and report as game.simulate.simulate, resolved in batches of fights.'''
+    if seed is None:
+        seed = random.randrange(2**32)
+    rng = numpy.random.default_rng(seed)
+    #monsters roll their stats with the game's generator
+    config.the_rng = random.Random(seed)
+    loadout_cls = DEFAULT_LOADOUT
+    if loadout is not None:
+        loadout_cls = [load_item(name) for name in loadout]
+    pools = []
+    for spec in monsters:
+        make, count = load_monsters(spec)
+        pools.append((monster_pool(make, POOL_SIZE), count))
+
+    stats = CombatStats()
+    done = 0
+    while done < trials:
+        n = min(batch, trials - done)
+        stats.add(BatchCombat(n, crew_size, loadout_cls, pools, rng).run())
+        done += n
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized batch combat simulator.")
+    parser.add_argument("--crew", type=int, default=4, help="number of crewmates")
+    parser.add_argument("--loadout", help="comma separated item names every crewmate carries")
+    parser.add_argument("--monster", action="append", required=True, help="module:Class*count, may be repeated")
+    parser.add_argument("--trials", type=int, default=100000)
+    parser.add_argument("--batch", type=int, default=100000, help="fights resolved together")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    loadout = None
+    if args.loadout:
+        loadout = args.loadout.split(",")
+    start = time.perf_counter()
+    stats = simulate(args.crew, args.monster, args.trials, loadout, args.seed, args.batch)
+    elapsed = time.perf_counter() - start
+    print(stats.report())
+    print(f"{stats.fights} fights in {elapsed:.2f}s ({stats.fights/elapsed:.0f} fights/s)")
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,19 @@
-import random
+import copy
+import heapq
 import game.config as config
 import game.crewmate as crew
 import game.superclasses as superclasses
 from game.context import Context
 import game.display as display
+import game.instrument as instrument
 from game.display import menu
 
 class Combat():
 
     def __init__ (self, monsters):
         self.monsters = monsters
+        #number of actions taken so far
+        self.turns = 0
 
     def crewmateAction(self, attacker, allies, enemies):
         """The player chooses an action for a crewmate to take."""
@@ -23,61 +27,151 @@ class Combat():
         return None
 
     def combat (self):
-        while len(self.monsters):
-            combatants = config.the_player.get_pirates() + self.monsters
-            min_t = None
-            for c in combatants:
-                t = (100 - c.cur_move)/c.speed
-                if min_t == None:
-                    min_t = t
-                else:
-                    min_t = min(t, min_t)
-            for c in combatants:
-                c.cur_move += c.speed*min_t
-            speeds = [c.cur_move for c in combatants]
-            max_move = max(speeds)
-            ready = [c for c in combatants if c.cur_move == max_move]
-            moving = random.choice(ready)
-            moving.cur_move = 0
+        with instrument.span("combat", self.combat):
+            self.run()
+
+    def run (self):
+        #the living crew, kept like self.monsters: only rebuilt when someone died
+        pirates = config.the_player.get_pirates()
+        queue = Initiative(pirates + self.monsters)
+        while len(self.monsters) and len(pirates):
+            self.turns += 1
+            moving = queue.next()
+            if moving == None:
+                break
             if isinstance(moving, crew.CrewMate):
-                chosen_action = self.crewmateAction(moving, config.the_player.get_pirates(), self.monsters)
+                chosen_action = self.crewmateAction(moving, pirates, self.monsters)
                 if(chosen_action != None):
-                    chosen_targets = chosen_action.pickTargets(chosen_action, moving, config.the_player.get_pirates(), self.monsters)
+                    chosen_targets = chosen_action.pickTargets(chosen_action, moving, pirates, self.monsters)
             else:
                 chosen_action = moving.pickAction()
-                chosen_targets = moving.pickTargets(chosen_action, moving, self.monsters, config.the_player.get_pirates())
-            #Resolve
+                chosen_targets = moving.pickTargets(chosen_action, moving, self.monsters, pirates)
+            #Resolve. Whoever is hit, or takes the hit for them, may die.
+            at_risk = [t for t in chosen_targets if t != None]
+            at_risk += [d for t in at_risk for d in t.defenders]
             chosen_action.resolve(chosen_action, moving, chosen_targets)
-            self.monsters = [m for m in self.monsters if m.health >0]
-            config.the_player.cleanup_items()
+            #Only rebuild the lists when someone actually died
+            if queue.stale or any(t.health <= 0 for t in at_risk):
+                self.monsters = [m for m in self.monsters if m.health >0]
+                pirates = config.the_player.get_pirates()
+                queue.stale = False
+            #Only the item just used can have been used up by it
+            if getattr(chosen_action.resolver, "usedUp", False):
+                config.the_player.cleanup_items()
+        queue.finish()
+
+
+class Initiative():
+    """Decides who acts next in a combat. Everyone builds up cur_move at their speed and acts on reaching 100,
+    so a speed 150 combatant acts three times for every two turns of a speed 100 one.
+    Kept as a heap of integer tick times, so each turn costs O(log n) however many are fighting.
+    Exact ties are broken at random (with the game's seeded generator)."""
+    #ticks it takes a speed 1 combatant to build up 1 point of cur_move
+    TICKS = 1000
+
+    def __init__ (self, combatants):
+        self.now = 0
+        self.count = 0
+        self.heap = []
+        #set when a dead combatant turns up that wasn't cleared from the fight yet
+        self.stale = False
+        for c in combatants:
+            self.schedule(c, 100 - c.cur_move)
+
+    def schedule (self, c, move_needed):
+        ticks = max(1, round(move_needed*Initiative.TICKS/c.speed))
+        self.count += 1
+        heapq.heappush(self.heap, (self.now + ticks, config.the_rng.random(), self.count, c))
+
+    def next (self):
+        """Pops the next living combatant, sets the clock to their turn and books their following turn."""
+        while len(self.heap):
+            tick, tie, n, c = heapq.heappop(self.heap)
+            if c.health <= 0:
+                self.stale = True
+                continue
+            self.now = tick
+            c.cur_move = 0
+            self.schedule(c, 100)
+            return c
+        return None
+
+    def finish (self):
+        """Writes cur_move back for the survivors, so crewmates carry their progress into the next fight."""
+        for tick, tie, n, c in self.heap:
+            c.cur_move = 100 - (tick - self.now)*c.speed/Initiative.TICKS
 
+def compile_attacks(attacks, resolver=None):
+    """The CombatActions for a dict of attack name -> [description, chance to hit, damage range]."""
+    return tuple(superclasses.CombatAction(key, superclasses.Attack(key, a[0], a[1], a[2], False), resolver) for key, a in attacks.items())
+
+class Species():
+    """What every monster of a kind has in common: a type name, the ranges its health and speed are rolled from,
+    and its attacks, as attack name -> [description, range of chance to hit, damage range].
+    hp and each chance to hit are randrange arguments; speed is (average, randrange arguments for the change).
+    Each monster rolls its own chance to hit for every attack. The attack for every chance a species can roll is
+    built once, with the species, so monsters share them and picking one in combat allocates nothing."""
+    def __init__ (self, type_name, hp, speed, attacks):
+        self.type_name = type_name
+        self.hp = hp
+        self.speed = speed
+        self.attacks = attacks
+        #one (lowest chance, actions by chance - lowest) per attack
+        self.table = []
+        for key, (description, success, damage) in attacks.items():
+            choices = tuple(superclasses.CombatAction(key, superclasses.Attack(key, description, s, damage, False), None) for s in range(*success))
+            self.table.append((success[0], success[1], choices))
+
+    def called (self, type_name):
+        """The same species (and attack table) under another name."""
+        other = copy.copy(self)
+        other.type_name = type_name
+        return other
+
+    def roll (self):
+        """A new monster's (hp, speed, actions). Rolls the chances to hit, then hp, then speed, the order monsters always have."""
+        rng = config.the_rng
+        actions = tuple(choices[rng.randrange(low, high) - low] for low, high, choices in self.table)
+        hp = rng.randrange(*self.hp)
+        speed = self.speed[0] + rng.randrange(*self.speed[1:])
+        return hp, speed, actions
 
 class Monster(superclasses.CombatCritter):
-    def __init__ (self, name: str, hp: int, attacks: dict[str, list], speed: float):
+    """A monster of the class's species, with its own rolled stats.
+    Monsters without a species can still pass in their hp, a dict of attacks and speed."""
+    species = None
+
+    def __init__ (self, name: str, hp: int = None, attacks: dict[str, list] = None, speed: float = None):
+        if attacks is None:
+            hp, speed, self.actions = self.species.roll()
+        else:
+            self.actions = compile_attacks(attacks, self)
         super().__init__(name, hp, speed)
-        self.attacks = attacks
+        if self.species != None:
+            self.type_name = self.species.type_name
         self.cur_move = 0
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "attacks" in state:
+            #saved before monsters had species: build the attacks it rolled
+            self.actions = compile_attacks(self.__dict__.pop("attacks"), self)
+
     def getAttacks(self):
-        attacks = []
-        for key in self.attacks.keys():
-            attack = superclasses.Attack(key, self.attacks[key][0], self.attacks[key][1], self.attacks[key][2], False)
-            attacks.append(superclasses.CombatAction(attack.name, attack, self))
-        return attacks
+        return list(self.actions)
 
     def pickAction(self):
-        attacks = self.getAttacks()
-        return random.choice(attacks)
+        return config.the_rng.choice(self.actions)
 
     def pickTargets(self, action, attacker, allies, enemies):
-        return [random.choice(enemies)]
+        return [config.the_rng.choice(enemies)]
+
+#7 to 19 hp, bite and punches, 65 to 85 speed (100 is "normal")
+DROWNED = Species("Drowned Pirate", (7,20), (75,-10,11), {
+    "bite": ["bites", (35,51), (5,15)],
+    "punch 1": ["punches", (35,51), (1,10)],
+    "punch 2": ["punches", (35,51), (1,10)],
+})
 
 class Drowned(Monster):
-    def __init__ (self, name):
-        attacks = {}
-        attacks["bite"] = ["bites",random.randrange(35,51), (5,15)]
-        attacks["punch 1"] = ["punches",random.randrange(35,51), (1,10)]
-        attacks["punch 2"] = ["punches",random.randrange(35,51), (1,10)]
-        #7 to 19 hp, bite attack, 65 to 85 speed (100 is "normal")
-        super().__init__(name, random.randrange(7,20), attacks, 75 + random.randrange(-10,11))
-        self.type_name = "Drowned Pirate"
+    species = DROWNED
@@ -1,7 +1,40 @@
 #Global variables to be shared across files.
 # config.py is the traditional name for such a file
-# Imports nothing to avoid circular imports
+# Imports nothing from the game but game.session (which imports nothing) to avoid circular imports
+#
+# config.the_player, config.the_display and config.the_rng belong to the game being played (see game/session.py):
+# they read and write the current session, so games on different threads or asyncio tasks don't share them.
+import sys
+import types
 
+import game.session as session
 
-the_player = None
-the_display = None
+class Config (types.ModuleType):
+
+    @property
+    def the_player (self):
+        return session.current().player
+
+    @the_player.setter
+    def the_player (self, player):
+        session.current().player = player
+
+    @property
+    def the_display (self):
+        return session.current().display
+
+    @the_display.setter
+    def the_display (self, display):
+        session.current().display = display
+
+    #Random number generator for the current game. The World replaces it with one made from the game's seed,
+    # so use config.the_rng instead of the random module to keep games reproducible.
+    @property
+    def the_rng (self):
+        return session.current().rng
+
+    @the_rng.setter
+    def the_rng (self, rng):
+        session.current().rng = rng
+
+sys.modules[__name__].__class__ = Config
@@ -1,10 +1,162 @@
+import copy
+import itertools
 import game.display as display
 
+class VersionedDict (dict):
+    '''A dict that counts its changes. Every change gives it a new version, so a table built from some of them
+    is still good as long as their versions haven't moved, whatever happens to other dicts.
+    Versions are taken from one shared counter rather than added to, so no two dicts (or two states of one)
+    ever have the same version, and games on different threads can't lose a change.'''
+    counter = itertools.count(1)
+    #a dict loaded from a save made before dicts had their own version gets one on its first change
+    version = 0
+
+    def __init__ (self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self.version = next(VersionedDict.counter)
+
+    def __setstate__ (self, state):
+        #a loaded dict is a new dict, even if it was saved with the version of one still around
+        self.version = next(VersionedDict.counter)
+
+    def __deepcopy__ (self, memo):
+        #much quicker than the generic reconstruction copy.deepcopy does for dict subclasses
+        new = VersionedDict()
+        memo[id(self)] = new
+        for k, v in self.items():
+            dict.__setitem__(new, k, copy.deepcopy(v, memo))
+        return new
+
+    def __setitem__ (self, key, value):
+        dict.__setitem__(self, key, value)
+        self.version = next(VersionedDict.counter)
+
+    def __delitem__ (self, key):
+        dict.__delitem__(self, key)
+        self.version = next(VersionedDict.counter)
+
+    def pop (self, *args):
+        self.version = next(VersionedDict.counter)
+        return dict.pop(self, *args)
+
+    def popitem (self):
+        self.version = next(VersionedDict.counter)
+        return dict.popitem(self)
+
+    def setdefault (self, key, default=None):
+        self.version = next(VersionedDict.counter)
+        return dict.setdefault(self, key, default)
+
+    def update (self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self.version = next(VersionedDict.counter)
+
+    def clear (self):
+        dict.clear(self)
+        self.version = next(VersionedDict.counter)
+
 class Context:
 
     def __init__ (self):
-        self.verbs = {}   # verb associated with a object
-        self.nouns = {}   # in game name of an object
+        self.verbs = VersionedDict()   # verb associated with a object
+        self.nouns = VersionedDict()   # in game name of an object
 
     def process_verb (self, verb, cmd_list, nouns):
         display.announce(f"{self.nouns} can't {verb}", pause=False)
+
+    def __getstate__ (self):
+        #the cached dispatch table (see dispatch_table) is rebuilt when needed, don't save or copy it
+        state = self.__dict__.copy()
+        state.pop("_dispatch", None)
+        return state
+
+class Dispatch:
+    '''The verbs and nouns of a stack of contexts merged into one table (later contexts win), plus a
+    prefix trie over the verbs so an unambiguous abbreviation ("inv", "sou") finds its verb.'''
+    #trie node marker for a prefix shared by more than one verb
+    AMBIGUOUS = object()
+    #verbs that end or replace the game: only the whole word does them, never an abbreviation
+    EXACT_ONLY = frozenset(["quit", "save", "load"])
+
+    def __init__ (self, contexts):
+        self.verbs = {}
+        self.nouns = {}
+        for c in contexts:
+            self.verbs.update(c.verbs)
+        for c in contexts:
+            self.nouns.update(c.nouns)
+        #built the first time an abbreviation is looked up
+        self.trie = None
+
+    #tries by verb list: the same few sets of verbs come up over and over (every seagull has the same ones)
+    tries = {}
+
+    def build_trie (self):
+        key = tuple(self.verbs)
+        self.trie = Dispatch.tries.get(key)
+        if self.trie != None:
+            return
+        #each node is [children by letter, the one verb below it (or AMBIGUOUS)]
+        self.trie = [{}, None]
+        for verb in self.verbs:
+            if verb in Dispatch.EXACT_ONLY:
+                continue
+            node = self.trie
+            for ch in verb:
+                node = node[0].setdefault(ch, [{}, verb])
+                if node[1] != verb:
+                    node[1] = Dispatch.AMBIGUOUS
+        if len(Dispatch.tries) >= 256:
+            Dispatch.tries.clear()
+        Dispatch.tries[key] = self.trie
+
+    def complete (self, word):
+        '''The verb word is an unambiguous abbreviation of, or None.'''
+        if self.trie == None:
+            self.build_trie()
+        node = self.trie
+        for ch in word:
+            node = node[0].get(ch)
+            if node == None:
+                return None
+        if node[1] is Dispatch.AMBIGUOUS:
+            return None
+        return node[1]
+
+    def resolve (self, cmd_list):
+        '''Finds what should handle a split command. Returns (context, verb, cmd_list to hand it) or None.
+        An exact verb wins, then a noun followed by a verb ("jim eat"), then a verb abbreviation.'''
+        word = cmd_list[0]
+        if word in self.verbs:
+            return self.verbs[word], word, cmd_list
+        if len(cmd_list) > 1 and word in self.nouns:
+            return self.nouns[word], cmd_list[1], cmd_list[1:]
+        verb = self.complete(word)
+        if verb != None:
+            return self.verbs[verb], verb, [verb] + cmd_list[1:]
+        return None
+
+def versions (contexts):
+    '''The versions of the contexts' verbs and nouns, in order, or None if any of them is a plain dict
+    (someone swapped one in: no way to tell if it changes).'''
+    key = []
+    for c in contexts:
+        if type(c.verbs) is not VersionedDict or type(c.nouns) is not VersionedDict:
+            return None
+        key.append(c.verbs.version)
+        key.append(c.nouns.version)
+    return tuple(key)
+
+def dispatch_table (contexts):
+    '''The Dispatch for a list of contexts, rebuilt only when their verbs or nouns have changed since.
+    Changes to other contexts' verbs and nouns don't matter. The table is kept on the last (most specific)
+    context, so it goes away with it.'''
+    owner = contexts[-1]
+    key = versions(contexts)
+    entry = owner.__dict__.get("_dispatch")
+    if entry != None and key != None and entry[0] == key:
+        return entry[1]
+    table = Dispatch(contexts)
+    if key != None:
+        owner._dispatch = (key, table)
+    return table
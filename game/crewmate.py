@@ -1,5 +1,4 @@
 
-import random
 import game.combat as combat
 import game.superclasses as superclasses
 import game.display as display
@@ -19,19 +18,18 @@ class CrewMate(Context, superclasses.CombatCritter):
     def __init__ (self):
         self.max_health = 100
         Context.__init__(self)
-        superclasses.CombatCritter.__init__(self, random.choice (CrewMate.possible_names), self.max_health, 100 + random.randrange(-20,21))
-        CrewMate.possible_names.remove (self.name)
+        superclasses.CombatCritter.__init__(self, CrewMate.pick_name(), self.max_health, 100 + config.the_rng.randrange(-20,21))
         self.death_cause = "" #track cause of death for the score log
         self.hurtToday = False
         self.cur_move = 0
         #dictionary of skill success rates (in percent). Currently only used in combat.
         self.skills = {}
-        self.skills["brawling"] = random.randrange(10,101)
-        self.skills["swords"] = random.randrange(10,101)
-        self.skills["melee"] = random.randrange(10,101)
-        self.skills["guns"] = random.randrange(10,101)
-        self.skills["cannons"] = random.randrange(10,101)
-        self.skills["swimming"] = random.randrange(10,101)
+        self.skills["brawling"] = config.the_rng.randrange(10,101)
+        self.skills["swords"] = config.the_rng.randrange(10,101)
+        self.skills["melee"] = config.the_rng.randrange(10,101)
+        self.skills["guns"] = config.the_rng.randrange(10,101)
+        self.skills["cannons"] = config.the_rng.randrange(10,101)
+        self.skills["swimming"] = config.the_rng.randrange(10,101)
 
         #list of equipped items. Currently only used in combat.
         self.items = []
@@ -56,6 +54,18 @@ class CrewMate(Context, superclasses.CombatCritter):
         #List of defendees
         self.defendees = []
 
+    @staticmethod
+    def pick_name ():
+        '''Picks a name no one else in the current crew has. Leaves possible_names alone so many games can run in one process.'''
+        taken = []
+        if config.the_player != None:
+            taken = [c.name for c in config.the_player.pirates]
+        free = [n for n in CrewMate.possible_names if n not in taken]
+        if len(free) == 0:
+            #Huge crews (simulations) run out of names
+            return f"{config.the_rng.choice (CrewMate.possible_names)} {len(taken) + 1}"
+        return config.the_rng.choice (free)
+
     def __str__ (self):
         '''to string. Lists name and death cause (for score log)'''
         return f"{self.name} {self.death_cause}"
@@ -72,7 +82,7 @@ class CrewMate(Context, superclasses.CombatCritter):
     def inflict_damage (self, num, deathcause, combat=False):
         '''Injures the pirate. If needed, it will record the pirate's cause of death'''
         if combat and len(self.defenders) > 0:
-            defender = random.choice (self.defenders)
+            defender = config.the_rng.choice (self.defenders)
             display.announce (f"{defender.name} blocks the attack!")
             return defender.inflict_damage ((num+1)//2, deathcause, False) #Combat should be false here to avoid possible infinite recursion.
         #else:
@@ -123,11 +133,11 @@ class CrewMate(Context, superclasses.CombatCritter):
             #Note: more serious wounds take MUCH longer to heal
             # Try to limit the damage you take in combat!
             if self.health >= 75:
-                self.health += random.randint(1,10)
+                self.health += config.the_rng.randint(1,10)
             elif self.health >= 50:
-                self.health += random.randint(1,6)
+                self.health += config.the_rng.randint(1,6)
             elif self.health >= 25:
-                self.health += random.randint(1,4)
+                self.health += config.the_rng.randint(1,4)
             else:
                 self.health += 1
             #Cap at 100
@@ -142,12 +152,14 @@ class CrewMate(Context, superclasses.CombatCritter):
     def end_day (self):
         '''End of day activities (days only occur while sailing on the ship)'''
         if (self.sick):
-            if (self.isLucky() == True or random.randint(1,10) == 1):
+            if (self.isLucky() == True or config.the_rng.randint(1,10) == 1):
                 self.sick = False
         self.lucky = False
 
     def print (self):
         '''Prints status to terminal'''
+        if not display.rendering():
+            return
         outstring = f"   {self.name} Health: {self.health}"
         if (self.sick):
             outstring = outstring + " --Sick"
@@ -171,14 +183,11 @@ class CrewMate(Context, superclasses.CombatCritter):
         #The pirate equips an item (based on the name of the item)
         if (verb == "equip"):
             if len(cmd_list) > 1:
-                i = 0
-                while i < len(config.the_player.inventory):
-                    if config.the_player.inventory[i].name == cmd_list[1]:
-                        found = config.the_player.inventory.pop(i)
-                        self.items.append(found)
-                        self.items.sort()
-                        break
-                    i += 1
+                found = config.the_player.inventory.take(cmd_list[1])
+                if found != None:
+                    self.items.append(found)
+                    self.items.sort()
+                    self.forget_attacks()
             else:
                 display.announce ("Equip what?")
 
@@ -189,8 +198,8 @@ class CrewMate(Context, superclasses.CombatCritter):
                 while i < len(self.items):
                     if self.items[i].name == cmd_list[1]:
                         found = self.items.pop(i)
-                        config.the_player.inventory.append(found)
-                        config.the_player.inventory.sort()
+                        config.the_player.inventory.add(found)
+                        self.forget_attacks()
                         break
                     i += 1
             else:
@@ -212,9 +221,10 @@ class CrewMate(Context, superclasses.CombatCritter):
             display.announce(f"{self.name} doesn't know how to {verb}", pause=False)
 
     def print_inventory (self):
-        for i in self.items:
-            display.announce (i, pause=False)
-        display.announce ("", pause=False)
+        with display.frame():
+            for i in self.items:
+                display.announce (i, pause=False)
+            display.announce ("", pause=False)
 
     def restock(self):
         '''pirate restocks their black powder from the ship's reserves'''
@@ -239,20 +249,36 @@ class CrewMate(Context, superclasses.CombatCritter):
         '''pirate reloads their firearms (flintlock pistols are too time consuming to load in combat)'''
         for i in self.items:
             i.recharge(self)
+        self.forget_attacks()
+
+    def forget_attacks(self):
+        '''Drops the cached attack list. Anything that changes what a pirate can attack with (their items,
+        an item's charges, their skills) calls this; replacing self.items outright is noticed on its own.'''
+        self.__dict__.pop("_attacks", None)
 
     def getAttacks(self):
-        '''gets the list of possible attacks for this pirate'''
+        '''gets the list of possible attacks for this pirate (don't change it, it's cached until forget_attacks)'''
         for d in self.defendees:
             d.removeDefender(self)
         self.defendees = []
-        options = []
+        entry = self.__dict__.get("_attacks")
+        if entry != None and entry[0] is self.items:
+            return entry[1]
+        #one option per distinct attack (the fields Attack.__eq__ compares), the first item offering it wins
+        options = {}
         for i in self.items:
-            attackList = i.getAttacks(self)
-            if len(attackList) > 0:
-                for putative_attk in attackList:
-                    if putative_attk not in options:
-                        options.append(putative_attk)
+            for putative_attk in i.getAttacks(self):
+                a = putative_attk.action
+                options.setdefault((a.name, a.description, a.success, a.damage_range), putative_attk)
+        options = list(options.values())
         if "brawling" in self.skills.keys():
             options.append(superclasses.CombatAction("punch",superclasses.Attack("punch", "punches", self.skills["brawling"], (1,11), False), self))
         options.append(superclasses.CombatAction("defend",superclasses.Defend("defend", "defends"), self))
+        self._attacks = (self.items, options)
         return options
+
+    def __getstate__ (self):
+        #the attack list is rebuilt when needed, don't save or copy it
+        state = Context.__getstate__(self)
+        state.pop("_attacks", None)
+        return state
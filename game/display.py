@@ -1,15 +1,98 @@
 #import pygame
+import sys
+import contextlib
 import game.config as config
+import game.instrument as instrument
 
 WINDOW_HEIGHT = 500
 WINDOW_WIDTH = 1000
 
+class ScriptExhausted (Exception):
+    '''Raised when a scripted input source has no commands left to give.'''
+    pass
+
+class KeyboardInput ():
+    '''Reads commands typed by a human at the terminal. This is the default input source.'''
+    #A human needs time to read announcements, so pause=True announcements wait for enter
+    pauses = True
+    #A human sees what they typed, so it isn't echoed back
+    typed = True
+
+    def read(self, prompt, shown=False):
+        '''shown means the prompt has been written out already, so input() mustn't print it again.'''
+        if shown:
+            return input()
+        return input(prompt)
+
+    def choose(self, options):
+        #None means "show the lettered menu and read the answer"
+        return None
+
+class ScriptedInput ():
+    '''Feeds a fixed list of commands to the game, one per prompt. Pauses do not use up commands.'''
+    pauses = False
+    typed = False
+
+    def __init__(self, commands):
+        self.commands = list(commands)
+        self.next = 0
+
+    def read(self, prompt):
+        if self.next >= len(self.commands):
+            raise ScriptExhausted(prompt)
+        cmd = self.commands[self.next]
+        self.next += 1
+        return cmd
+
+    def choose(self, options):
+        return None
+
+class FileInput (ScriptedInput):
+    '''Reads the commands for a ScriptedInput from a text file, one command per line.'''
+    def __init__(self, path):
+        with open(path) as f:
+            super().__init__([line.rstrip("\n") for line in f])
+
+class CallbackInput ():
+    '''Asks a function for each command. Handy for bots: read(prompt) returns the next command.
+    If a choose function is given it is asked to pick menu options directly (returning an index).'''
+    pauses = False
+    typed = False
+
+    def __init__(self, read, choose=None):
+        self.read = read
+        self.chooser = choose
+
+    def choose(self, options):
+        if self.chooser is None:
+            return None
+        return self.chooser(options)
+
+def terminal_sink(text):
+    '''Default output sink: write straight to the terminal.'''
+    sys.stdout.write(text)
+
+def null_sink(text):
+    '''Output sink that throws everything away (headless runs).'''
+    pass
+
 class Display ():
-    def __init__(self):
+    def __init__(self, source=None, sink=None):
         # pygame.init()
         # surface = pygame.display.set_mode(size=(WINDOW_WIDTH,WINDOW_HEIGHT))
         config.the_display = self
         self.updater = []
+        #Where commands come from and where text goes. Defaults to the keyboard and the terminal.
+        if source is None:
+            source = KeyboardInput()
+        if sink is None:
+            sink = terminal_sink
+        self.source = source
+        self.sink = sink
+        #Text held back while a frame is being drawn (see frame())
+        self.frames = 0
+        self.buffer = []
+
     def push_updater(self, updater):
         self.updater.append(updater)
 
@@ -20,26 +103,112 @@ class Display ():
 
     def do_updater(self):
         #Do the top updater
-        self.updater[-1]()
+        updater = self.updater[-1]
+        with instrument.span("updater", updater):
+            updater()
 
     def begin_loop(self):
         while (config.the_player.notdone() and len(self.updater)):
             self.do_updater()
 
+    def write(self, text):
+        if self.frames:
+            self.buffer.append(text)
+        else:
+            self.sink(text)
+
+    def flush(self):
+        '''Sends anything held back by a frame to the sink, in one write.'''
+        if len(self.buffer):
+            text = "".join(self.buffer)
+            self.buffer = []
+            self.sink(text)
+
+    @contextlib.contextmanager
+    def frame(self):
+        '''Holds back everything written inside the with block and sends it as one write at the end,
+        instead of one write per line. Frames can nest; the outermost one writes.
+        Anything that waits for input shows what's been drawn so far first.'''
+        self.frames += 1
+        try:
+            yield self
+        finally:
+            self.frames -= 1
+            if self.frames == 0:
+                self.flush()
+
+    def rendering(self):
+        '''False when output goes nowhere, so maps and status screens needn't be drawn at all.'''
+        return self.sink is not null_sink
+
+    def read(self, prompt):
+        self.flush()
+        if isinstance(self.source, KeyboardInput) and self.sink is terminal_sink:
+            #input() echoes the prompt and the typed line itself
+            return self.source.read(prompt)
+        self.sink(prompt)
+        if isinstance(self.source, KeyboardInput):
+            #the sink (a log, say) had the prompt
+            return self.source.read(prompt, shown=True)
+        line = self.source.read(prompt)
+        #echo scripted commands so transcripts read like a played game
+        if not self.source.typed:
+            self.sink(line + "\n")
+        return line
+
+    def announce(self, announcement, end='\n', pause = True):
+        if pause and self.source.pauses:
+            self.read(str(announcement))
+        elif pause:
+            self.write(str(announcement) + "\n")
+        else:
+            self.write(str(announcement) + end)
+
+    def menu(self, options):
+        chosen = self.source.choose(options)
+        if chosen is not None:
+            return chosen
+        chosen = -1
+        while chosen < 0 or chosen >= len(options):
+            menuletters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+            for i in range(len(options)):
+                if i >= len(menuletters):
+                    self.write("too many options :(\n")
+                    break
+                self.write(menuletters[i] + " - " + str(options[i]) + "\n")
+            #Bad :(
+            o = self.read("Choose: ")
+            chosen = menuletters.find(o)
+        return chosen
+
 
 def announce(announcement, end='\n', pause = True):
-    #if(the_display != None):
-    #   display stuff
-    #else:
-    if(pause):
+    d = config.the_display
+    if(d != None):
+        d.announce(announcement, end, pause)
+    elif(pause):
         input (announcement)
     else:
         print (announcement, end=end)
 
+def frame():
+    '''with display.frame(): ... sends everything announced in the block as one write (see Display.frame).'''
+    d = config.the_display
+    if(d != None):
+        return d.frame()
+    return contextlib.nullcontext()
+
+def rendering():
+    '''False when output is being thrown away, so there's no point drawing maps and status screens.'''
+    d = config.the_display
+    if(d != None):
+        return d.rendering()
+    return True
+
 def menu(options):
-    #if(the_display != None):
-    #   display stuff
-    #else:
+    d = config.the_display
+    if(d != None):
+        return d.menu(options)
     chosen = -1
     while chosen < 0 or chosen >= len(options):
         menuletters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
@@ -54,4 +223,7 @@ def menu(options):
     return chosen
 
 def get_text_input(prompt):
+    d = config.the_display
+    if(d != None):
+        return d.read(prompt)
     return input(prompt)
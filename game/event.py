@@ -1,3 +1,4 @@
+import copy
 
 # define the interface to events
 
@@ -8,3 +9,109 @@ class Event:
 
     def process (self, world):
         return {}
+
+    def pool_key (self):
+        '''Events with the same pool key are interchangeable, so an EventPool keeps one of them and a count.
+        Events whose state changes what they do (like how many seagulls there are) should include it here.'''
+        return type(self)
+
+    def fresh (self):
+        '''Another event just like this one, for an EventPool handing out one of several queued.
+        A shallow copy, which is enough for events whose state is plain values. Events holding anything
+        they change in place, or that point at themselves (like Seagull's verbs), make a new one instead.'''
+        return copy.copy(self)
+
+class EventPool:
+    '''The events that may happen somewhere, drawn at random, with every queued event equally likely.
+    Instead of holding every queued instance it holds one of each kind (see Event.pool_key) and how many
+    are queued, with a Fenwick tree over the counts so a draw costs O(log n) in the number of kinds.
+    Events that keep queueing more of themselves (sickness, seagulls) only grow a count.
+
+    Works like the old list for adding and looking: append, extend, len and iterating (one of each kind).'''
+
+    def __init__ (self, events = ()):
+        self.slots = {}     # pool key -> slot
+        self.reps = []      # slot -> the event kept for that kind
+        self.counts = []    # slot -> how many are queued
+        self.tree = [0]     # Fenwick tree over counts (1-based)
+        self.free = []      # slots whose kind ran out, to be reused
+        self.total = 0
+        self.extend (events)
+
+    def __len__ (self):
+        return self.total
+
+    def __iter__ (self):
+        for rep, count in zip(self.reps, self.counts):
+            if count > 0:
+                yield rep
+
+    def count (self, e):
+        '''How many events like e are queued.'''
+        slot = self.slots.get(e.pool_key())
+        if slot is None:
+            return 0
+        return self.counts[slot]
+
+    def append (self, e):
+        key = e.pool_key()
+        slot = self.slots.get(key)
+        if slot is None:
+            if len(self.free):
+                slot = self.free.pop()
+                self.reps[slot] = e
+            else:
+                slot = len(self.reps)
+                self.reps.append(e)
+                self.counts.append(0)
+                self.grow()
+            self.slots[key] = slot
+        self.counts[slot] += 1
+        self.update(slot, 1)
+        self.total += 1
+
+    def extend (self, events):
+        for e in events:
+            self.append(e)
+
+    def draw (self, rng):
+        '''Takes one queued event out, each equally likely. The caller puts back whatever the event
+        returns in its newevents.'''
+        slot = self.find(rng.randrange(self.total))
+        self.counts[slot] -= 1
+        self.update(slot, -1)
+        self.total -= 1
+        e = self.reps[slot]
+        if self.counts[slot] == 0:
+            #last of its kind: hand out the kept one
+            del self.slots[e.pool_key()]
+            self.reps[slot] = None
+            self.free.append(slot)
+            return e
+        #more of the kind are queued, so keep the original and hand out another that may change freely
+        return e.fresh()
+
+    def grow (self):
+        '''Adds a Fenwick node for a new (empty) slot.'''
+        i = len(self.tree)
+        low = i - (i & -i)
+        #node i covers counts[low:i], all already in the tree except the new (zero) one
+        self.tree.append(sum(self.counts[low:i-1]))
+
+    def update (self, slot, delta):
+        i = slot + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def find (self, r):
+        '''The slot holding the r-th queued event (counting from 0).'''
+        pos = 0
+        step = 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(self.tree) and self.tree[nxt] <= r:
+                pos = nxt
+                r -= self.tree[nxt]
+            step >>= 1
+        return pos
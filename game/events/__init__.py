@@ -1,6 +1,13 @@
+'''
+The events in the game. Each one is registered here by name with where its class lives; its module isn't
+imported until the event is drawn (see game/registry.py). world=n puts n of the event in the world's
+daily event pool.
+'''
 
-__all__ = ["drowned_pirates",
-"lucky",
-"nothing",
-"sickness",
-"seagull"]
+from game import registry
+
+registry.events.register("lucky", "game.events.lucky:LuckyDay", world=1)
+registry.events.register("nothing", "game.events.nothing:Nothing", world=1)
+registry.events.register("seagull", "game.events.seagull:Seagull", world=3)
+registry.events.register("sickness", "game.events.sickness:Sickness", world=1)
+registry.events.register("drowned_pirates", "game.events.drowned_pirates:DrownedPirates", world=1)
@@ -1,5 +1,5 @@
 import game.event as event
-import random
+import game.config as config
 import game.combat as combat
 import game.superclasses as superclasses
 import game.display as display
@@ -20,14 +20,14 @@ class DrownedPirates (event.Event):
         monsters = []
         min = 2
         uplim = 6
-        if random.randrange(2) == 0:
+        if config.the_rng.randrange(2) == 0:
             min = 1
             uplim = 5
             monsters.append(combat.Drowned("Pirate captain"))
             self.type_name = "Drowned Pirate Captain"
             monsters[0].speed = 1.2*monsters[0].speed
             monsters[0].health = 2*monsters[0].health
-        n_appearing = random.randrange(min, uplim)
+        n_appearing = config.the_rng.randrange(min, uplim)
         n = 1
         while n <= n_appearing:
             monsters.append(combat.Drowned("Drowned pirate "+str(n)))
@@ -1,6 +1,5 @@
 
 from game import event
-import random
 import game.config as config
 
 #Example benificial status event. Examine crewmate.lucky and handling.
@@ -12,7 +11,7 @@ class LuckyDay (event.Event):
     def process (self, world):
         # choose a lucky crew member
 
-        c = random.choice(config.the_player.get_pirates())
+        c = config.the_rng.choice(config.the_player.get_pirates())
         msg = f"{c.get_name()} is having a lucky day"
         c.lucky = True
         result = {}
@@ -3,7 +3,6 @@ from game.player import Player
 from game.context import Context
 import game.config as config
 import game.display as display
-import random
 
 #Example non-combat event
 class Seagull (Context, event.Event):
@@ -18,16 +17,22 @@ class Seagull (Context, event.Event):
         self.result = {}
         self.go = False
 
+    def fresh (self):
+        #a copy's verbs would still point at this seagull
+        s = Seagull()
+        s.seagulls = self.seagulls
+        return s
+
     def process_verb (self, verb, cmd_list, nouns):
         if (verb == "chase"):
             self.go = True
-            r = random.randint(1,10)
+            r = config.the_rng.randint(1,10)
             if (r < 5):
                 self.result["message"] = "the seagulls fly off."
                 if (self.seagulls > 1):
                     self.seagulls = self.seagulls - 1
             else:
-                c = random.choice(config.the_player.get_pirates())
+                c = config.the_rng.choice(config.the_player.get_pirates())
                 if (c.isLucky() == True):
                     self.result["message"] = "luckly, the seagulls fly off."
                 else:
@@ -40,7 +45,7 @@ class Seagull (Context, event.Event):
                 if(self.seagulls//10 > 0): #if there's more than 10 seagulls, this definitely costs at least 1 food
                     config.the_player.ship.take_food ((self.seagulls//10))
                 if(self.seagulls%10 > 0): #if there's a remainder, there's a chance of losing a(n additional) food
-                    if(random.randint(1,10) < (self.seagulls%10)):
+                    if(config.the_rng.randint(1,10) < (self.seagulls%10)):
                         config.the_player.ship.take_food (1)
                 self.seagulls = self.seagulls + 1
                 self.result["newevents"].append (Seagull())
@@ -58,6 +63,10 @@ class Seagull (Context, event.Event):
 
 
 
+    def pool_key (self):
+        #More seagulls peck harder and eat more, so they aren't interchangeable with fewer
+        return (type(self), self.seagulls)
+
     def process (self, world):
 
         self.go = False
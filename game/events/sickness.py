@@ -1,6 +1,5 @@
 
 from game import event
-import random
 import game.config as config
 
 #Example status-ailment event. Examine crewmate.sick and handling (crewmate.set_sickness() etc)
@@ -10,7 +9,7 @@ class Sickness(event.Event):
         self.name = " a random crew member gets sick "
 
     def process (self, world):
-        c = random.choice(config.the_player.get_pirates())
+        c = config.the_rng.choice(config.the_player.get_pirates())
         result = {}
         if (c.sick == True):
             c.set_sickness (True)
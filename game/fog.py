@@ -0,0 +1,83 @@
+class Fog:
+    '''Which cells of the map the player has seen. Each map row is one Python int used as a bitset
+    (bit x set means (x, y) has been seen), and rows nobody has seen any of aren't stored at all.
+    The map wraps around like World.get_loc, so sight does too.
+
+    fog.seen(x, y) and fog[x][y] both tell whether (x, y) has been seen.'''
+
+    def __init__ (self, size):
+        self.size = size
+        self.rows = {}
+        #cells seen so far
+        self.count = 0
+
+    def span (self, x, r):
+        '''Bit mask of the columns within r of x, wrapping around the edge of the map.'''
+        width = 2*r + 1
+        if width >= self.size:
+            return (1 << self.size) - 1
+        start = (x - r) % self.size
+        end = start + width
+        if end <= self.size:
+            return ((1 << width) - 1) << start
+        #runs off the right edge: the rest starts again at column 0
+        return (((1 << (self.size - start)) - 1) << start) | ((1 << (end - self.size)) - 1)
+
+    def window_rows (self, y, r):
+        '''The rows within r of y, wrapped, each once.'''
+        if 2*r + 1 >= self.size:
+            return range(self.size)
+        return [(y + dy) % self.size for dy in range(-r, r+1)]
+
+    def reveal (self, x, y, r):
+        '''Marks every cell within r of (x, y) (a square, like the ship's lookout sees) as seen.'''
+        mask = self.span(x, r)
+        for row in self.window_rows(y, r):
+            old = self.rows.get(row, 0)
+            new = old | mask
+            if new != old:
+                self.count += (new ^ old).bit_count()
+                self.rows[row] = new
+
+    def seen (self, x, y):
+        return (self.rows.get(y % self.size, 0) >> (x % self.size)) & 1 == 1
+
+    def fraction_explored (self):
+        return self.count / (self.size * self.size)
+
+    def unexplored_within (self, x, y, r):
+        '''How many cells within r of (x, y) haven't been seen yet.'''
+        mask = self.span(x, r)
+        cells = mask.bit_count()
+        hidden = 0
+        for row in self.window_rows(y, r):
+            hidden += cells - (self.rows.get(row, 0) & mask).bit_count()
+        return hidden
+
+    def nearest_hidden (self, x, y, skip=0):
+        '''The signed column step (wrapping) from x to the nearest cell of row y that hasn't been seen,
+        or None if the whole row has. Columns whose bit is set in skip don't count.'''
+        full = (1 << self.size) - 1
+        hidden = ~(self.rows.get(y % self.size, 0) | skip) & full
+        if hidden == 0:
+            return None
+        #turn the row so column x is bit 0: the lowest bit set is the nearest going east, the highest going west
+        x = x % self.size
+        turned = ((hidden >> x) | (hidden << (self.size - x))) & full
+        east = (turned & -turned).bit_length() - 1
+        west = self.size - (turned.bit_length() - 1)
+        if east <= west:
+            return east
+        return -west
+
+    def __getitem__ (self, x):
+        return FogColumn(self, x)
+
+class FogColumn:
+    '''fog[x] — lets old code keep writing seen[x][y].'''
+    def __init__ (self, fog, x):
+        self.fog = fog
+        self.x = x
+
+    def __getitem__ (self, y):
+        return self.fog.seen(self.x, y)
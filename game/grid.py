@@ -0,0 +1,71 @@
+import weakref
+import game.location as location
+
+class Grid:
+    '''The world map, stored sparsely. Only real locations (ports, islands, whirlpools...) are kept;
+    a plain ocean cell is made when something asks for it and is shared for as long as anything
+    (like the ship) holds on to it. A huge map of open ocean costs next to nothing.
+
+    grid.get(x, y) and grid[x][y] both return the Location at (x, y).'''
+
+    def __init__(self, size, world):
+        self.size = size
+        self.world = world
+        #(x, y) -> Location, for everything that isn't plain ocean
+        self.places = {}
+        #y -> {x: Location}, the same places by map row (for drawing maps)
+        self.rows = {}
+        self.ocean = weakref.WeakValueDictionary()
+
+    def get(self, x, y):
+        loc = self.places.get((x, y))
+        if loc is None:
+            loc = self.ocean.get((x, y))
+            if loc is None:
+                loc = location.Location(x, y, self.world)
+                self.ocean[(x, y)] = loc
+        return loc
+
+    def set(self, x, y, loc):
+        self.places[(x, y)] = loc
+        self.rows.setdefault(y, {})[x] = loc
+        self.ocean.pop((x, y), None)
+
+    def is_ocean(self, x, y):
+        return (x, y) not in self.places
+
+    def symbol(self, x, y):
+        loc = self.places.get((x, y))
+        if loc is None:
+            return ' '
+        return loc.get_symbol()
+
+    def row(self, y):
+        '''The non-ocean locations in map row y, as {x: Location}.'''
+        return self.rows.get(y, {})
+
+    def __getitem__(self, x):
+        return Column(self, x)
+
+    def __getstate__(self):
+        #Weak references can't be pickled. Save the ocean cells still in use (like the ship's) as a plain dict,
+        # so they come back as the same objects that refer to them.
+        state = self.__dict__.copy()
+        state["ocean"] = dict(self.ocean)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.ocean = weakref.WeakValueDictionary(state["ocean"])
+
+class Column:
+    '''grid[x] — lets old code keep writing world.locs[x][y].'''
+    def __init__(self, grid, x):
+        self.grid = grid
+        self.x = x
+
+    def __getitem__(self, y):
+        return self.grid.get(self.x, y)
+
+    def __setitem__(self, y, loc):
+        self.grid.world.set_loc(self.x, y, loc)
@@ -0,0 +1,138 @@
+'''
+Runs whole games without a human at the keyboard.
+
+A game normally reads the keyboard and writes to the terminal (see rungame.py). Here the same
+game loop is driven by a pluggable input source (a list of commands, a file, or a callback such as
+a bot) and its output goes to any sink, including display.null_sink, so one process can play
+many games back to back for balance testing and regression checks.
+
+    python -m game.headless --bot --games 1000
+    python -m game.headless --script moves.txt --show
+    python -m game.headless --bot --games 100 --trace trace.json    # and time where it goes
+    python -m game.headless --bot --games 1000 --threads 8          # several games at once (see game/session.py)
+'''
+
+import argparse
+import contextlib
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import game.ship as ship
+import game.world as world
+import game.player as player
+import game.config as config
+import game.display as display
+import game.instrument as instrument
+import game.session as session
+import game.scores as scores
+
+def sea_state_update():
+    '''The top level updater, same as rungame.py: one day at sea.'''
+    config.the_player.get_world().start_day ()
+    config.the_player.process_day()
+    config.the_player.get_world().end_day ()
+
+def new_game(source=None, sink=None, seed=None):
+    '''Sets up a fresh ship, world, player and display, the same way rungame.py does. Returns the player.
+    Games made with the same seed (and fed the same commands) play out exactly the same.'''
+    ship_v     = ship.Ship()
+    world_v    = world.World (ship_v, seed)
+    start_loc  = world_v.get_startloc()
+    ship_v.set_loc (start_loc)
+
+    p = player.Player(world_v, ship_v)
+    d = display.Display(source, sink)
+    d.push_updater(sea_state_update)
+    return p
+
+def play(source, sink=display.null_sink, record_score=False, seed=None, save_path=None):
+    '''Plays one full game with commands from source. Returns the player so the caller can inspect the outcome.
+    The game ends when the player wins or dies, quits, or the source runs out of commands.
+    The save and load commands use save_path if it's given, instead of the default save file.'''
+    p = new_game(source, sink, seed)
+    if not record_score:
+        p.score_log = None
+    if save_path is not None:
+        p.save_path = save_path
+    try:
+        config.the_display.begin_loop()
+    except display.ScriptExhausted:
+        pass
+    except SystemExit:
+        #game_over and the quit command exit the interpreter in a normal game
+        pass
+    return p
+
+class RandomSailor ():
+    '''A very simple bot: sails in a random direction every day and gives any prompt a plausible answer.
+    Never goes ashore, so games end at home port, in the whirlpool or by starvation.'''
+    commands = ["go north", "go south", "go east", "go west", "explore", "flee", "feed", "chase"]
+
+    def __init__(self, rng=None):
+        if rng is None:
+            rng = random.Random()
+        self.rng = rng
+
+    def read(self, prompt):
+        return self.rng.choice(RandomSailor.commands)
+
+    def choose(self, options):
+        return self.rng.randrange(len(options))
+
+    def source(self):
+        return display.CallbackInput(self.read, self.choose)
+
+def play_session(source, sink=display.null_sink, record_score=False, seed=None, save_path=None):
+    '''play() in a session of its own, so it can run alongside other games on other threads.'''
+    with session.use():
+        return play(source, sink, record_score, seed, save_path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Play pirate games without a human at the keyboard.")
+    parser.add_argument("--script", help="file with one command per line")
+    parser.add_argument("--bot", action="store_true", help="let a random bot play")
+    parser.add_argument("--games", type=int, default=1, help="number of games to play")
+    parser.add_argument("--show", action="store_true", help="print game output instead of discarding it")
+    parser.add_argument("--seed", type=int, help="seed for the first game; game n uses seed + n")
+    parser.add_argument("--scores", action="store_true", help="record finished games in the score database")
+    parser.add_argument("--threads", type=int, default=1, help="games to play at once, each in its own session")
+    parser.add_argument("--trace", help="record timings, save them as a Chrome trace here and print a summary")
+    args = parser.parse_args()
+    if args.script is None and not args.bot:
+        parser.error("give --script or --bot")
+
+    sink = display.terminal_sink if args.show else display.null_sink
+    days = 0
+    won = 0
+    if args.trace:
+        instrument.start()
+    def one_game(g):
+        seed = None
+        if args.seed is not None:
+            seed = args.seed + g
+        if args.bot:
+            source = RandomSailor(random.Random(seed)).source()
+        else:
+            source = display.FileInput(args.script)
+        return play_session(source, sink, args.scores, seed)
+
+    start = time.perf_counter()
+    #all the games' scores go into the database in one transaction
+    with scores.open_store().batch() if args.scores else contextlib.nullcontext():
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            players = list(pool.map(one_game, range(args.games)))
+    for p in players:
+        days += p.get_world().get_day()
+        if len(p.pirates) > 0 and p.ship.get_loc().name == "destination":
+            won += 1
+    elapsed = time.perf_counter() - start
+    print(f"{args.games} games in {elapsed:.2f}s ({args.games/elapsed:.1f} games/s)")
+    print(f"reached home: {won}, average days: {days/args.games:.1f}")
+    if args.trace:
+        recorder = instrument.stop()
+        recorder.save_trace(args.trace)
+        print(recorder.summary())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+'''
+Timing where a game spends its time.
+
+When recording is on, the game notes a span (what ran, when it started and how long it took) for every
+updater call in the display loop, every event processed, every combat and every location's start_day
+and end_day. The spans can be saved as a Chrome trace (open it in chrome://tracing or ui.perfetto.dev)
+or summed up into a table per span.
+
+    instrument.start()
+    ... play ...
+    recorder = instrument.stop()
+    recorder.save_trace("trace.json")
+    print(recorder.summary())
+
+or from the command line: python -m game.headless --bot --games 100 --trace trace.json
+
+When recording is off, span() hands back one shared do-nothing context manager, so the game pays
+a function call and a with block per span and nothing else.
+'''
+
+import json
+import threading
+import time
+
+class Recorder:
+    '''The spans recorded since start(), as (category, name, start, duration, thread) with times in seconds.'''
+
+    def __init__(self):
+        self.spans = []
+        self.origin = time.perf_counter()
+
+    def add(self, category, name, start, duration):
+        self.spans.append((category, name, start, duration, threading.get_ident()))
+
+    def trace(self):
+        '''The spans in Chrome's trace event format (times in microseconds from start()).'''
+        threads = {}
+        events = []
+        for category, name, start, duration, thread in self.spans:
+            tid = threads.setdefault(thread, len(threads) + 1)
+            events.append({"name": name, "cat": category, "ph": "X", "pid": 1, "tid": tid,
+                           "ts": (start - self.origin) * 1e6, "dur": duration * 1e6})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
+
+    def totals(self):
+        '''(category, name) -> [count, total seconds, longest seconds]'''
+        totals = {}
+        for category, name, start, duration, thread in self.spans:
+            t = totals.get((category, name))
+            if t is None:
+                totals[(category, name)] = [1, duration, duration]
+            else:
+                t[0] += 1
+                t[1] += duration
+                t[2] = max(t[2], duration)
+        return totals
+
+    def summary(self):
+        '''A table of the spans by total time, most first. Spans nest (an event inside a day), so
+        the totals of different rows overlap.'''
+        rows = sorted(self.totals().items(), key=lambda kv: -kv[1][1])
+        lines = [f"{'category':<10} {'span':<32} {'count':>8} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        for (category, name), (count, total, longest) in rows:
+            lines.append(f"{category:<10} {name[:32]:<32} {count:>8} {total*1000:>10.2f} {total*1000/count:>9.3f} {longest*1000:>9.3f}")
+        return "\n".join(lines)
+
+class Span:
+    def __init__(self, recorder, category, what):
+        self.recorder = recorder
+        self.category = category
+        self.what = what
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.recorder.add(self.category, label(self.what), self.start, time.perf_counter() - self.start)
+        return False
+
+class NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_null = NullSpan()
+#The recorder in use, None when recording is off
+_recorder = None
+
+def label(what):
+    '''A span's name: strings as they are, methods as Class.method (the class of the object they're
+    called on), functions by name, objects with a span_label by that and anything else by its class.'''
+    if isinstance(what, str):
+        return what
+    owner = getattr(what, "__self__", None)
+    if owner is not None:
+        return f"{label(owner)}.{what.__name__}"
+    name = getattr(what, "__qualname__", None)
+    if name is None:
+        name = getattr(what, "span_label", None)
+    if name is None:
+        name = type(what).__name__
+    return name
+
+def span(category, what):
+    '''with instrument.span("event", e): times the block as a span named after what (see label).'''
+    if _recorder is None:
+        return _null
+    return Span(_recorder, category, what)
+
+def start():
+    '''Starts recording into a new Recorder and returns it.'''
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+def stop():
+    '''Stops recording and returns what was recorded.'''
+    global _recorder
+    recorder = _recorder
+    _recorder = None
+    return recorder
+
+def recording():
+    return _recorder is not None
@@ -0,0 +1,86 @@
+import bisect
+from collections import deque
+
+class Inventory:
+    '''The ship's hold: items grouped by name, with the names kept in sorted order.
+
+    It iterates like the sorted list it replaces (by name, and items with the same name in the order
+    they were added), but adding an item, taking one out by name or finding one is a dict lookup plus,
+    for a name that's new, a binary search of the distinct names. Picking up the thousandth cutlass
+    doesn't sort the other 999.'''
+
+    def __init__(self, items = ()):
+        self.by_name = {}   # name -> deque of items, oldest first
+        self.names = []     # the names in by_name, sorted
+        self.total = 0
+        self.extend(items)
+
+    def add(self, item):
+        held = self.by_name.get(item.name)
+        if held is None:
+            held = deque()
+            self.by_name[item.name] = held
+            bisect.insort(self.names, item.name)
+        held.append(item)
+        self.total += 1
+
+    #list-like names, for code written against the old list
+    append = add
+
+    def extend(self, items):
+        for item in items:
+            self.add(item)
+
+    def find(self, name):
+        '''The first item called name, or None. It stays in the inventory.'''
+        held = self.by_name.get(name)
+        if held is None:
+            return None
+        return held[0]
+
+    def take(self, name):
+        '''Removes and returns the first item called name, or None if there isn't one.'''
+        held = self.by_name.get(name)
+        if held is None:
+            return None
+        item = held.popleft()
+        if len(held) == 0:
+            self.forget(name)
+        self.total -= 1
+        return item
+
+    def remove(self, item):
+        '''Removes this item (not just one with its name). ValueError if it isn't here.'''
+        held = self.by_name.get(item.name)
+        if held is None:
+            raise ValueError(f"{item.name} is not in the inventory")
+        for i, other in enumerate(held):
+            if other is item:
+                del held[i]
+                break
+        else:
+            raise ValueError(f"{item.name} is not in the inventory")
+        if len(held) == 0:
+            self.forget(item.name)
+        self.total -= 1
+
+    def forget(self, name):
+        del self.by_name[name]
+        del self.names[bisect.bisect_left(self.names, name)]
+
+    def named(self, name):
+        '''The items called name, oldest first.'''
+        return list(self.by_name.get(name, ()))
+
+    def count(self, name):
+        return len(self.by_name.get(name, ()))
+
+    def __contains__(self, item):
+        return any(other is item for other in self.by_name.get(item.name, ()))
+
+    def __len__(self):
+        return self.total
+
+    def __iter__(self):
+        for name in self.names:
+            yield from self.by_name[name]
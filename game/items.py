@@ -1,22 +1,69 @@
 from game.display import menu
 import game.combat as combat
 import game.context as context
+import game.display as display
 import game.superclasses as superclasses
-import random
+import types
 
-class Item(superclasses.ActionResolver, context.Context):
-    def __init__(self, name, value):
+class Item(superclasses.ActionResolver):
+    '''Something a pirate can carry, and maybe fight with.
+
+    What every item of a kind has in common (name, value, damage, skill, verbs) lives on the class, so a
+    hundred cutlasses share one copy of it. An item itself only holds what changes as it's used: its
+    charges and whether it's used up. A new kind of item is a subclass that sets those class attributes
+    and __slots__ = () (see Cutlass below).
+
+    Subclasses written the older way, that pass a name and value to __init__ and set self.damage and
+    so on, still work: without __slots__ their instances get a __dict__ of their own to hold them.'''
+    __slots__ = ("charges", "usedUp")
+
+    name = "item"
+    value = 0
+    damage = (0,0)
+    firearm = False
+    #charges a new item starts with (firearms need one to fire)
+    full_charges = 0
+    skill = None
+    verb = None
+    verb2 = None
+    #Items have no commands of their own unless an older-style subclass gives them some
+    # (so an item isn't a Context, which would give every item a __dict__)
+    verbs = types.MappingProxyType({})
+    nouns = types.MappingProxyType({})
+
+    def __init__(self, name=None, value=None):
         superclasses.ActionResolver.__init__(self)
-        context.Context.__init__(self)
-        self.name = name
-        self.value = value
-        self.damage = (0,0)
-        self.firearm = False
-        self.charges = 0
+        self.charges = self.full_charges
         self.usedUp = False
-        self.skill = None
-        self.verb = None
-        self.verb2 = None
+        if hasattr(self, "__dict__"):
+            self.verbs = context.VersionedDict()
+            self.nouns = context.VersionedDict()
+            if name is not None:
+                self.name = name
+            if value is not None:
+                self.value = value
+        elif (name is not None and name != self.name) or (value is not None and value != self.value):
+            raise TypeError(f"{type(self).__name__} items are all called {self.name}; make a subclass (or a Trinket) for another kind")
+
+    def process_verb(self, verb, cmd_list, nouns):
+        #Context's message shows the nouns table, which for most items is an empty mappingproxy
+        display.announce(f"{self.name} can't {verb}", pause=False)
+
+    def __getstate__(self):
+        state = {"charges": self.charges, "usedUp": self.usedUp}
+        if hasattr(self, "__dict__"):
+            state.update(self.__dict__)
+            state.pop("_dispatch", None)
+        return state
+
+    def __setstate__(self, state):
+        #Saves from before items were slotted have the kind's facts (name, damage...) in here too.
+        # Those are on the class now, so they're only kept by items that have a __dict__ for them.
+        state = dict(state)
+        self.charges = state.pop("charges", self.full_charges)
+        self.usedUp = state.pop("usedUp", False)
+        if hasattr(self, "__dict__"):
+            self.__dict__.update(state)
 
     def __str__(self):
         return f"{self.name} ({self.getValue()} shillings)"
@@ -58,30 +105,40 @@ class Item(superclasses.ActionResolver, context.Context):
         if(isinstance(action.action, superclasses.Attack)):
             if (action.action.gunshot == True):
                 self.discharge()
+                #the gun's attack is gone until it's reloaded
+                moving.forget_attacks()
 
 
 class Cutlass(Item):
-    def __init__(self):
-        super().__init__("cutlass", 5) #Note: price is in shillings (a silver coin, 20 per pound)
-        self.damage = (10,60)
-        self.skill = "swords"
-        self.verb = "slash"
-        self.verb2 = "slashes"
+    __slots__ = ()
+    name = "cutlass"
+    value = 5 #Note: price is in shillings (a silver coin, 20 per pound)
+    damage = (10,60)
+    skill = "swords"
+    verb = "slash"
+    verb2 = "slashes"
 
 class BelayingPin(Item):
-    def __init__(self):
-        super().__init__("belaying-pin", 1) #Note: price is in shillings (a silver coin, 20 per pound)
-        self.damage = (5,30)
-        self.skill = "melee"
-        self.verb = "bash"
-        self.verb2 = "bashes"
+    __slots__ = ()
+    name = "belaying-pin"
+    value = 1 #Note: price is in shillings (a silver coin, 20 per pound)
+    damage = (5,30)
+    skill = "melee"
+    verb = "bash"
+    verb2 = "bashes"
 
 class Flintlock(Item):
-    def __init__(self):
-        super().__init__("flintlock", 400) #Note: price is in shillings (a silver coin, 20 per pound)
-        self.damage = (10,100)
-        self.firearm = True
-        self.charges = 1
-        self.skill = "guns"
-        self.verb = "shoot"
-        self.verb2 = "shoots"
+    __slots__ = ()
+    name = "flintlock"
+    value = 400 #Note: price is in shillings (a silver coin, 20 per pound)
+    damage = (10,100)
+    firearm = True
+    full_charges = 1
+    skill = "guns"
+    verb = "shoot"
+    verb2 = "shoots"
+
+class Trinket(Item):
+    '''A one-off item made on the spot, like Trinket("Golden Cutlass", 100) for some treasure.'''
+    def __init__(self, name, value):
+        super().__init__(name, value)
@@ -1,7 +1,8 @@
 from game.context import Context
 import game.config as config
+import game.event as event
 import game.display as display
-import random
+import game.instrument as instrument
 
 class Location:
     '''A map location. May own explorable sub-locations'''
@@ -26,6 +27,10 @@ class Location:
     def get_symbol(self):
         return self.symbol
 
+    def is_hazard(self):
+        '''True for places the ship's autopilot should steer around.'''
+        return False
+
     def enter(self, ship):
         pass
     def start_day(self):
@@ -33,6 +38,11 @@ class Location:
     def end_day(self):
         pass
 
+    def has_day_hooks(self):
+        '''True if this kind of location does something in start_day or end_day.
+        The world only ticks these locations each day (plain ocean is skipped).'''
+        return type(self).start_day is not Location.start_day or type(self).end_day is not Location.end_day
+
     def visit(self):
         '''main loop governing exploration of an island'''
         config.the_player.location = self.starting_location
@@ -60,8 +70,9 @@ class Location:
 
     def process_turn(self):
         config.the_player.go = False
-        for crew in config.the_player.get_pirates():
-            crew.print()
+        with display.frame():
+            for crew in config.the_player.get_pirates():
+                crew.print()
         while (config.the_player.go == False):
             config.the_player.get_interaction ([config.the_player, config.the_player.location])
 
@@ -81,16 +92,15 @@ class SubLocation(Context):
         #The chance an event triggers in this sub-location
         self.event_chance = 0
         #The events that may occur in this sub-location
-        self.events = []
+        self.events = event.EventPool()
 
     def start_turn(self):
         #Maybe draw an event (if there are events and the event chance is rolled)
-        if len(self.events) > 0 and self.event_chance > random.randrange(100):
-            random.shuffle (self.events)
-            today_event = self.events.pop()
+        if len(self.events) > 0 and self.event_chance > config.the_rng.randrange(100):
+            today_event = self.events.draw(config.the_rng)
             display.announce ("----------------------",pause=False)
-            results = today_event.process (self)
+            with instrument.span ("event", today_event):
+                results = today_event.process (self)
             display.announce (results["message"])
-            for e in results["newevents"]:
-                self.events.append(e)
+            self.events.extend(results["newevents"])
             display.announce ("----------------------",pause=False)
@@ -1,9 +1,8 @@
-import random
 from game import location
 import game.config as config
 import game.display as display
 from game.events import *
-from game.items import Item
+from game.items import Item, Trinket
 import game.combat as combat
 
 #Map fragment class
@@ -129,7 +128,7 @@ class Cave(location.SubLocation):
 
         # Combat Simulation
         while self.enemy.health > 0 and self.player.health > 0:
-            action = input("What will you do? (attack/run): ").strip().lower()
+            action = display.get_text_input("What will you do? (attack/run): ").strip().lower()
             if action == "attack":
                 self.player.attack(self.enemy)
                 if self.enemy.health > 0:
@@ -152,14 +151,11 @@ class Cave(location.SubLocation):
 
 
 class Skeleton(combat.Monster):
-    def __init__(self, name):
-        attacks = {}
-        attacks["Ghostly Blade"] = ["slashes", random.randrange(35,51), (5,15)]
-        attacks["Wailing Cut"] = ["slashes", random.randrange(35,51), (1,10)]
-        attacks["Anchored Strikes"] = ["strikes", random.randrange(35,51), (1,10)]
-       
-        super().__init__(name, random.randrange(7,20), attacks, 75 + random.randrange(-10,11)) 
-        self.type_name = "Pirate Skeleton"
+    species = combat.Species("Pirate Skeleton", (7,20), (75,-10,11), {
+        "Ghostly Blade": ["slashes", (35,51), (5,15)],
+        "Wailing Cut": ["slashes", (35,51), (1,10)],
+        "Anchored Strikes": ["strikes", (35,51), (1,10)],
+    })
 
 class Cliff(location.SubLocation):
     def __init__(self, main_location, island_map, player):
@@ -178,7 +174,7 @@ class Cliff(location.SubLocation):
         
         # Simulate combat
         while self.enemy.health > 0 and self.player.health > 0:
-            action = input("What will you do? (attack/run): ").strip().lower()
+            action = display.get_text_input("What will you do? (attack/run): ").strip().lower()
             if action == "attack":
                 self.player.attack(self.enemy)
                 if self.enemy.health > 0:
@@ -200,14 +196,11 @@ class Cliff(location.SubLocation):
             display.announce("You are defeated and unable to retrieve the items.", pause=False)
 
 class Guardian(combat.Monster):
-    def __init__(self, name):
-        attacks = {}
-        attacks["Craggy Crush"] = ["crushes", random.randrange(35,51), (5,15)]
-        attacks["Titan's Grasp"] = ["grasped", random.randrange(35,51), (1,10)]
-        attacks["Gravelstorm"] = ["stormed", random.randrange(35,51), (1,10)] 
-
-        super().__init__(name, random.randrange(7,20), attacks, 75 + random.randrange(-10,11)) 
-        self.type_name = "Cliff Guardian" 
+    species = combat.Species("Cliff Guardian", (7,20), (75,-10,11), {
+        "Craggy Crush": ["crushes", (35,51), (5,15)],
+        "Titan's Grasp": ["grasped", (35,51), (1,10)],
+        "Gravelstorm": ["stormed", (35,51), (1,10)],
+    })
 
 class Jungle(location.SubLocation):
     def __init__(self, main_location, island_map, player):
@@ -225,7 +218,7 @@ class Jungle(location.SubLocation):
         
         # Simulate combat
         while self.enemy.health > 0 and self.player.health > 0:
-            action = input("What will you do? (attack/run): ").strip().lower()
+            action = display.get_text_input("What will you do? (attack/run): ").strip().lower()
             if action == "attack":
                 self.player.attack(self.enemy)
                 if self.enemy.health > 0:
@@ -257,14 +250,11 @@ class Jungle(location.SubLocation):
             display.announce("You are defeated and unable to retrieve the fragment.", pause=False)
 
 class JungleBeast(combat.Monster):
-    def __init__(self, name):
-        attacks = {}
-        attacks["scratch 1"] = ["scratches", random.randrange(35,51), (5,15)]
-        attacks["scratch 2"] = ["scratches", random.randrange(35,51), (1,10)]
-        attacks["kick"] = ["kicks", random.randrange(35,51), (1,10)] 
-
-        super().__init__(name, random.randrange(7,20), attacks, 75 + random.randrange(-10,11))
-        self.type_name = "Jungle Beast"
+    species = combat.Species("Jungle Beast", (7,20), (75,-10,11), {
+        "scratch 1": ["scratches", (35,51), (5,15)],
+        "scratch 2": ["scratches", (35,51), (1,10)],
+        "kick": ["kicks", (35,51), (1,10)],
+    })
 
 class Lagoon(location.SubLocation):
     def __init__(self, main_location, island_map, player):
@@ -283,7 +273,7 @@ class Lagoon(location.SubLocation):
         
         # Simulate combat
         while self.enemy.health > 0 and self.player.health > 0:
-            action = input("What will you do? (attack/run): ").strip().lower()
+            action = display.get_text_input("What will you do? (attack/run): ").strip().lower()
             if action == "attack":
                 self.player.attack(self.enemy)
                 if self.enemy.health > 0:
@@ -314,25 +304,19 @@ class Lagoon(location.SubLocation):
             display.announce("You are defeated and unable to retrieve the fragment.", pause=False)
 
 class LagoonBeast(combat.Monster):
-    def __init__(self, name):
-        attacks = {}
-        attacks["Boggy Grasp"] = ["Grasps", random.randrange(35,51), (5,15)]
-        attacks["Snapping Maw"] = ["Snapping", random.randrange(38,64), (8,18)]
-        attacks["Fang-Soaked Bite"] = ["Bites", random.randrange(36,55), (6,16)]
-        attacks["Silt Storm"] = ["Stormed", random.randrange(30,45), (4, 14)]
-
-        super().__init__(name, random.randrange(7,20), attacks, 75 + random.randrange(-10,11))
-        self.type_name = "Lagoon Serpent"
+    species = combat.Species("Lagoon Serpent", (7,20), (75,-10,11), {
+        "Boggy Grasp": ["Grasps", (35,51), (5,15)],
+        "Snapping Maw": ["Snapping", (38,64), (8,18)],
+        "Fang-Soaked Bite": ["Bites", (36,55), (6,16)],
+        "Silt Storm": ["Stormed", (30,45), (4, 14)],
+    })
 
 class FinalBoss(combat.Monster):
-    def __init__(self, name):
-        attacks = {
-            "Shadow Strike": ["slashes", random.randrange(40, 60), (8, 15)],
-            "Cursed Cannonball": ["launches", random.randrange(50, 70), (10, 20)],
-            "Ghostly Roar": ["terrifies", random.randrange(30, 50), (5, 10)],
-        }
-        super().__init__(name, random.randrange(20, 30), attacks, 150 + random.randrange(-20, 20))
-        self.type_name = "Ghostly Pirate Captain"
+    species = combat.Species("Ghostly Pirate Captain", (20, 30), (150, -20, 20), {
+        "Shadow Strike": ["slashes", (40, 60), (8, 15)],
+        "Cursed Cannonball": ["launches", (50, 70), (10, 20)],
+        "Ghostly Roar": ["terrifies", (30, 50), (5, 10)],
+    })
 
 
 class TreasureSite(location.SubLocation):
@@ -357,7 +341,7 @@ class TreasureSite(location.SubLocation):
         display.announce("Solve the riddle to find the treasure:\n" + puzzle_question)
         attempts = 3
         while attempts > 0:
-            answer = input("Your answer: ").strip().lower()
+            answer = display.get_text_input("Your answer: ").strip().lower()
             if answer == "echo":
                 display.announce("Correct! You have solved the puzzle.", pause=False)
                 return True
@@ -369,7 +353,7 @@ class TreasureSite(location.SubLocation):
     def fight_final_boss(self):
         display.announce("Prepare for the ultimate battle!")
         while self.final_boss.health > 0 and self.player.health > 0:
-            action = input("What will you do? (attack/run): ").strip().lower()
+            action = display.get_text_input("What will you do? (attack/run): ").strip().lower()
             if action == "attack":
                 self.player.attack(self.final_boss)
                 if self.final_boss.health > 0:
@@ -387,8 +371,8 @@ class TreasureSite(location.SubLocation):
         display.announce("You open the treasure chest and find riches beyond your imagination!", pause=False)
         display.announce("You also find new weapons and armor to aid in your future adventures!", pause=False)
         # treasure loot
-        self.player.add_to_inventory(Item("Golden Cutlass", 100))
-        self.player.add_to_inventory(Item("Enchanted Armor", 150))
+        self.player.add_to_inventory(Trinket("Golden Cutlass", 100))
+        self.player.add_to_inventory(Trinket("Enchanted Armor", 150))
 
         # End of game
         self.conclude_game()
@@ -398,7 +382,7 @@ class TreasureSite(location.SubLocation):
         display.announce("YOU WIN!", pause=False)
 
        
-        action = input("Would you like to play again? (yes/no): ").strip().lower()
+        action = display.get_text_input("Would you like to play again? (yes/no): ").strip().lower()
         if action == "yes":
             display.announce("Restarting the game...")
             # Add logic to restart the game here if you want to
@@ -1,12 +1,10 @@
 from game import location
 import game.config as config
 import game.display as display
-from game.events import *
+from game.events import seagull
 from game.items import Item
-import random
-import numpy
 from game import event
-from game.combat import Monster
+from game.combat import Monster, Species
 import game.combat as combat
 from game.display import menu
 
@@ -185,23 +183,25 @@ class GiantSpider(Monster):
 
     # Giant spider can bite or slash. Both do the same damage, it's just a flavor difference.
     # 100-110 speed. 64-96 health.
+    species = Species("Giant Spider", (64,97), (100,0,11), {
+        "bite": ["bites", (60,80), (5,15)],
+        "slash": ["slashes", (60,80), (5,15)],
+    })
+
     def __init__ (self):
-        attacks = {}
-        attacks["bite"] = ["bites",random.randrange(60,80), (5,15)]
-        attacks["slash"] = ["slashes",random.randrange(60,80), (5,15)]
-        super().__init__("Giant Spider", random.randint(64,96), attacks, 100 + random.randint(0, 10))
-        self.type_name = "Giant Spider"
+        super().__init__("Giant Spider")
 
 class DoubleHoe(Item):
 
     # Less damage than a cutlass, but lets you pick up to two targets per fight.
-    def __init__(self):
-        super().__init__("double-hoe", 10)
-        self.damage = (8,50)
-        self.skill = "swords"
-        self.verb = "slam"
-        self.verb2 = "slams"
-        self.NUMBER_OF_ATTACKS = 2 # Number of attacks to be made in pickTargets
+    __slots__ = ()
+    name = "double-hoe"
+    value = 10
+    damage = (8,50)
+    skill = "swords"
+    verb = "slam"
+    verb2 = "slams"
+    NUMBER_OF_ATTACKS = 2 # Number of attacks to be made in pickTargets
 
     def pickTargets(self, action, attacker, allies, enemies):
         if (len(enemies) <= self.NUMBER_OF_ATTACKS): # If less than or equal to two targets, hit everyone
@@ -275,7 +275,7 @@ class SouthHill (location.SubLocation):
     @staticmethod
     def GetThreeFlowerColors():
         listOfColors = ["Red", "Blue", "Green", "White", "Black"]
-        return random.choices(listOfColors, k=3)
+        return config.the_rng.choices(listOfColors, k=3)
 
     # Handles the effect of the flower inputted through the 'choice' parameter.
     @staticmethod
@@ -285,7 +285,7 @@ class SouthHill (location.SubLocation):
 
         # Harm a random crewmate for picking the flower from the field it was so peacefully resting in. Gives a decent bit of score.
         if(choice == "Red"):
-            randomPirate = random.choice(game.get_pirates())
+            randomPirate = config.the_rng.choice(game.get_pirates())
             randomPirate.inflict_damage(10, " disturbing nature.")
 
             game.add_to_inventory([RedFlower()])
@@ -297,17 +297,17 @@ class SouthHill (location.SubLocation):
         #   -Makes some sick or lucky at random.
         #   -Randomizes the ship's food and medicine.
         elif(choice == "Blue"):
-            spotX = random.randint(1, 5)
-            spotY = random.randint(1, 5)
+            spotX = config.the_rng.randint(1, 5)
+            spotY = config.the_rng.randint(1, 5)
             # Make either movement negative at a 50% chance.
-            if(random.randint(0, 1) == 0):
+            if(config.the_rng.randint(0, 1) == 0):
                 spotX *= -1
-            if(random.randint(0, 1) == 0):
+            if(config.the_rng.randint(0, 1) == 0):
                 spotY *= -1
 
             # Clamp the numbers so the location can't be outside the world.
-            spotX = numpy.clip(game.ship.loc.get_x() + spotX, 0, game.world.worldsize)
-            spotY = numpy.clip(game.ship.loc.get_y() + spotY, 0, game.world.worldsize)
+            spotX = min(max(game.ship.loc.get_x() + spotX, 0), game.world.worldsize)
+            spotY = min(max(game.ship.loc.get_y() + spotY, 0), game.world.worldsize)
 
             new_loc = game.world.get_loc (spotX, spotY)
             game.go = True
@@ -316,22 +316,22 @@ class SouthHill (location.SubLocation):
 
             for i in game.get_pirates():
                 # Mess with the crewmate's health a bit.
-                i.health = int(i.health/random.uniform(0.5, 1.5))
-                i.health += random.randrange(-20, 20)
+                i.health = int(i.health/config.the_rng.uniform(0.5, 1.5))
+                i.health += config.the_rng.randrange(-20, 20)
                 if(i.health > i.max_health):
                     i.health = i.max_health
 
                 i.death_cause = "Unknown causes."
 
                 # Randomize sickness or luckiness.
-                if(random.randint(0, 2) == 0):
+                if(config.the_rng.randint(0, 2) == 0):
                     i.lucky = True
-                if(random.randint(0, 2) == 0):
+                if(config.the_rng.randint(0, 2) == 0):
                     i.sick = True
 
             # The crew would've used food and medicine over time, along with possibly obtaining some.
-            game.ship.food = int(game.ship.food/random.uniform(0.5, 1.5))
-            game.ship.medicine = int(game.ship.medicine/random.uniform(0.5, 1.5))
+            game.ship.food = int(game.ship.food/config.the_rng.uniform(0.5, 1.5))
+            game.ship.medicine = int(game.ship.medicine/config.the_rng.uniform(0.5, 1.5))
 
             game.add_to_inventory([BlueFlower()])
             display.announce(f"As soon as your crew picks the flower, you blink, and you seem to suddenly be a few days further in time.")
@@ -343,13 +343,14 @@ class SouthHill (location.SubLocation):
 
         # Reroll a pirate's stats
         elif(choice == "Black"):
-            randomPirate = random.choice(game.get_pirates())
-            randomPirate.skills["brawling"] = random.randrange(10,101)
-            randomPirate.skills["swords"] = random.randrange(10,101)
-            randomPirate.skills["melee"] = random.randrange(10,101)
-            randomPirate.skills["guns"] = random.randrange(10,101)
-            randomPirate.skills["cannons"] = random.randrange(10,101)
-            randomPirate.skills["swimming"] = random.randrange(10,101)
+            randomPirate = config.the_rng.choice(game.get_pirates())
+            randomPirate.skills["brawling"] = config.the_rng.randrange(10,101)
+            randomPirate.skills["swords"] = config.the_rng.randrange(10,101)
+            randomPirate.skills["melee"] = config.the_rng.randrange(10,101)
+            randomPirate.skills["guns"] = config.the_rng.randrange(10,101)
+            randomPirate.skills["cannons"] = config.the_rng.randrange(10,101)
+            randomPirate.skills["swimming"] = config.the_rng.randrange(10,101)
+            randomPirate.forget_attacks()
             display.announce(f"The black flower wilts as soon as {randomPirate.get_name()} picks it. They feel different.")
 
         # Add three instances of the seagull event to the worldwide event pool.
@@ -361,20 +362,24 @@ class SouthHill (location.SubLocation):
             display.announce("You hear a loud squawking in the distance as you pick the white flower.")
 
 class GreenFlower(Item): # 5 free score.
-    def __init__(self):
-        super().__init__("green-flower", 5)
+    __slots__ = ()
+    name = "green-flower"
+    value = 5
 
 class WhiteFlower(Item): # 10 free score because you have to put up with more seagulls.
-    def __init__(self):
-        super().__init__("white-flower", 10)
+    __slots__ = ()
+    name = "white-flower"
+    value = 10
 
 class BlueFlower(Item): # 25 free score. Time travel is risky.
-    def __init__(self):
-        super().__init__("blue-flower", 10)
+    __slots__ = ()
+    name = "blue-flower"
+    value = 10
 
 class RedFlower(Item): # 50 free score, since you need to take damage for it.
-    def __init__(self):
-        super().__init__("red-flower", 50)
+    __slots__ = ()
+    name = "red-flower"
+    value = 50
 
 # A shrine to an ancient deity. An invisible spirit guardian protects it, rewarding those who show wisdom.
 class Shrine (location.SubLocation):
@@ -446,7 +451,7 @@ class Shrine (location.SubLocation):
             ("Four legs in the morning, two in the afternoon, three in the evening. What am I?", "person"),
             ("I have four corners like a square pancake, but I'm stuffed and seasoned and carefully baked. I pass through the lips one piece at a time, the more you consume, the broader your mind. What am I?", "book")
             ]
-        return random.choice(riddleList)
+        return config.the_rng.choice(riddleList)
 
     # Reward the player by making all of their pirates lucky, not sick, and fully healed.
     def RiddleReward(self):
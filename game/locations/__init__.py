@@ -1,7 +1,25 @@
-__all__ = ["shallow",
-"island",
-"LucciIsland",
-"whirlpool",
-"homeport",
-"PeacefulIsland"]
+'''
+The locations in the game. Each one is registered here by name with where its class lives; its module
+isn't imported until the location is placed for real or visited (see game/registry.py).
 
+    symbol, title, visitable - what the map and ship show before the class is loaded
+    random=True              - placed somewhere random on every new map (World.island_list)
+    near_start=(dx, dy)      - always placed at this offset from the start, for testing an island
+    eager=True               - made straight away instead of lazily (cheap locations the game needs to
+                               know about from the first day)
+
+A location that does something every day in start_day or end_day must be registered with eager=True: a
+lazy one is a stand-in with no day hooks until the ship first reaches it, so its days before then never run.
+'''
+
+from game import registry
+
+registry.locations.register("homeport", "game.locations.homeport:HomePort", symbol="H", title="destination", eager=True)
+registry.locations.register("shallow", "game.locations.shallow:ShallowWater", eager=True)
+registry.locations.register("whirlpool", "game.locations.whirlpool:Whirlpool", near_start=(1, 0), eager=True)
+
+#Add new islands here:
+registry.locations.register("island", "game.locations.island:Island", symbol="I", random=True)
+#Test island: always next to the start. Move near_start to your island to test yours.
+registry.locations.register("LucciIsland", "game.locations.LucciIsland:Island", symbol="I", title="Lucci's island", near_start=(0, 1))
+registry.locations.register("PeacefulIsland", "game.locations.PeacefulIsland:PeacefulIsland", symbol="T", title="island", near_start=(-1, 0))
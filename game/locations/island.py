@@ -5,12 +5,11 @@
 from game import location
 import game.config as config
 import game.display as display
-from game.events import *
+from game.events import seagull
 import game.items as items
 import game.combat as combat
 import game.event as event
 import game.items as item
-import random
 
 ####################################################################################################
 # Events and supporting classes
@@ -21,17 +20,10 @@ import random
 #########################
 
 class Maroonee(combat.Monster):
-    def __init__ (self, name):
-        attacks = {}
-        attacks["bite"] = ["bites",random.randrange(35,51), (5,15)]
-        attacks["punch 1"] = ["punches",random.randrange(35,51), (1,10)]
-        attacks["punch 2"] = ["punches",random.randrange(35,51), (1,10)]
-        #7 to 19 hp, bite attack, 65 to 85 speed (100 is "normal")
-        super().__init__(name, random.randrange(7,20), attacks, 75 + random.randrange(-10,11))
-        self.type_name = "Mummified Maroonee"
+    #a drowned pirate, drier
+    species = combat.DROWNED.called("Mummified Maroonee")
 
 class ShorePirates (event.Event):
-    petemade = False
     '''
     A combat encounter with a crew of marooned pirate zombies.
     When the event is drawn, creates a combat encounter with 2 to 6 marooned pirates, kicks control over to the combat code to resolve the fight, then adds itself and a simple success message to the result
@@ -47,21 +39,23 @@ class ShorePirates (event.Event):
         monsters = []
         min = 2
         uplim = 6
-        if not ShorePirates.petemade:
-            ShorePirates.petemade = True
+        #Pete only turns up once a game
+        game_world = config.the_player.get_world()
+        if not getattr(game_world, "petemade", False):
+            game_world.petemade = True
             min = 1
             uplim = 5
             monsters.append(Maroonee("Partially-eaten Pete"))
             self.type_name = "Partially-eaten Pete"
             monsters[0].health = 3*monsters[0].health
-        elif random.randrange(2) == 0:
+        elif config.the_rng.randrange(2) == 0:
             min = 1
             uplim = 5
             monsters.append(Maroonee("Pirate captain"))
             self.type_name = "Marooned Pirate Captain"
             monsters[0].speed = 1.2*monsters[0].speed
             monsters[0].health = 2*monsters[0].health
-        n_appearing = random.randrange(min, uplim)
+        n_appearing = config.the_rng.randrange(min, uplim)
         n = 1
         while n <= n_appearing:
             monsters.append(Maroonee("Mumified maroonee "+str(n)))
@@ -76,12 +70,10 @@ class ShorePirates (event.Event):
 #########################
 
 class Macaque(combat.Monster):
-    def __init__ (self, name):
-        attacks = {}
-        attacks["bite"] = ["bites",random.randrange(70,101), (10,20)]
-        #7 to 19 hp, bite attack, 160 to 200 speed (100 is "normal")
-        super().__init__(name, random.randrange(7,20), attacks, 180 + random.randrange(-20,21))
-        self.type_name = "Man-eating Macacque"
+    #7 to 19 hp, bite attack, 160 to 200 speed (100 is "normal")
+    species = combat.Species("Man-eating Macacque", (7,20), (180,-20,21), {
+        "bite": ["bites", (70,101), (10,20)],
+    })
 
 
 class ManEatingMonkeys (event.Event):
@@ -99,14 +91,14 @@ class ManEatingMonkeys (event.Event):
         result = {}
         result["message"] = "the macaques are defeated! ...Those look pretty tasty!"
         monsters = []
-        n_appearing = random.randrange(4,8)
+        n_appearing = config.the_rng.randrange(4,8)
         n = 1
         while n <= n_appearing:
             monsters.append(Macaque("Man-eating Macaque "+str(n)))
             n += 1
         display.announce ("The crew is attacked by a troop of man-eating macaques!")
         combat.Combat(monsters).combat()
-        if random.randrange(2) == 0:
+        if config.the_rng.randrange(2) == 0:
             result["newevents"] = [ self ]
         else:
             result["newevents"] = [ ]
@@ -119,12 +111,13 @@ class ManEatingMonkeys (event.Event):
 ####################################################################################################
 
 class JeweledCutlass(item.Item):
-    def __init__(self):
-        super().__init__("jeweled-sword", 185) #Note: price is in shillings (a silver coin, 20 per pound)
-        self.damage = (10,60)
-        self.skill = "swords"
-        self.verb = "cut"
-        self.verb2 = "cuts"
+    __slots__ = ()
+    name = "jeweled-sword"
+    value = 185 #Note: price is in shillings (a silver coin, 20 per pound)
+    damage = (10,60)
+    skill = "swords"
+    verb = "cut"
+    verb2 = "cuts"
 
 ####################################################################################################
 # Island definition
@@ -7,7 +7,6 @@ from game.player import Player
 import game.config as config
 import game.display as display
 
-import random
 
 class Whirlpool (Context, location.Location):
 
@@ -20,6 +19,10 @@ class Whirlpool (Context, location.Location):
         self.ship = None
         self.symbol = "?"
 
+    def is_hazard (self):
+        #Only once it has been found (and marked on the map)
+        return self.symbol == "W"
+
     def enter (self, ship):
         self.symbol = "W"
         self.ship = ship
@@ -33,8 +36,8 @@ class Whirlpool (Context, location.Location):
 
         if (verb == "flee"):
             ''' moved to a random location in the area '''
-            destx = random.randrange (-2,3) + self.x
-            desty = random.randrange (-2,3) + self.y
+            destx = config.the_rng.randrange (-2,3) + self.x
+            desty = config.the_rng.randrange (-2,3) + self.y
             if (destx < 0):
                 destx = 0
             if (destx >= self.world.worldsize):
@@ -52,7 +55,7 @@ class Whirlpool (Context, location.Location):
             self.go = True
 
         elif (verb == "stay"):
-            if (random.randint(1,2) == 1):
+            if (config.the_rng.randint(1,2) == 1):
                 config.the_player.gameInProgress = False
                 config.the_player.kill_all_pirates("Drowned in the whirlpool")
                 display.announce ("The ship was destroyed in the whirlpool", pause=False)
@@ -0,0 +1,57 @@
+#what a bit of a seen row shows before any location symbols go on top
+_unseen = str.maketrans("01", "? ")
+
+class MapView:
+    '''The player's map as text, one row at a time, kept between map commands. Each row remembers what it
+    was drawn from (what's been seen on it, the ship if it's there and the symbols of the locations on it)
+    and is only drawn again when one of those has changed, so sailing a few cells or a whirlpool turning
+    from ? to W redraws a row or two however big the world is.'''
+
+    def __init__ (self):
+        self.rows = []
+        self.signatures = []
+        self.text = ""
+        #rows drawn by the last render (for testing and tuning)
+        self.redrawn = 0
+
+    def render (self, world, seen, ship_loc):
+        size = world.worldsize
+        if len(self.rows) != size:
+            self.rows = [None] * size
+            self.signatures = [None] * size
+        sx = ship_loc.get_x()
+        sy = ship_loc.get_y()
+        self.redrawn = 0
+        for y in range (0, size):
+            seen_row = seen.rows.get(y, 0)
+            places = world.locs.row(y)
+            symbols = ()
+            if len(places):
+                symbols = tuple((x, loc.get_symbol()) for x, loc in places.items())
+            ship_x = sx if y == sy else -1
+            signature = (seen_row, ship_x, symbols)
+            if signature != self.signatures[y]:
+                self.rows[y] = MapView.draw_row(size, seen_row, symbols, ship_x)
+                self.signatures[y] = signature
+                self.redrawn += 1
+        if self.redrawn:
+            self.text = "\n".join(self.rows)
+        return self.text
+
+    @staticmethod
+    def draw_row (size, seen_row, symbols, ship_x):
+        #bit x of seen_row is column x, so read the binary digits backwards
+        line = format(seen_row, "b").zfill(size)[::-1].translate(_unseen)
+        if len(symbols) == 0 and ship_x < 0:
+            return line
+        cells = list(line)
+        for x, symbol in symbols:
+            if (seen_row >> x) & 1:
+                cells[x] = symbol
+        if ship_x >= 0:
+            cells[ship_x] = "S"
+        return "".join(cells)
+
+    def __getstate__ (self):
+        #drawn rows are quick to redraw and can be big, don't save them
+        return {"rows": [], "signatures": [], "text": "", "redrawn": 0}
@@ -0,0 +1,90 @@
+'''
+Route finding on the world map, for the ship's autopilot.
+
+The map wraps around at the edges (see World.get_loc), so distances and routes do too. The ship moves
+one cell north, south, east or west a day, and steers clear of known hazards (see Location.is_hazard).
+'''
+
+import heapq
+
+#north, south, east, west, as the ship's headings
+STEPS = [(0, -1), (0, 1), (1, 0), (-1, 0)]
+
+def hazards(world):
+    '''Where the known hazards are. Only real locations can be hazards, so this only looks at those.'''
+    return frozenset(xy for xy, loc in world.locs.places.items() if loc.is_hazard())
+
+def wrap_delta(a, b, size):
+    '''The shortest signed step count from a to b on a ring of size cells.'''
+    d = (b - a) % size
+    if d > size // 2:
+        d -= size
+    return d
+
+def distance(a, b, size):
+    return abs(wrap_delta(a[0], b[0], size)) + abs(wrap_delta(a[1], b[1], size))
+
+def heading(a, b, size):
+    '''The (hx, hy) heading that takes the ship from cell a to the neighbouring cell b.'''
+    return wrap_delta(a[0], b[0], size), wrap_delta(a[1], b[1], size)
+
+def neighbours(cell, size):
+    x, y = cell
+    for dx, dy in STEPS:
+        yield (x + dx) % size, (y + dy) % size
+
+def route(start, goal, size, blocked):
+    '''The cells to sail through from start to goal (not including start), avoiding blocked cells,
+    or None if there's no way there. A* with the wrapped distance as the estimate, so on open sea it
+    only looks at cells close to the straight line.'''
+    if goal in blocked:
+        return None
+    if start == goal:
+        return []
+    came_from = {start: None}
+    cost = {start: 0}
+    count = 0
+    #ties go to the cell furthest along, so open water is crossed without fanning out
+    frontier = [(distance(start, goal, size), 0, count, start)]
+    while len(frontier):
+        f, g, n, cell = heapq.heappop(frontier)
+        g = -g
+        if cell == goal:
+            path = []
+            while cell != start:
+                path.append(cell)
+                cell = came_from[cell]
+            path.reverse()
+            return path
+        if g > cost[cell]:
+            continue
+        for nxt in neighbours(cell, size):
+            if nxt in blocked:
+                continue
+            if nxt not in cost or g + 1 < cost[nxt]:
+                cost[nxt] = g + 1
+                came_from[nxt] = cell
+                count += 1
+                heapq.heappush(frontier, (g + 1 + distance(nxt, goal, size), -(g + 1), count, nxt))
+    return None
+
+def nearest_unexplored(start, size, seen, blocked):
+    '''The closest cell that hasn't been seen (see fog.Fog) and isn't blocked, or None if there's none left.
+    Works on the fog's row bitsets, nearest rows first, and stops once no further row could hold anything
+    closer, so it costs a few big-int operations per row however much of the map is explored. Distance is
+    open-water distance: a cell walled in by hazards is still offered, and route() finds there's no way there.'''
+    x, y = start
+    skip = {}
+    for bx, by in blocked:
+        skip[by] = skip.get(by, 0) | (1 << bx)
+    best = None
+    best_distance = size + 1
+    for dy in range(size // 2 + 1):
+        if dy >= best_distance:
+            break
+        for row in dict.fromkeys([(y + dy) % size, (y - dy) % size]):
+            dx = seen.nearest_hidden(x, row, skip.get(row, 0))
+            if dx != None and dy + abs(dx) < best_distance:
+                best_distance = dy + abs(dx)
+                best = ((x + dx) % size, row)
+    return best
@@ -2,14 +2,17 @@
 from re import I
 import game.ship as ship
 import game.crewmate as crewmate
+import game.context as context
 from game.context import Context
-#import jsonpickle
+import game.snapshot as snapshot
+import game.fog as fog
+import game.mapview as mapview
 import game.display as display
 import game.config as config
 import game.items as items
+import game.inventory as inventory
+import game.scores as scores
 import sys
-import datetime
-import random
 
 class Player (Context):
 
@@ -24,25 +27,28 @@ class Player (Context):
         self.location = ship
         self.next_loc = None
         self.reporting = True
+        #the score database record_score adds to (see game/scores.py). None skips recording (headless simulations)
+        self.score_log = scores.DEFAULT_PATH
+        #where the save and load commands keep this game (see game/snapshot.py)
+        self.save_path = snapshot.DEFAULT_PATH
         self.go = False
         self.pirates = []
         self.piscine_dormitory = []
         self.CHARGE_SIZE = 128
-        self.powder = self.CHARGE_SIZE*random.randrange(3,7)
-        self.inventory = []
-        n = random.randrange(2,6)
+        self.powder = self.CHARGE_SIZE*config.the_rng.randrange(3,7)
+        self.inventory = inventory.Inventory()
+        n = config.the_rng.randrange(2,6)
         for i in range (0,n):
-            if random.randrange(0,10) == 0:
+            if config.the_rng.randrange(0,10) == 0:
                 itm: items.Item = items.Flintlock()
             else:
                 itm = items.Cutlass()
             self.inventory.append(itm)
-        n = random.randrange(2,6)
+        n = config.the_rng.randrange(2,6)
         for i in range (0,n):
             self.inventory.append(items.BelayingPin())
-        self.inventory.sort()
 
-        n = random.randrange(3,7)
+        n = config.the_rng.randrange(3,7)
         for i in range (0,n):
             c = crewmate.CrewMate()
             self.pirates.append (c)
@@ -60,33 +66,31 @@ class Player (Context):
         self.verbs['skills'] = self
         self.verbs['read'] = self
 
-        self.seen = []
-        for i in range (0, self.world.worldsize):
-            self.seen.append ([])
-            for j in range (0, self.world.worldsize):
-                self.seen[i].append(False)
+        #The explored map. A player made without a world (as in tests) has none.
+        self.seen = None
+        if self.world != None:
+            self.seen = fog.Fog (self.world.worldsize)
+        self.map_view = mapview.MapView()
 
     def save_game(self):
-        if "jsonpickle" not in sys.modules:
-            display.announce ("jsonpickle hasn't be imported. Saving is impossible.")
-        elif self.location != self.ship:
+        if self.location != self.ship:
             display.announce ("Saving is only possible abord ship.")
         else:
-            display.announce ("saving...", end="",pause=False)
-            f = open ("save.json", "w")
-            f.write (jsonpickle.encode (self))
-            f.close()
-            display.announce ("..done")
+            snapshot.save (self, self.save_path)
+            display.announce ("game saved", pause=False)
 
     def load_game(self):
-            if "jsonpickle" not in sys.modules:
-                display.announce ("jsonpickle hasn't be imported. Loading is impossible.")
-            elif self.location != self.ship:
+            if self.location != self.ship:
                 display.announce ("Loading is only possible abord ship.")
             else:
-                with open ("save.json") as f:
-                    s = f.read()
-                config.the_player = jsonpickle.decode (s)
+                try:
+                    snapshot.load (self.save_path)
+                except FileNotFoundError:
+                    display.announce ("There is no saved game.")
+                    return
+                except snapshot.SnapshotError as e:
+                    display.announce (f"Can't load the saved game: {e}")
+                    return
                 self.go = True
 
     def process_verb (self, verb, cmd_list, nouns):
@@ -97,7 +101,7 @@ class Player (Context):
         elif (verb == "inventory"):
             self.print_inventory ()
         elif (verb == "debug"):
-            display.announce(f"home port is at: {self.world.homex}, {self.world.homey}")
+            display.announce(f"home port is at: {self.world.homex}, {self.world.homey} (seed {self.world.seed})")
             self.world.print ()
         elif (verb == "restock"):
             if config.the_player.location != config.the_player.ship:
@@ -106,8 +110,9 @@ class Player (Context):
                 for c in self.get_pirates():
                     c.restock()
         elif (verb == "skills"):
-            for c in self.get_pirates():
-                c.print_skills ()
+            with display.frame():
+                for c in self.get_pirates():
+                    c.print_skills ()
         elif (verb == "save"):
             self.save_game()
 
@@ -131,9 +136,8 @@ class Player (Context):
                     self.location.process_verb(cmd_list[1], cmd_list, nouns)
         elif (verb == "read"):
             if (len(cmd_list) > 1):
-                for i in self.inventory:
-                    if i.name == cmd_list[1]:
-                        i.process_verb(verb, cmd_list, nouns)
+                for i in self.inventory.named(cmd_list[1]):
+                    i.process_verb(verb, cmd_list, nouns)
 
         else:
             display.announce ("Error: Player object does not understand verb " + verb)
@@ -145,25 +149,17 @@ class Player (Context):
         # that make sense in this context
         # and then dispatch an action that is identified
 
-        verbs = {}
-        nouns = {}
-        for c in contexts:
-            for k, v in c.verbs.items():
-                verbs[k] = v
-
-        for c in contexts:
-            for k, v in c.nouns.items():
-                nouns[k] = v
+        table = context.dispatch_table (contexts)
 
         cmd = display.get_text_input ("what is your command: ")
         cmd = cmd.lower()
         cmd_list = cmd.split()   # split on whitespace
 
         if(len(cmd_list) > 0):
-            if (cmd_list[0] in verbs.keys()):
-                verbs[cmd_list[0]].process_verb (cmd_list[0], cmd_list, nouns)
-            elif len(cmd_list) > 1 and (cmd_list[0] in nouns.keys()):
-                nouns[cmd_list[0]].process_verb (cmd_list[1], cmd_list[1:], nouns)
+            found = table.resolve (cmd_list)
+            if found != None:
+                handler, verb, args = found
+                handler.process_verb (verb, args, table.nouns)
             else:
                 display.announce (" I did not understand that command of " + cmd_list[0])
 
@@ -175,12 +171,7 @@ class Player (Context):
         # update the player's map
         # get ships location and then look at the range around them
         ship_loc = self.ship.get_loc()
-        x = ship_loc.get_x()
-        y = ship_loc.get_y()
-        for ix in range (x-self.sight_range, x+self.sight_range+1):
-            for iy in range (y-self.sight_range, y+self.sight_range+1):
-                if ((ix >=0) and (ix < self.world.worldsize) and (iy >=0) and (iy < self.world.worldsize)):
-                    self.seen[ix][iy] = True
+        self.seen.reveal (ship_loc.get_x(), ship_loc.get_y(), self.sight_range)
 
         self.go = False
 
@@ -194,6 +185,10 @@ class Player (Context):
             config.the_player.kill_all_pirates("died of sudden-onset starvation")
             return
 
+        #no need to ask for orders while the autopilot is sailing
+        if self.ship.autopilot (self.world):
+            return
+
 
         while (self.go == False):
             Player.get_interaction ([self, self.ship])
@@ -207,19 +202,25 @@ class Player (Context):
         self.gameInProgress = False
 
     def status (self):
-        display.announce ("The ship is at ", end="",pause=False)
-        loc = self.ship.get_loc()
-        display.announce(f"Longitude: {loc.get_x()}, Latitude: {loc.get_y()}", pause=False)
-        display.announce(f"Food stores are at: {self.ship.get_food()}", pause=False)
-        display.announce(f"Powder stores are at: {self.powder // self.CHARGE_SIZE} cannon {self.powder % self.CHARGE_SIZE} sidearm", pause=False)
-        self.ship.print ()
-        for crew in self.get_pirates():
-            crew.print()
+        pirates = self.get_pirates()
+        if not display.rendering():
+            return
+        with display.frame():
+            display.announce ("The ship is at ", end="",pause=False)
+            loc = self.ship.get_loc()
+            display.announce(f"Longitude: {loc.get_x()}, Latitude: {loc.get_y()}", pause=False)
+            display.announce(f"Food stores are at: {self.ship.get_food()}", pause=False)
+            display.announce(f"Powder stores are at: {self.powder // self.CHARGE_SIZE} cannon {self.powder % self.CHARGE_SIZE} sidearm", pause=False)
+            self.ship.print ()
+            for crew in pirates:
+                crew.print()
 
     def print (self):
-        self.ship.print()
-        for crew in self.get_pirates():
-            crew.print()
+        pirates = self.get_pirates()
+        with display.frame():
+            self.ship.print()
+            for crew in pirates:
+                crew.print()
 
 
     def get_ship (self):
@@ -266,29 +267,24 @@ class Player (Context):
         Player.game_over()
 
     def add_to_inventory (self, invList):
-        self.inventory = self.inventory + invList
-        self.inventory.sort()
+        self.inventory.extend(invList)
 
     def cleanup_items(self):
         for pirate in self.pirates:
-            pirate.items = [itm for itm in pirate.items if not itm.usedUp]
+            #only replace the list (which drops the pirate's cached attacks) if something was used up
+            if any(itm.usedUp for itm in pirate.items):
+                pirate.items = [itm for itm in pirate.items if not itm.usedUp]
 
     def print_map (self):
-        ship_loc = self.ship.get_loc()
-        for y in range (0, self.world.worldsize):
-            for x in range (0, self.world.worldsize):
-                if (self.world.locs[x][y] == ship_loc):
-                    print ("S", end="")
-                elif (self.seen[x][y]):
-                    print (self.world.locs[x][y].get_symbol(), end="")
-                else:
-                    print ("?", end="")
-            print ()
+        if not display.rendering():
+            return
+        display.announce (self.map_view.render (self.world, self.seen, self.ship.get_loc()), pause=False)
 
     def print_inventory (self):
-        for i in self.inventory:
-            display.announce (i, pause=False)
-        display.announce ("", pause=False)
+        with display.frame():
+            for i in self.inventory:
+                display.announce (i, pause=False)
+            display.announce ("", pause=False)
 
     @staticmethod
     def game_over ():
@@ -299,26 +295,6 @@ class Player (Context):
 
     @staticmethod
     def record_score():
-        f = open("scores.log", "a")
-        now = datetime.datetime.now()
-        score = 0
-        multiplier = 1
-        if len(config.the_player.pirates) <= 0:
-            multiplier = .5 #living to spend it is half the fun.
-        else:
-            for c in config.the_player.pirates:
-                score += c.health * 10
-                config.the_player.add_to_inventory(c.items)
-                c.items = []
-        for t in config.the_player.inventory:
-            score += t.getValue()
-
-        score = score*multiplier
-        f.write(f"{now.strftime('%A %B %d, %Y')} {score} points\n")
-        for c in config.the_player.pirates:
-            f.write(str(c) + "lived to tell the tale\n")
-        for d in config.the_player.piscine_dormitory:
-            f.write(str(d) + "\n")
-        for i in config.the_player.inventory:
-            f.write(str(i) + "\n")
-        f.write("----------------------\n\n")
+        if config.the_player.score_log == None:
+            return
+        scores.open_store(config.the_player.score_log).add(scores.from_player(config.the_player))
@@ -0,0 +1,126 @@
+'''
+Registries of the location and event types in the game.
+
+Each type is registered by name with where its class lives ("module:Class") and a few facts the game
+needs before the class is loaded (an island's map symbol, for example). The module is only imported the
+first time the type is really needed, so starting a game doesn't pay for every student island and event:
+
+    registry.locations.register("island", "game.locations.island:Island", symbol="I", random=True)
+    registry.events.register("seagull", "game.events.seagull:Seagull")
+
+Islands are registered in game/locations/__init__.py and events in game/events/__init__.py.
+'''
+
+import importlib
+
+import game.config as config
+import game.location as location
+
+class Entry:
+    '''One registered type: where its class lives, what's known about it up front, and the class once loaded.'''
+    def __init__(self, name, target, info):
+        self.name = name
+        self.target = target
+        self.info = info
+        self.cls = None
+
+    def load(self):
+        if self.cls == None:
+            module, cls = self.target.split(":")
+            self.cls = getattr(importlib.import_module(module), cls)
+        return self.cls
+
+class Registry:
+    def __init__(self, kind):
+        self.kind = kind
+        self.entries = {}
+
+    def register(self, name, target, **info):
+        '''Registers a type. target is "module:Class"; info is anything to know without loading it.'''
+        self.entries[name] = Entry(name, target, info)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __iter__(self):
+        return iter(self.entries.values())
+
+    def get(self, name):
+        if name not in self.entries:
+            raise KeyError(f"no {self.kind} called {name} is registered")
+        return self.entries[name]
+
+    def load(self, name):
+        '''The class registered as name, importing its module if this is the first time.'''
+        return self.get(name).load()
+
+    def names(self, **info):
+        '''The registered names (in registration order) whose info matches, like names(random=True).'''
+        return [n for n, e in self.entries.items() if all(e.info.get(k) == v for k, v in info.items())]
+
+class LazyLocation (location.Location):
+    '''Stands on the map for a registered location that hasn't been loaded yet. It has the symbol and
+    name from the registration, so it can be drawn and sailed past. The first time the ship enters it or
+    someone goes ashore the real location is made, takes its place on the map and carries on.
+    Until then it has no start_day or end_day, so locations with day hooks are registered eager=True.'''
+
+    def __init__(self, x, y, w, name):
+        super().__init__(x, y, w)
+        self.kind = name
+        entry = locations.get(name)
+        self.symbol = entry.info.get("symbol", "?")
+        self.name = entry.info.get("title", name)
+        self.visitable = entry.info.get("visitable", True)
+
+    def realize(self):
+        '''Makes the real location, puts it on the map in this one's place and returns it.'''
+        real = locations.load(self.kind)(self.x, self.y, self.world)
+        self.world.set_loc(self.x, self.y, real)
+        player = config.the_player
+        if player != None and player.ship != None and player.ship.get_loc() is self:
+            player.ship.set_loc(real)
+        return real
+
+    def enter(self, ship):
+        self.realize().enter(ship)
+
+    def visit(self):
+        self.realize().visit()
+
+    def __getattr__(self, attr):
+        #Anything only the real location has (its sub-locations, say): load it and ask that
+        if attr.startswith("__") or attr == "kind":
+            raise AttributeError(attr)
+        return getattr(self.realize(), attr)
+
+class LazyEvent:
+    '''Stands in an event pool for a registered event that hasn't been loaded yet. When it's drawn the real
+    event is made and run, and whatever that queues up (usually itself) goes back in the pool.'''
+
+    def __init__(self, name):
+        self.kind = name
+        self.name = name
+
+    def pool_key(self):
+        return (LazyEvent, self.kind)
+
+    def fresh(self):
+        #nothing in it changes, so another is just another name tag; the event itself still isn't loaded
+        return LazyEvent(self.kind)
+
+    @property
+    def span_label(self):
+        #Timed (see game/instrument.py) as the class it stands for
+        return events.get(self.kind).target.split(":")[1]
+
+    def process(self, world):
+        return events.load(self.kind)().process(world)
+
+def place(name, x, y, world):
+    '''A registered location for (x, y): lazy unless the registration says eager=True.'''
+    if locations.get(name).info.get("eager", False):
+        return locations.load(name)(x, y, world)
+    return LazyLocation(x, y, world, name)
+
+locations = Registry("location")
+events = Registry("event")
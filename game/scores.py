@@ -0,0 +1,246 @@
+'''
+The high score table.
+
+Finished games are kept in an SQLite database (scores.db by default), one row per game, only ever added
+to. A row records when the game ended, its score, seed and days survived, and the crew (who lived, who
+died and how) and inventory as JSON. Score, date and crew size are indexed, so leaderboards and
+summaries don't read the whole table:
+
+    store = scores.open_store("scores.db")
+    store.top(10, since=datetime.datetime(2026, 10, 1))     # this month's best
+    store.average_by_crew_size()                            # {crew size: average score}
+
+Simulations recording thousands of games write them in one transaction with store.batch().
+Old text score logs come in with store.import_log("scores.log") or python -m game.scores --import scores.log.
+'''
+
+import argparse
+import contextlib
+import datetime
+import json
+import re
+import sqlite3
+import threading
+
+DEFAULT_PATH = "scores.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    played TEXT NOT NULL,
+    score REAL NOT NULL,
+    seed INTEGER,
+    days INTEGER,
+    crew_size INTEGER NOT NULL,
+    survivors INTEGER NOT NULL,
+    crew TEXT NOT NULL,
+    inventory TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS scores_by_played ON scores (played, score);
+CREATE INDEX IF NOT EXISTS scores_by_crew_size ON scores (crew_size, score);
+"""
+
+COLUMNS = ["played", "score", "seed", "days", "crew_size", "survivors", "crew", "inventory"]
+
+class Score:
+    '''One finished game. crew is a list of {"name", "alive", "death_cause"}, inventory a list of item names.'''
+    def __init__(self, played, score, seed, days, crew, inventory):
+        self.played = played
+        self.score = score
+        self.seed = seed
+        self.days = days
+        self.crew = crew
+        self.inventory = inventory
+
+    def survivors(self):
+        return len([c for c in self.crew if c["alive"]])
+
+    def row(self):
+        return (self.played.isoformat(timespec="seconds"), self.score, self.seed, self.days, len(self.crew),
+                self.survivors(), json.dumps(self.crew), json.dumps(self.inventory))
+
+    @staticmethod
+    def from_row(row):
+        played, score, seed, days, crew_size, survivors, crew, inventory = row
+        return Score(datetime.datetime.fromisoformat(played), score, seed, days, json.loads(crew), json.loads(inventory))
+
+    def __str__(self):
+        return f"{self.played.strftime('%A %B %d, %Y')} {self.score} points"
+
+def from_player(player, played=None):
+    '''The Score of player's game, the same points Player.record_score always gave: 10 per point of
+    health of every living crewmate plus the value of everything carried, halved if nobody lived.'''
+    if played is None:
+        played = datetime.datetime.now()
+    score = 0
+    multiplier = 1
+    if len(player.pirates) <= 0:
+        multiplier = .5 #living to spend it is half the fun.
+    items = list(player.inventory)
+    for c in player.pirates:
+        score += c.health * 10
+        items += c.items
+    for t in items:
+        score += t.getValue()
+    crew = [{"name": c.name, "alive": True, "death_cause": ""} for c in player.pirates]
+    crew += [{"name": c.name, "alive": False, "death_cause": c.death_cause} for c in player.piscine_dormitory]
+    seed = None
+    days = None
+    if player.world != None:
+        seed = player.world.seed
+        days = player.world.get_day()
+    return Score(played, score*multiplier, seed, days, crew, [i.name for i in items])
+
+class ScoreStore:
+    '''The scores in one database file. Safe to share between threads (the game server's games do).'''
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.lock = threading.RLock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        #inside batch(), writes wait for the batch to end before committing
+        self.batching = 0
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    @contextlib.contextmanager
+    def batch(self):
+        '''with store.batch(): every score added in the block is committed together at the end.'''
+        with self.lock:
+            self.batching += 1
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.batching -= 1
+                if self.batching == 0:
+                    self.db.commit()
+
+    def add(self, score):
+        self.add_many([score])
+
+    def add_many(self, scores):
+        with self.lock:
+            self.db.executemany(f"INSERT INTO scores ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                                [s.row() for s in scores])
+            if self.batching == 0:
+                self.db.commit()
+
+    def __len__(self):
+        with self.lock:
+            return self.db.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def query(self, where, args, order, limit=None):
+        sql = f"SELECT {', '.join(COLUMNS)} FROM scores"
+        if len(where):
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY " + order
+        if limit is not None:
+            sql += " LIMIT ?"
+            args = args + [limit]
+        with self.lock:
+            return [Score.from_row(r) for r in self.db.execute(sql, args)]
+
+    @staticmethod
+    def range(since, until):
+        where = []
+        args = []
+        if since is not None:
+            where.append("played >= ?")
+            args.append(since.isoformat(timespec="seconds"))
+        if until is not None:
+            where.append("played < ?")
+            args.append(until.isoformat(timespec="seconds"))
+        return where, args
+
+    def top(self, n=10, since=None, until=None, crew_size=None):
+        '''The n best scores, best first, optionally only games ended in [since, until) or with crew_size crew.'''
+        where, args = ScoreStore.range(since, until)
+        if crew_size is not None:
+            where.append("crew_size = ?")
+            args.append(crew_size)
+        return self.query(where, args, "score DESC, id", n)
+
+    def between(self, since=None, until=None):
+        '''The games ended in [since, until), oldest first.'''
+        where, args = ScoreStore.range(since, until)
+        return self.query(where, args, "played, id")
+
+    def average_by_crew_size(self):
+        '''{crew size: average score}'''
+        with self.lock:
+            return {size: avg for size, avg in self.db.execute(
+                "SELECT crew_size, AVG(score) FROM scores GROUP BY crew_size ORDER BY crew_size")}
+
+    def import_log(self, path):
+        '''Adds the games in an old text score log. Returns how many there were.'''
+        with open(path) as f:
+            found = parse_log(f)
+        self.add_many(found)
+        return len(found)
+
+_header = re.compile(r"^(\w+ \w+ \d+, \d+) (-?[\d.]+) points$")
+_item = re.compile(r"^(.*) \((-?\d+) shillings\)$")
+_survivor = " lived to tell the tale"
+
+def parse_log(lines):
+    '''The Scores in the lines of an old text score log. Its games have no seed or day count, and the
+    time of day they ended wasn't written down.'''
+    found = []
+    current = None
+    for line in lines:
+        line = line.rstrip("\n")
+        header = _header.match(line)
+        if header != None:
+            played = datetime.datetime.strptime(header.group(1), "%A %B %d, %Y")
+            current = Score(played, float(header.group(2)), None, None, [], [])
+            found.append(current)
+        elif current == None or line == "" or line.startswith("-----"):
+            continue
+        elif line.endswith(_survivor):
+            current.crew.append({"name": line[:-len(_survivor)].strip(), "alive": True, "death_cause": ""})
+        elif _item.match(line):
+            current.inventory.append(_item.match(line).group(1))
+        else:
+            name, _, cause = line.partition(" ")
+            current.crew.append({"name": name, "alive": False, "death_cause": cause})
+    return found
+
+#One store per file, shared by everything in the process that records to it
+_stores = {}
+_stores_lock = threading.Lock()
+
+def open_store(path=DEFAULT_PATH):
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = ScoreStore(path)
+            _stores[path] = store
+        return store
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the high scores.")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="score database")
+    parser.add_argument("--import", dest="log", help="add the games in an old text score log")
+    parser.add_argument("--top", type=int, default=10, help="how many scores to show")
+    parser.add_argument("--days", type=int, help="only games from the last this many days")
+    args = parser.parse_args()
+
+    store = open_store(args.db)
+    if args.log:
+        print(f"imported {store.import_log(args.log)} games from {args.log}")
+    since = None
+    if args.days is not None:
+        since = datetime.datetime.now() - datetime.timedelta(days=args.days)
+    for s in store.top(args.top, since=since):
+        print(f"{s.score:>10} {s.played.strftime('%Y-%m-%d')} crew {len(s.crew)}, {s.survivors()} lived")
+    averages = store.average_by_crew_size()
+    if len(averages):
+        print("average score by crew size: " + ", ".join(f"{n}: {avg:.1f}" for n, avg in averages.items()))
+
+if __name__ == "__main__":
+    main()
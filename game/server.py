@@ -0,0 +1,163 @@
+'''
+Plays the game over the network: one process, many players, each connected with telnet or nc.
+
+    python -m game.server --port 8023
+    telnet localhost 8023
+
+One asyncio loop does all the networking. The game itself reads its input with plain blocking calls
+(display.announce, menu, get_text_input and the command loops of locations and events), so each
+connection's game runs on a worker thread in a session of its own (see game/session.py) and waits there
+for the connection's next line. A player who isn't typing costs a parked thread and no CPU. (Making
+every one of those prompt loops awaitable instead would mean rewriting every location and event, so
+games are capped at --max-games threads rather than being pure coroutines.) Output is
+handed to the loop to send, so a slow client only fills its own buffer; one that stops reading
+altogether is disconnected once that buffer passes MAX_BUFFER.
+
+Each connection's game saves to a file of its own in a temporary directory, so players' save and load
+commands don't see each other's games. The saves last as long as the server.
+'''
+
+import argparse
+import asyncio
+import itertools
+import os
+import queue
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import game.display as display
+import game.headless as headless
+import game.snapshot as snapshot
+
+#bytes of unsent output a client may fall behind by before it's disconnected
+MAX_BUFFER = 1 << 20
+
+class ConnectionInput ():
+    '''The lines a player sends, queued by the network loop and read by the game's thread.
+    Once the connection closes every read raises ScriptExhausted, which ends the game.'''
+    pauses = True
+    typed = True
+
+    def __init__(self):
+        self.lines = queue.Queue()
+
+    def put(self, line):
+        self.lines.put(line)
+
+    def close(self):
+        self.lines.put(None)
+
+    def read(self, prompt):
+        line = self.lines.get()
+        if line is None:
+            #leave it for any later read
+            self.lines.put(None)
+            raise display.ScriptExhausted(prompt)
+        return line
+
+    def choose(self, options):
+        return None
+
+class ConnectionSink ():
+    '''Sends game output (from the game's thread) to the player's connection (on the network loop).'''
+    def __init__(self, loop, writer, source):
+        self.loop = loop
+        self.writer = writer
+        self.source = source
+
+    def __call__(self, text):
+        self.loop.call_soon_threadsafe(self.send, text)
+
+    def send(self, text):
+        if self.writer.is_closing():
+            return
+        self.writer.write(text.replace("\n", "\r\n").encode())
+        if self.writer.transport.get_write_buffer_size() > MAX_BUFFER:
+            #not reading what we send: stop the game rather than hold its output forever
+            self.writer.close()
+            self.source.close()
+
+def clean(line):
+    '''A received line as a command: decoded, without the line ending or telnet control bytes.'''
+    text = line.decode("utf-8", errors="ignore")
+    return "".join(ch for ch in text if ch.isprintable()).strip()
+
+class Server ():
+    '''Accepts connections and plays a game with each, at most max_games at a time (later
+    connections wait for a free game). Scores go in the score database only if record_score is True.'''
+
+    def __init__(self, max_games=500, record_score=False):
+        self.games = ThreadPoolExecutor(max_workers=max_games, thread_name_prefix="game")
+        self.max_games = max_games
+        self.record_score = record_score
+        self.sources = set()
+        self.playing = 0
+        self.saves = tempfile.TemporaryDirectory(prefix="pirates-saves-")
+        self.connections = itertools.count()
+
+    async def handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        source = ConnectionInput()
+        sink = ConnectionSink(loop, writer, source)
+        self.sources.add(source)
+        if self.playing >= self.max_games:
+            sink("All the ships are out. You'll set sail when one comes back.\n")
+        self.playing += 1
+        save_path = os.path.join(self.saves.name, f"game{next(self.connections)}.dat")
+        game = loop.run_in_executor(self.games, headless.play_session, source, sink, self.record_score, None, save_path)
+
+        async def pump():
+            while True:
+                line = await reader.readline()
+                if len(line) == 0:
+                    break
+                source.put(clean(line))
+            source.close()
+        pumping = asyncio.create_task(pump())
+        try:
+            await game
+        finally:
+            self.playing -= 1
+            self.sources.discard(source)
+            pumping.cancel()
+            source.close()
+            #the game's last output was queued on the loop before the game finished, so it's sent already;
+            # close() still lets anything buffered drain before hanging up
+            writer.close()
+
+    async def start(self, host="127.0.0.1", port=8023):
+        '''Starts listening and returns the asyncio server (port 0 picks a free port).'''
+        return await asyncio.start_server(self.handle, host, port)
+
+    def close(self):
+        '''Ends every game in progress (as if its player hung up) and stops the game threads.'''
+        for source in list(self.sources):
+            source.close()
+        self.games.shutdown(wait=True)
+        snapshot.wait()
+        self.saves.cleanup()
+
+async def serve(host, port, max_games, record_score):
+    server = Server(max_games, record_score)
+    listener = await server.start(host, port)
+    print(f"serving on {', '.join(str(s.getsockname()) for s in listener.sockets)}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the game to players over telnet.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8023, help="port to listen on")
+    parser.add_argument("--max-games", type=int, default=500, help="games played at once")
+    parser.add_argument("--scores", action="store_true", help="record finished games in the score database")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_games, args.scores))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+'''
+The game being played.
+
+A game's player, display and random number generator used to be plain globals in game/config.py, so
+one interpreter could only run one game. They now belong to a Session, and config.the_player,
+config.the_display and config.the_rng read and write the session of whoever is asking: each thread and
+each asyncio task can be in its own game. Code that isn't in a session of its own (a normal game,
+the tests) shares one default session, so it works as before.
+
+    with session.use():                  # a fresh game for this block
+        p = headless.play(source, seed=1)
+
+    async def serve(reader, writer):
+        session.bind(session.Session())  # this task's game, for as long as the task runs
+        ...
+
+Imports nothing from the game, so config can import it.
+'''
+
+import contextlib
+import contextvars
+import random
+
+class Session:
+    '''One game's shared state.'''
+    def __init__(self):
+        self.player = None
+        self.display = None
+        #The World replaces it with one made from the game's seed
+        self.rng = random.Random()
+
+_default = Session()
+_current = contextvars.ContextVar("session", default=_default)
+
+#current() is the session of the running thread or task. It's read on every config.the_player, so it's
+# the context variable's own get rather than a function wrapped around it.
+current = _current.get
+
+def bind(s):
+    '''Makes s the session for the rest of the running thread or task (and tasks it starts).'''
+    _current.set(s)
+
+@contextlib.contextmanager
+def use(s=None):
+    '''Runs the with block in session s, or a new one. The session it was in comes back afterwards.'''
+    if s is None:
+        s = Session()
+    token = _current.set(s)
+    try:
+        yield s
+    finally:
+        _current.reset(token)
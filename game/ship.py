@@ -3,6 +3,7 @@ import random
 from game.context import Context
 import game.display as display
 import game.config as config
+import game.navigation as navigation
 
 class Ship (Context):
     '''The pirate ship. Mostly handles food and sailing around the ocean map.'''
@@ -13,6 +14,13 @@ class Ship (Context):
         self.medicine = 5
         self.food = 100
         self.loc = None
+        #Autopilot: where it's sailing to (or exploring, to the nearest unexplored water),
+        # and the cells still to sail through, last first
+        self.destination = None
+        self.exploring = False
+        self.route = []
+        self.route_goal = None
+        self.route_hazards = None
 
         self.verbs['anchor'] = self
         self.verbs['north'] = self
@@ -20,9 +28,14 @@ class Ship (Context):
         self.verbs['east'] = self
         self.verbs['west'] = self
         self.verbs['give'] = self
+        self.verbs['sail'] = self
+        self.verbs['explore'] = self
 
 
     def process_verb (self, verb, cmd_list, nouns):
+        if verb in ["north", "south", "east", "west", "anchor"]:
+            #steering by hand turns the autopilot off
+            self.disengage ()
         if (verb == "north"):
             self.hx = 0
             self.hy = -1
@@ -49,6 +62,21 @@ class Ship (Context):
                         display.announce ("no more medicine to give")
             else:
                 display.announce ("Give medicine to who?")
+        elif (verb == "sail"):
+            # sail to x y
+            coords = [w for w in cmd_list[cmd_list.index(verb)+1:] if w != "to"]
+            if len(coords) != 2 or not all(w.lstrip("-").isdigit() for w in coords):
+                display.announce ("Sail to where? (sail to x y)", pause=False)
+            else:
+                size = self.loc.world.worldsize
+                self.disengage ()
+                self.destination = (int(coords[0]) % size, int(coords[1]) % size)
+                self.set_sail ()
+        elif (verb == "explore"):
+            self.disengage ()
+            self.route_goal = None
+            self.exploring = True
+            self.set_sail ()
         else:
             display.announce ("Error: Ship object doe not understand verb " + verb)
 
@@ -68,6 +96,66 @@ class Ship (Context):
 
         display.announce(f"ship has {self.medicine} medicine", pause=False)
 
+    def set_sail (self):
+        #Steer for today straight away, and get going if there's anywhere to go
+        if self.steer (self.loc.world):
+            config.the_player.go = True
+
+    def disengage (self, reason = None):
+        '''Turns the autopilot off and drops anchor if it was on. reason, if given, is announced.'''
+        if self.destination == None and not self.exploring:
+            return
+        self.destination = None
+        self.exploring = False
+        self.route = []
+        self.route_goal = None
+        self.hx = 0
+        self.hy = 0
+        if reason != None:
+            display.announce (f"The autopilot is off: {reason}.", pause=False)
+
+    def autopilot (self, world):
+        '''If the autopilot is on, sets today's heading and returns True, so nobody needs asking what to do.
+        Turns itself off (and returns False) on arrival, when there's no way through, or when something
+        happened today that the captain should deal with.'''
+        if self.destination == None and not self.exploring:
+            return False
+        if world.events_today > 0:
+            self.disengage ("something happened")
+            return False
+        return self.steer (world)
+
+    def steer (self, world):
+        '''Sets today's heading along the route, planning it first if needed.'''
+        size = world.worldsize
+        here = (self.loc.get_x(), self.loc.get_y())
+        blocked = navigation.hazards (world)
+        goal = self.destination
+        if self.exploring:
+            #keep heading for the water picked last time until it's been seen, then pick the nearest again
+            goal = self.route_goal
+            if goal == None or config.the_player.seen.seen (goal[0], goal[1]) or goal in blocked:
+                goal = navigation.nearest_unexplored (here, size, config.the_player.seen, blocked)
+            if goal == None:
+                self.disengage ("there's nothing left to explore")
+                return False
+        if here == goal:
+            self.disengage ("arrived")
+            return False
+        #plan again if the goal or the known hazards changed, or the ship was moved off the route
+        if (goal != self.route_goal or blocked != self.route_hazards or len(self.route) == 0
+                or navigation.distance(here, self.route[-1], size) != 1):
+            path = navigation.route (here, goal, size, blocked)
+            if path == None:
+                self.disengage ("there's no safe way there")
+                return False
+            path.reverse()
+            self.route = path
+            self.route_goal = goal
+            self.route_hazards = blocked
+        self.hx, self.hy = navigation.heading (here, self.route.pop(), size)
+        return True
+
     def get_loc (self):
         return self.loc
 
@@ -98,6 +186,10 @@ class Ship (Context):
             # change our location
             self.set_loc (new_loc)
 
+            # the autopilot stops anywhere that isn't open ocean
+            if new_loc.name != "ocean":
+                self.disengage (f"reached the {new_loc.name}")
+
             # tell the new location that we entered
             new_loc.enter(self)
 
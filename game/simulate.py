@@ -0,0 +1,219 @@
+'''
+Monte Carlo combat simulator.
+
+Plays one encounter (a crew against some monsters) over and over with Combat.combat, with no human
+at the keyboard, and reports how survivable it is: win rate, turns to resolve, crew health lost and
+how often crewmates die. The trials are spread over a process pool so every core is used, and the
+workers' results are merged at the end.
+
+    python -m game.simulate --crew 4 --monster game.combat:Drowned*4 --trials 1000000
+    python -m game.simulate --crew 3 --monster game.locations.PeacefulIsland:GiantSpider
+    python -m game.simulate --crew 5 --loadout cutlass,belaying-pin --monster game.locations.island:Macaque*6
+
+Crewmates get the same random skills as in a real game. The crew is steered by a simple policy:
+each crewmate uses their best ready attack (chance to hit times average damage) on a random monster.
+'''
+
+import argparse
+import importlib
+import inspect
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import game.config as config
+import game.display as display
+import game.combat as combat
+import game.crewmate as crewmate
+import game.items as items
+import game.superclasses as superclasses
+
+def load_monsters(spec):
+    '''Turns "module:Class*count" (count defaults to 1) into (monster maker, count).
+    The maker takes a number and returns a fresh monster.'''
+    count = 1
+    if "*" in spec:
+        spec, n = spec.rsplit("*", 1)
+        count = int(n)
+    module, name = spec.split(":")
+    cls = getattr(importlib.import_module(module), name)
+    #Most monsters take a name, a few (like GiantSpider) name themselves.
+    if len(inspect.signature(cls).parameters) > 0:
+        return (lambda n: cls(f"{name} {n}")), count
+    return (lambda n: cls()), count
+
+def load_item(name):
+    '''Finds an item class in game.items by its in-game name (cutlass, belaying-pin, flintlock).'''
+    for cls in vars(items).values():
+        if isinstance(cls, type) and issubclass(cls, items.Item) and cls is not items.Item:
+            if cls().name == name:
+                return cls
+    raise ValueError(f"unknown item {name}")
+
+class CombatParty ():
+    '''Stands in for the Player during a simulated fight: holds the crew, and nothing else.'''
+    def __init__(self):
+        self.pirates = []
+        self.powder = 0
+
+    def get_pirates(self):
+        return [p for p in self.pirates if p.health > 0]
+
+    def cleanup_items(self):
+        for pirate in self.pirates:
+            #only replace the list (which drops the pirate's cached attacks) if something was used up
+            if any(itm.usedUp for itm in pirate.items):
+                pirate.items = [itm for itm in pirate.items if not itm.usedUp]
+
+def expected_damage(action):
+    '''Average damage per use of a CombatAction. Defending does no damage.'''
+    attack = action.action
+    if not isinstance(attack, superclasses.Attack):
+        return -1
+    return attack.success * (attack.damage_range[0] + attack.damage_range[1]) / 2
+
+class CombatBot ():
+    '''Answers combat menus: the best attack for actions, a random target for targets.'''
+    def __init__(self, rng):
+        self.rng = rng
+
+    def read(self, prompt):
+        raise display.ScriptExhausted(prompt)
+
+    def choose(self, options):
+        if isinstance(options[0], superclasses.CombatAction):
+            return max(range(len(options)), key=lambda i: expected_damage(options[i]))
+        return self.rng.randrange(len(options))
+
+class CombatStats ():
+    '''Totals for a batch of fights. Batches from different workers are merged with add().'''
+    def __init__(self):
+        self.fights = 0
+        self.wins = 0
+        self.turns = 0
+        self.turns_sq = 0
+        self.hp_lost = 0
+        self.hp_lost_sq = 0
+        self.crew = 0
+        self.deaths = 0
+
+    def record(self, won, turns, hp_lost, crew, deaths):
+        self.fights += 1
+        if won:
+            self.wins += 1
+        self.turns += turns
+        self.turns_sq += turns*turns
+        self.hp_lost += hp_lost
+        self.hp_lost_sq += hp_lost*hp_lost
+        self.crew += crew
+        self.deaths += deaths
+
+    def add(self, other):
+        for k, v in vars(other).items():
+            setattr(self, k, getattr(self, k) + v)
+        return self
+
+    @staticmethod
+    def _mean_sd(total, total_sq, n):
+        mean = total / n
+        return mean, math.sqrt(max(total_sq / n - mean*mean, 0))
+
+    def report(self):
+        n = max(self.fights, 1)
+        turns, turns_sd = CombatStats._mean_sd(self.turns, self.turns_sq, n)
+        hp, hp_sd = CombatStats._mean_sd(self.hp_lost, self.hp_lost_sq, n)
+        lines = []
+        lines.append(f"fights:              {self.fights}")
+        lines.append(f"win rate:            {100*self.wins/n:.2f}%")
+        lines.append(f"turns to resolve:    {turns:.2f} (sd {turns_sd:.2f})")
+        lines.append(f"crew hp lost:        {hp:.2f} (sd {hp_sd:.2f})")
+        lines.append(f"crewmate death rate: {100*self.deaths/max(self.crew, 1):.2f}%")
+        return "\n".join(lines)
+
+def fight_once(crew_size, loadout, monster_specs):
+    '''One fight. Returns (won, turns, hp lost, deaths).'''
+    party = CombatParty()
+    config.the_player = party
+    for i in range(crew_size):
+        c = crewmate.CrewMate()
+        if loadout is not None:
+            c.items = [cls() for cls in loadout]
+        party.pirates.append(c)
+    start_hp = sum(c.health for c in party.pirates)
+
+    monsters = []
+    for make, count in monster_specs:
+        for n in range(count):
+            monsters.append(make(n+1))
+
+    fight = combat.Combat(monsters)
+    fight.combat()
+    end_hp = sum(max(c.health, 0) for c in party.pirates)
+    deaths = len([c for c in party.pirates if c.health <= 0])
+    return len(fight.monsters) == 0, fight.turns, start_hp - end_hp, deaths
+
+def simulate_chunk(crew_size, loadout, monsters, trials, seed):
+    '''Runs trials fights in this process. Used directly or as a process pool job.'''
+    rng = random.Random(seed)
+    config.the_rng = rng
+    bot = CombatBot(rng)
+    display.Display(display.CallbackInput(bot.read, bot.choose), display.null_sink)
+    items_cls = None
+    if loadout is not None:
+        items_cls = [load_item(name) for name in loadout]
+    monster_specs = [load_monsters(m) for m in monsters]
+
+    stats = CombatStats()
+    for t in range(trials):
+        won, turns, hp_lost, deaths = fight_once(crew_size, items_cls, monster_specs)
+        stats.record(won, turns, hp_lost, crew_size, deaths)
+    return stats
+
+def simulate(crew_size, monsters, trials, loadout=None, workers=None, seed=None, chunk=5000):
+    '''Runs trials fights spread over a process pool and merges the results.
+    monsters is a list of "module:Class*count" strings, loadout an optional list of item names
+    every crewmate carries (default: the usual cutlass and flintlock).'''
+    if seed is None:
+        seed = random.randrange(2**32)
+    jobs = []
+    done = 0
+    while done < trials:
+        n = min(chunk, trials - done)
+        #each chunk has its own seed so results don't depend on which worker ran it
+        jobs.append((n, seed*1000003 + len(jobs)))
+        done += n
+
+    stats = CombatStats()
+    if workers == 1:
+        for n, s in jobs:
+            stats.add(simulate_chunk(crew_size, loadout, monsters, n, s))
+        return stats
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(simulate_chunk, crew_size, loadout, monsters, n, s) for n, s in jobs]
+        for f in futures:
+            stats.add(f.result())
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo combat simulator.")
+    parser.add_argument("--crew", type=int, default=4, help="number of crewmates")
+    parser.add_argument("--loadout", help="comma separated item names every crewmate carries")
+    parser.add_argument("--monster", action="append", required=True, help="module:Class*count, may be repeated")
+    parser.add_argument("--trials", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes (1 runs in this process)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    loadout = None
+    if args.loadout:
+        loadout = args.loadout.split(",")
+    start = time.perf_counter()
+    stats = simulate(args.crew, args.monster, args.trials, loadout, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    print(stats.report())
+    print(f"{stats.fights} fights in {elapsed:.2f}s ({stats.fights/elapsed:.0f} fights/s)")
+
+if __name__ == "__main__":
+    main()
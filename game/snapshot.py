@@ -0,0 +1,200 @@
+'''
+Saved games.
+
+A snapshot is a small header (magic bytes and a format version) followed by the whole game (the Player,
+and through it the World, Ship, crew, inventory and event pools) pickled and zlib compressed.
+
+    snapshot.save(player, "save.dat")            # returns at once, the file is written in the background
+    snapshot.wait()                              # if you need the file on disk now
+    player = snapshot.load("save.dat")
+
+Old saves keep loading after the code changes:
+- a class that moved or was renamed gets an entry in RENAMES, so the old name still finds it
+- a change to what the game state looks like bumps VERSION and adds a migration from the old version,
+  which is run on the loaded state:
+
+    @snapshot.migration(1)
+    def add_sails(state):
+        state["player"].ship.sails = 2
+'''
+
+import atexit
+import io
+import os
+import pickle
+import struct
+import threading
+import zlib
+
+import game.config as config
+import game.fog as fog
+import game.inventory as inventory
+import game.mapview as mapview
+import game.scores as scores
+
+MAGIC = b"PIRATES\n"
+VERSION = 9
+HEADER = struct.Struct(">8sH")
+DEFAULT_PATH = "save.dat"
+
+#(old module, old name) -> (new module, new name), for classes that moved since a save was made
+RENAMES = {}
+#version -> function that brings a loaded state from that version to the next one
+MIGRATIONS = {}
+
+class SnapshotError(Exception):
+    '''A file that isn't a save, or one from a newer version of the game.'''
+    pass
+
+def migration(version):
+    '''Registers a function that upgrades a state saved at version to version + 1.'''
+    def register(fn):
+        MIGRATIONS[version] = fn
+        return fn
+    return register
+
+def capture(player):
+    '''The game state, pickled. Cheap next to compressing and writing it.'''
+    return pickle.dumps({"player": player}, protocol=pickle.HIGHEST_PROTOCOL)
+
+def frame(data):
+    '''Pickled state to snapshot bytes.'''
+    return HEADER.pack(MAGIC, VERSION) + zlib.compress(data, 1)
+
+def dumps(player):
+    '''The game as snapshot bytes.'''
+    return frame(capture(player))
+
+class Unpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        module, name = RENAMES.get((module, name), (module, name))
+        return super().find_class(module, name)
+
+def loads(data):
+    '''The Player from snapshot bytes, brought up to date and made the current game.'''
+    if len(data) < HEADER.size:
+        raise SnapshotError("not a saved game")
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a saved game")
+    if version > VERSION:
+        raise SnapshotError(f"saved by a newer version of the game (format {version}, this is {VERSION})")
+    state = Unpickler(io.BytesIO(zlib.decompress(data[HEADER.size:]))).load()
+    while version < VERSION:
+        if version in MIGRATIONS:
+            MIGRATIONS[version](state)
+        version += 1
+
+    player = state["player"]
+    config.the_player = player
+    config.the_rng = player.world.rng
+    return player
+
+#The background writers, one per save file: path -> the thread writing its last save. Games on other
+# threads (see game/session.py) save at the same time, so the table is only touched holding _lock.
+_writers = {}
+_lock = threading.Lock()
+
+def write(data, path):
+    #Write next to the real file and swap it in, so a crash mid-save never leaves half a save behind
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def save(player, path=DEFAULT_PATH, background=True):
+    '''Saves the game. The state is captured before this returns, so the game can carry on
+    while the file is compressed and written in the background.'''
+    data = capture(player)
+    if not background:
+        wait(path)
+        write(frame(data), path)
+        return
+    with _lock:
+        last = _writers.get(path)
+        def finish():
+            framed = frame(data)
+            #saves to the same file land in the order they were made
+            if last is not None:
+                last.join()
+            write(framed, path)
+        writer = threading.Thread(target=finish, name="snapshot-writer", daemon=True)
+        _writers[path] = writer
+        writer.start()
+
+def wait(path=None):
+    '''Blocks until the last background save to path (or, with no path, every save) is on disk.'''
+    with _lock:
+        if path is None:
+            pending = list(_writers.values())
+        else:
+            pending = [_writers[path]] if path in _writers else []
+    for writer in pending:
+        writer.join()
+    with _lock:
+        for p, writer in list(_writers.items()):
+            if not writer.is_alive():
+                del _writers[p]
+
+#Don't lose a save that is still being written when the game quits
+atexit.register(wait)
+
+def load(path=DEFAULT_PATH):
+    wait(path)
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+#Migrations, oldest first
+
+@migration(1)
+def fog_bitset(state):
+    #Version 1 kept the explored map as a list of lists of bools
+    player = state["player"]
+    old = player.seen
+    player.seen = fog.Fog(len(old))
+    for x, column in enumerate(old):
+        for y, seen in enumerate(column):
+            if seen:
+                player.seen.reveal(x, y, 0)
+
+@migration(2)
+def map_view(state):
+    #Version 2 drew the map from scratch every time
+    state["player"].map_view = mapview.MapView()
+
+@migration(3)
+def autopilot(state):
+    #Version 3 had no autopilot
+    player = state["player"]
+    player.world.events_today = 0
+    ship = player.ship
+    ship.destination = None
+    ship.exploring = False
+    ship.route = []
+    ship.route_goal = None
+    ship.route_hazards = None
+    ship.verbs["sail"] = ship
+    ship.verbs["explore"] = ship
+
+@migration(4)
+def score_store(state):
+    #Version 4 wrote scores to a text log; the score database is a different file
+    player = state["player"]
+    if player.score_log == "scores.log":
+        player.score_log = scores.DEFAULT_PATH
+
+@migration(5)
+def indexed_inventory(state):
+    #Version 5 kept the inventory as a sorted list
+    player = state["player"]
+    player.inventory = inventory.Inventory(player.inventory)
+
+#Version 6 saved every item's name, damage and verbs with it. Nothing to migrate: Item.__setstate__
+# drops them as the save is read, since they're on the item's class now.
+
+#Version 7 saved each monster's attacks as a dict. Monster.__setstate__ turns it into the monster's actions.
+
+@migration(8)
+def save_path(state):
+    #Version 8 always saved to the default file
+    state["player"].save_path = DEFAULT_PATH
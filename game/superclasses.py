@@ -1,7 +1,7 @@
 from __future__ import annotations
 import game.display as display
+import game.config as config
 from game.display import menu
-import random
 
 class Attack():
     """Basic attack object, with a name, description, chance of success, and damage range. Sufficient for specifying monster attacks."""
@@ -33,6 +33,8 @@ class Defend():
 
 
 class ActionResolver():
+    __slots__ = ()
+
     def pickTargets(self, action, attacker, allies, enemies):
         """The player should pick targets"""
         options = []
@@ -58,12 +60,12 @@ class ActionResolver():
         else:
             for chosen_target in chosen_targets:
                 if chosen_target != None:
-                    roll = random.randrange(100)
+                    roll = config.the_rng.randrange(100)
                     if moving.isLucky() == True:
-                        roll = min(roll, random.randrange(100))
+                        roll = min(roll, config.the_rng.randrange(100))
                     if roll < chosen_attk.success:
                         display.announce(f"{moving.get_name()} {chosen_attk.description} {chosen_target.get_name()}!")
-                        damage = random.randrange(chosen_attk.damage_range[0],chosen_attk.damage_range[1]+1)
+                        damage = config.the_rng.randrange(chosen_attk.damage_range[0],chosen_attk.damage_range[1]+1)
                         deathcause = f"slain by a {moving.get_type_name()}'s {chosen_attk.name}"
                         deader = chosen_target.inflict_damage(damage, deathcause, True)
                         if not (deader is None):
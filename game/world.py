@@ -1,71 +1,75 @@
 
 import game.location as location
-from game.locations import *
-from game.events import *
+import game.locations
+import game.events
+import game.registry as registry
 import game.ship as ship
 import game.context as context
 import game.display as display
 import game.config as config
 import game.combat as Combat
+import game.grid as grid
+import game.worldgen as worldgen
+import game.event as event
+import game.instrument as instrument
 
+import functools
 import random
 
 class World (context.Context):
 
     worldsize = 25
+    #Names of the locations placed at random. Add new islands in game/locations/__init__.py.
+    island_list = registry.locations.names(random=True)
+    #How far apart (counting diagonals) islands and the home port are placed: 2 leaves water between them
+    island_spacing = 2
     startx = 12
     starty = 12
 
-    def __init__ (self, s):
+    def __init__ (self, s, seed = None, worldsize = None):
         super().__init__()
+        #Every random roll in the game comes from this generator, so a game replays exactly from its seed.
+        if seed == None:
+            seed = random.randrange (2**32)
+        self.seed = seed
+        self.rng = random.Random (seed)
+        config.the_rng = self.rng
+        #Bigger (or smaller) worlds start the ship in the middle
+        if worldsize != None:
+            self.worldsize = worldsize
+            self.startx = worldsize // 2
+            self.starty = worldsize // 2
         self.ship = s
         self.day = 0
-        self.locs = []
-        for i in range (0, World.worldsize):
-            self.locs.append([])
-            for j in range (0, World.worldsize):
-                self.locs[i].append(location.Location(i, j, self))
-
-        self.homex = random.randrange (1,World.worldsize-2)
-        self.homey = random.randrange (1,World.worldsize-2)
-        #Home port can't be within a 4x4 square of the start location
-        while (self.homey in range(self.starty-4, self.starty+5)) or (self.homex in range(self.startx-4, self.startx+5)):
-            self.homex = random.randrange (1,World.worldsize-2)
-            self.homey = random.randrange (1,World.worldsize-2)
-        self.locs[self.homex][self.homey] = homeport.HomePort (self.homex, self.homey, self)
-
-        #Add new islands to this list:
-        island_list = [island.Island]
-        for cur_island in island_list:
-            placed = False
-            while placed == False:
-                x = random.randrange (1, World.worldsize - 2)
-                y = random.randrange (1, World.worldsize - 2)
-                #Islands can't be within a 2x2 square of the start location
-                if (self.locs[x][y].name == "ocean") and ((y in range(self.starty-2, self.starty+3)) or (x in range(self.startx-2, self.startx+3))):
-                    self.locs[x][y] = cur_island (x, y, self)
-                    placed = True
-
-        #The pirates apparently got lost in a whirlpool
-        whirl = whirlpool.Whirlpool (self.startx + 1, self.starty, self)
-        self.locs[self.startx+1][self.starty] = whirl
-
-        #Test island: always start off next to a test island. Swap in your island to test yours.
-        testland = LucciIsland.Island (self.startx, self.starty+1, self)
-        self.locs[self.startx][self.starty+1] = testland
-
-        # Peaceful island directly to the right of the spawning location.
-        peacefulIsland = PeacefulIsland.PeacefulIsland(self.startx + 1, self.starty, self)
-        self.locs[self.startx - 1][self.starty] = peacefulIsland
-
-        self.events = []
-        self.events.append (lucky.LuckyDay())
-        self.events.append (nothing.Nothing())
-        self.events.append (seagull.Seagull())
-        self.events.append (seagull.Seagull())
-        self.events.append (seagull.Seagull())
-        self.events.append (sickness.Sickness())
-        self.events.append (drowned_pirates.DrownedPirates())
+        self.events_today = 0
+        #Locations whose start_day/end_day do something, by (x, y). The daily tick only visits these.
+        self.active = {}
+        #Only the interesting places are stored; open ocean is made when needed
+        self.locs = grid.Grid (self.worldsize, self)
+
+        placer = worldgen.Placer (self, spacing = World.island_spacing)
+        #Home port can't be in the rows or columns within 4 of the start location
+        home = placer.place (functools.partial (registry.place, "homeport"), worldgen.out_of_line (self.startx, self.starty, 4))
+        self.homex = home.get_x()
+        self.homey = home.get_y()
+
+        #Islands can't be within 2 cells of the start location
+        for name in World.island_list:
+            placer.place (functools.partial (registry.place, name), worldgen.away_from (self.startx, self.starty, 2))
+
+        #The pirates apparently got lost in a whirlpool, and always start off next to the test islands
+        for entry in registry.locations:
+            if "near_start" in entry.info:
+                dx, dy = entry.info["near_start"]
+                x = (self.startx + dx) % self.worldsize
+                y = (self.starty + dy) % self.worldsize
+                self.set_loc (x, y, registry.place (entry.name, x, y, self))
+
+        #Events are only loaded the first time they're drawn
+        self.events = event.EventPool()
+        for entry in registry.events:
+            for i in range (0, entry.info.get ("world", 0)):
+                self.events.append (registry.LazyEvent (entry.name))
         self.nouns["world"] = self
 
     def get_day (self):
@@ -75,23 +79,25 @@ class World (context.Context):
         self.day = self.day + 1
 #        display.announce ("starting day " + str(self.day))
 
+        #how many events happened today (the ship's autopilot stops for them)
+        self.events_today = 0
         if self.day > 1:
-            num_events = random.randint (0,2)
-            random.shuffle (self.events)
+            num_events = self.rng.randint (0,2)
+            self.events_today = num_events
             for i in range (0, num_events):
-                today_event = self.events.pop()
+                today_event = self.events.draw(self.rng)
                 display.announce ("----------------------",pause=False)
-                results = today_event.process (self)
+                with instrument.span ("event", today_event):
+                    results = today_event.process (self)
                 display.announce (results["message"])
-                for e in results["newevents"]:
-                    self.events.append(e)
+                self.events.extend(results["newevents"])
                 display.announce ("----------------------",pause=False)
 
         # ship knows where it is
         action = self.ship.start_day(self)
-        for i in range (0, World.worldsize):
-            for j in range (0, World.worldsize):
-                self.locs[i][j].start_day()
+        for loc in self.active_locs():
+            with instrument.span ("location", loc.start_day):
+                loc.start_day()
 
 
     def end_day (self):
@@ -99,32 +105,57 @@ class World (context.Context):
 
         # ship knows where it is
         action = self.ship.end_day(self)
-        for i in range (0, World.worldsize):
-            for j in range (0, World.worldsize):
-                self.locs[i][j].end_day()
+        for loc in self.active_locs():
+            with instrument.span ("location", loc.end_day):
+                loc.end_day()
+
+    def set_loc (self, x, y, loc):
+        '''Puts a location on the map, replacing whatever was there.'''
+        self.active.pop ((x, y), None)
+        self.locs.set (x, y, loc)
+        if loc.has_day_hooks():
+            self.active[(x, y)] = loc
+
+    def activate (self, loc):
+        '''Adds a location to the daily tick, for locations that only need start_day/end_day some of the time.'''
+        self.active[(loc.get_x(), loc.get_y())] = loc
+
+    def deactivate (self, loc):
+        '''Takes a location off the daily tick.'''
+        key = (loc.get_x(), loc.get_y())
+        if self.active.get (key) is loc:
+            del self.active[key]
+
+    def active_locs (self):
+        '''The locations to tick today, in map order. A copy, so hooks can add or remove locations.'''
+        return [self.active[k] for k in sorted (self.active)]
 
     def get_startloc (self):
-        return self.locs[World.startx][World.starty]
+        return self.locs.get (self.startx, self.starty)
 
     def get_loc (self, x, y):
         # The World is... toroidal, actually.
         #  Modulo operator causes the world to loop from bottom to top and right to left
         #  Python negative index handling causes it to loop the other way too.
-        x = x%World.worldsize
-        y = y%World.worldsize
-        return self.locs[x][y]
+        x = x%self.worldsize
+        y = y%self.worldsize
+        return self.locs.get (x, y)
 
     def get_ship (self):
         return self.ship
 
 
     def print (self):
+        if not display.rendering():
+            return
         ship_loc = self.ship.get_loc()
-        for i in range (0, World.worldsize):
-            for j in range (0, World.worldsize):
-                l = self.locs[i][j]
-                if (l == ship_loc):
-                    print ("S", end="")
+        rows = []
+        for i in range (0, self.worldsize):
+            row = ""
+            for j in range (0, self.worldsize):
+                if (i == ship_loc.get_x() and j == ship_loc.get_y()):
+                    row += "S"
                 else:
-                    print (self.locs[i][j].get_symbol(), end="")
-            print ()
+                    row += self.locs.symbol (i, j)
+            rows.append (row)
+        display.announce ("\n".join(rows), pause=False)
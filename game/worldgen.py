@@ -0,0 +1,102 @@
+'''
+Placing locations on a new world map.
+
+World.__init__ used to roll random coordinates until one happened to fit, which never finishes once
+there's no room left. A Placer tries a bounded number of random cells, and if none of them fit it
+goes through the cells in random order without repeats, so it only looks at as many cells as it takes
+to find one that fits, and placing a location always finishes. If nothing fits at all it raises
+WorldGenError instead of spinning forever.
+
+Every rule about where something may go is a function allowed(x, y). The rules every placement
+follows (don't land on another location, keep some space between locations) are checked with a
+spatial hash, so a check only looks at nearby locations however many have been placed.
+'''
+
+class WorldGenError(Exception):
+    '''There's nowhere left on the map that a location is allowed to go.'''
+    pass
+
+class Placer:
+    '''Places locations on world's map with world's random number generator.
+    spacing is how far (in cells, counting diagonals, wrapping around the map) placed locations
+    must be from each other: 1 only keeps them off each other's cell, 2 leaves a cell of water between.'''
+
+    def __init__ (self, world, spacing = 1, attempts = 64):
+        self.world = world
+        self.rng = world.rng
+        self.size = world.worldsize
+        self.spacing = spacing
+        self.attempts = attempts
+        #spatial hash of placed locations: bucket -> cells
+        self.bucket_size = max(spacing, 1)
+        self.buckets = {}
+        #the last bucket is short when the map doesn't divide evenly, so look one further to be safe
+        self.reach = 1 if self.size % self.bucket_size == 0 else 2
+        self.nbuckets = -(-self.size // self.bucket_size)
+
+    def bucket (self, x, y):
+        return (x // self.bucket_size, y // self.bucket_size)
+
+    def add (self, x, y):
+        '''Marks (x, y) as taken, for something placed some other way.'''
+        self.buckets.setdefault(self.bucket(x, y), []).append((x, y))
+
+    def clear (self, x, y):
+        '''True if nothing placed is within spacing of (x, y).'''
+        bx, by = self.bucket(x, y)
+        size = self.size
+        for i in range(bx - self.reach, bx + self.reach + 1):
+            for j in range(by - self.reach, by + self.reach + 1):
+                for px, py in self.buckets.get((i % self.nbuckets, j % self.nbuckets), ()):
+                    dx = abs(px - x)
+                    dy = abs(py - y)
+                    if max(min(dx, size - dx), min(dy, size - dy)) < self.spacing:
+                        return False
+        return True
+
+    def fits (self, x, y, allowed):
+        return self.world.locs.is_ocean(x, y) and self.clear(x, y) and (allowed == None or allowed(x, y))
+
+    def pick (self, allowed = None, low = 1, high = None):
+        '''A random cell with low <= x, y < high that allowed and the placement rules accept.'''
+        if high == None:
+            high = self.size - 2
+        for i in range(self.attempts):
+            x = self.rng.randrange(low, high)
+            y = self.rng.randrange(low, high)
+            if self.fits(x, y, allowed):
+                return x, y
+        #Crowded: go through the cells in random order, each once, until one fits
+        for x, y in self.shuffled(low, high):
+            if self.fits(x, y, allowed):
+                return x, y
+        raise WorldGenError("no room left on the map")
+
+    def shuffled (self, low, high):
+        '''Every cell with low <= x, y < high, in random order. A Fisher-Yates shuffle that only stores the
+        cells it has swapped, so drawing k cells costs O(k) time and memory however big the area is.'''
+        width = high - low
+        left = width * width
+        swapped = {}
+        while left > 0:
+            i = self.rng.randrange(left)
+            left -= 1
+            cell = swapped.get(i, i)
+            swapped[i] = swapped.pop(left, left)
+            yield low + cell % width, low + cell // width
+
+    def place (self, make, allowed = None):
+        '''Picks a cell, makes the location there with make(x, y, world) and puts it on the map.'''
+        x, y = self.pick(allowed)
+        loc = make(x, y, self.world)
+        self.world.set_loc(x, y, loc)
+        self.add(x, y)
+        return loc
+
+def away_from (x, y, distance):
+    '''Rule: more than distance cells (counting diagonals) from (x, y).'''
+    return lambda cx, cy: max(abs(cx - x), abs(cy - y)) > distance
+
+def out_of_line (x, y, distance):
+    '''Rule: not in the rows or columns within distance of (x, y).'''
+    return lambda cx, cy: abs(cx - x) > distance and abs(cy - y) > distance
@@ -10,9 +10,15 @@ import game.world as world
 import game.player as player
 import game.config as config
 import game.display as display
+import sys
+
+# optional seed: python rungame.py 1234 replays the same game
+seed = None
+if len(sys.argv) > 1:
+    seed = int(sys.argv[1])
 
 ship_v     = ship.Ship()
-world_v    = world.World (ship_v)
+world_v    = world.World (ship_v, seed)
 start_loc  = world_v.get_startloc()
 ship_v.set_loc (start_loc)
 
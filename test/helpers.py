@@ -0,0 +1,26 @@
+'''Setup shared by several test files.'''
+import contextlib
+import random
+import game.config as config
+from game import display, headless, session, simulate
+
+def new_game (seed=5):
+	'''A fresh game with no commands to play and its output thrown away. Returns the player.'''
+	return headless.new_game (display.ScriptedInput ([]), display.null_sink, seed=seed)
+
+def use_session (test, s=None):
+	'''Runs the rest of test, through to its cleanups, in session s or a new one. Call it from setUp.'''
+	stack = contextlib.ExitStack ()
+	test.addCleanup (stack.close)
+	return stack.enter_context (session.use (s))
+
+@contextlib.contextmanager
+def fight (seed):
+	'''A session set up for a fight: a CombatParty with no crew yet as the player, and a bot answering every prompt.'''
+	with session.use ():
+		config.the_rng = random.Random (seed)
+		bot = simulate.CombatBot (config.the_rng)
+		display.Display (display.CallbackInput (bot.read, bot.choose), display.null_sink)
+		party = simulate.CombatParty ()
+		config.the_player = party
+		yield party
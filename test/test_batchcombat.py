@@ -0,0 +1,16 @@
+import importlib.util
+import unittest
+from game import simulate
+
+#the batch resolver needs NumPy, which the rest of the game doesn't
+numpy_missing = importlib.util.find_spec ("numpy") is None
+
+@unittest.skipIf (numpy_missing, "needs numpy")
+class BatchCombat_test (unittest.TestCase):
+
+	def test_batch_matches_object_combat (self):
+		from game import batchcombat
+		batch = batchcombat.simulate (4, ["game.combat:Drowned*4"], 20000, seed=1)
+		objects = simulate.simulate (4, ["game.combat:Drowned*4"], 2000, workers=1, seed=1)
+		self.assertEqual (20000, batch.fights)
+		self.assertAlmostEqual (batch.turns/batch.fights, objects.turns/objects.fights, delta=0.5)
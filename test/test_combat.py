@@ -0,0 +1,80 @@
+import unittest
+import random
+import game.config as config
+from game import combat, crewmate
+from test import helpers
+
+class Fighter:
+	def __init__ (self, name, speed):
+		self.name = name
+		self.speed = speed
+		self.health = 10
+		self.cur_move = 0
+
+
+class Initiative_test (unittest.TestCase):
+
+	def test_speed_sets_turn_share (self):
+		fast = Fighter ("fast", 150)
+		slow = Fighter ("slow", 100)
+		queue = combat.Initiative ([fast, slow])
+		turns = [queue.next().name for i in range (10)]
+		self.assertEqual (6, turns.count ("fast"))
+		self.assertEqual (4, turns.count ("slow"))
+
+	def test_dead_are_skipped (self):
+		a = Fighter ("a", 100)
+		b = Fighter ("b", 90)
+		queue = combat.Initiative ([a, b])
+		a.health = 0
+		self.assertEqual ("b", queue.next().name)
+		self.assertTrue (queue.stale)
+
+
+class Species_test (unittest.TestCase):
+
+	def setUp (self):
+		helpers.use_session (self)
+		config.the_rng = random.Random (3)
+
+	def test_monsters_share_attacks (self):
+		a = combat.Drowned ("a")
+		b = combat.Drowned ("b")
+		self.assertEqual ("Drowned Pirate", a.type_name)
+		for x, y in zip (a.actions, b.actions):
+			if x.action.success == y.action.success:
+				self.assertIs (x, y)
+		self.assertIn (a.pickAction(), a.actions)
+
+	def test_rolls_in_range (self):
+		for i in range (200):
+			m = combat.Drowned ("m")
+			self.assertTrue (7 <= m.health < 20)
+			self.assertTrue (65 <= m.speed <= 85)
+			self.assertTrue (all (35 <= a.action.success < 51 for a in m.actions))
+
+	def test_old_saved_monster (self):
+		m = combat.Drowned.__new__ (combat.Drowned)
+		m.__setstate__ ({"name": "m", "health": 9, "speed": 70, "attacks": {"bite": ["bites", 40, (5,15)]}})
+		self.assertFalse (hasattr (m, "attacks"))
+		self.assertEqual (["bite"], [str (a) for a in m.getAttacks()])
+		self.assertEqual (40, m.pickAction().action.success)
+
+
+class Combat_test (unittest.TestCase):
+
+	def test_crew_list_rebuilt_only_on_deaths (self):
+		with helpers.fight (6) as party:
+			party.pirates = [crewmate.CrewMate () for i in range (6)]
+			asked = []
+			get_pirates = party.get_pirates
+			party.get_pirates = lambda: asked.append (1) or get_pirates ()
+			cleanups = []
+			party.cleanup_items = lambda: cleanups.append (1)
+			fight = combat.Combat ([combat.Drowned (f"d{n}") for n in range (12)])
+			fight.combat ()
+			self.assertGreater (fight.turns, 20)
+			#once to start, then only around deaths: when someone is killed, and when the dead one's turn comes up
+			dead = len ([c for c in party.pirates if c.health <= 0]) + 12 - len (fight.monsters)
+			self.assertLessEqual (len (asked), 1 + 2*dead)
+			self.assertEqual ([], cleanups)
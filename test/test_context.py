@@ -0,0 +1,60 @@
+import unittest
+from game import context
+
+class Context_test (unittest.TestCase):
+
+	def make (self, *verbs):
+		c = context.Context()
+		for v in verbs:
+			c.verbs[v] = c
+		return c
+
+	def test_abbreviations (self):
+		table = context.Dispatch([self.make("north", "south", "status", "inventory")])
+		self.assertEqual ("inventory", table.resolve(["inv"])[1])
+		self.assertEqual ("south", table.resolve(["sou"])[1])
+		self.assertEqual (["north", "now"], table.resolve(["n", "now"])[2])
+		self.assertIsNone (table.resolve(["s"]))
+		self.assertIsNone (table.resolve(["swim"]))
+
+	def test_exact_verb_beats_noun_and_prefix (self):
+		c = self.make("go", "gossip")
+		c.nouns["go"] = self.make("eat")
+		table = context.Dispatch([c])
+		self.assertEqual (("go", ["go", "eat"]), table.resolve(["go", "eat"])[1:])
+
+	def test_table_rebuilt_on_change (self):
+		c = self.make("chase")
+		first = context.dispatch_table([c])
+		self.assertIs (first, context.dispatch_table([c]))
+		c.verbs["feed"] = c
+		second = context.dispatch_table([c])
+		self.assertIsNot (first, second)
+		self.assertIn ("feed", second.verbs)
+
+	def test_other_contexts_changes_keep_table (self):
+		c = self.make("chase")
+		first = context.dispatch_table([c])
+		other = self.make("sing")
+		other.nouns["jim"] = other
+		self.assertIs (first, context.dispatch_table([c]))
+
+	def test_swapped_dict_rebuilds (self):
+		c = self.make("chase")
+		first = context.dispatch_table([c])
+		c.verbs = context.VersionedDict({"feed": c})
+		self.assertEqual (["feed"], list(context.dispatch_table([c]).verbs))
+
+	def test_quit_not_abbreviated (self):
+		table = context.Dispatch([self.make("quit", "save", "status")])
+		self.assertIsNone (table.resolve(["q"]))
+		self.assertIsNone (table.resolve(["sa"]))
+		self.assertEqual ("status", table.resolve(["s"])[1])
+		self.assertEqual ("quit", table.resolve(["quit"])[1])
+
+	def test_plain_dicts_not_cached (self):
+		c = self.make("chase")
+		c.verbs = {"chase": c}
+		first = context.dispatch_table([c])
+		c.verbs["feed"] = c
+		self.assertIn ("feed", context.dispatch_table([c]).verbs)
@@ -0,0 +1,67 @@
+import copy
+import random
+import unittest
+import game.config as config
+from game import combat, crewmate, items
+from test import helpers
+
+class CountedCutlass (items.Cutlass):
+	__slots__ = ()
+	built = 0
+
+	def getAttacks (self, owner):
+		CountedCutlass.built += 1
+		return super ().getAttacks (owner)
+
+
+class Attacks_test (unittest.TestCase):
+
+	def setUp (self):
+		helpers.use_session (self)
+		config.the_rng = random.Random (2)
+		config.the_player = None
+		self.pirate = crewmate.CrewMate ()
+
+	def names (self):
+		return [str (a) for a in self.pirate.getAttacks ()]
+
+	def test_duplicates_offered_once (self):
+		self.pirate.items = [items.Cutlass () for i in range (500)] + [items.Flintlock ()]
+		self.assertEqual (["slash with cutlass", "shoot with flintlock", "punch", "defend"], self.names ())
+		self.assertIs (self.pirate.getAttacks (), self.pirate.getAttacks ())
+
+	def test_discharge_and_reload (self):
+		gun = [a for a in self.pirate.getAttacks () if str (a) == "shoot with flintlock"][0]
+		gun.resolve (gun, self.pirate, [])
+		self.assertNotIn ("shoot with flintlock", self.names ())
+		self.pirate.reload ()
+		self.assertIn ("shoot with flintlock", self.names ())
+
+	def test_skills_and_items_change (self):
+		self.pirate.getAttacks ()
+		self.pirate.skills["brawling"] = 99
+		self.pirate.forget_attacks ()
+		punch = [a for a in self.pirate.getAttacks () if str (a) == "punch"][0]
+		self.assertEqual (99, punch.action.success)
+		self.pirate.items = [items.BelayingPin ()]
+		self.assertEqual (["bash with belaying-pin", "punch", "defend"], self.names ())
+
+	def test_cache_not_copied (self):
+		self.pirate.getAttacks ()
+		self.assertNotIn ("_attacks", copy.deepcopy (self.pirate).__dict__)
+
+	def test_cache_hits_in_combat (self):
+		with helpers.fight (4) as party:
+			for i in range (4):
+				c = crewmate.CrewMate ()
+				c.items = [CountedCutlass () for n in range (50)]
+				party.pirates.append (c)
+			calls = []
+			for c in party.pirates:
+				attacks = c.getAttacks
+				c.getAttacks = lambda attacks=attacks: calls.append (1) or attacks ()
+			CountedCutlass.built = 0
+			combat.Combat ([combat.Drowned (f"d{n}") for n in range (8)]).combat ()
+			#one build per pirate, all 50 cutlasses, then every later turn is a hit
+			self.assertGreater (len (calls), 4)
+			self.assertEqual (4*50, CountedCutlass.built)
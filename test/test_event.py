@@ -0,0 +1,56 @@
+import random
+import unittest
+from game import event, registry
+from game.events import seagull, sickness, nothing
+
+class EventPool_test (unittest.TestCase):
+
+	def test_counts_not_instances (self):
+		pool = event.EventPool()
+		for i in range (0, 1000):
+			pool.append (sickness.Sickness())
+		pool.append (nothing.Nothing())
+		self.assertEqual (1001, len(pool))
+		self.assertEqual (2, len(pool.reps))
+
+	def test_draws_are_weighted_by_count (self):
+		pool = event.EventPool([sickness.Sickness(), sickness.Sickness(), sickness.Sickness(), nothing.Nothing()])
+		rng = random.Random(1)
+		sick = 0
+		for i in range (0, 4000):
+			e = pool.draw(rng)
+			if isinstance(e, sickness.Sickness):
+				sick += 1
+			pool.append(e)
+		self.assertAlmostEqual (0.75, sick/4000, delta=0.03)
+
+	def test_seagull_flocks_kept_apart (self):
+		big = seagull.Seagull()
+		big.seagulls = 5
+		pool = event.EventPool([seagull.Seagull(), big])
+		self.assertEqual (2, len(list(pool)))
+		rng = random.Random(2)
+		drawn = sorted ([pool.draw(rng).seagulls, pool.draw(rng).seagulls])
+		self.assertEqual ([1, 5], drawn)
+		self.assertEqual (0, len(pool))
+
+	def test_drawn_copy_is_independent (self):
+		pool = event.EventPool([seagull.Seagull(), seagull.Seagull()])
+		e = pool.draw(random.Random(3))
+		e.seagulls = 9
+		self.assertEqual (1, pool.count(seagull.Seagull()))
+
+	def test_lazy_events_stay_lazy (self):
+		pool = event.EventPool([registry.LazyEvent("nothing"), registry.LazyEvent("nothing")])
+		e = pool.draw(random.Random(4))
+		self.assertIsInstance (e, registry.LazyEvent)
+		self.assertEqual ("nothing", e.kind)
+
+	def test_drawn_seagull_answers_for_itself (self):
+		big = seagull.Seagull()
+		big.seagulls = 3
+		pool = event.EventPool([big, big])
+		e = pool.draw(random.Random(5))
+		self.assertIsNot (big, e)
+		self.assertEqual (3, e.seagulls)
+		self.assertIs (e, e.verbs["chase"])
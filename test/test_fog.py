@@ -0,0 +1,21 @@
+import unittest
+from game import fog
+
+class Fog_test (unittest.TestCase):
+
+	def test_sight_wraps (self):
+		f = fog.Fog (10)
+		f.reveal (0, 9, 1)
+		self.assertTrue (f[9][0])
+		self.assertTrue (f.seen(1, 8))
+		self.assertFalse (f.seen(2, 9))
+		self.assertEqual (9, f.count)
+		self.assertAlmostEqual (0.09, f.fraction_explored())
+
+	def test_unexplored_within (self):
+		f = fog.Fog (25)
+		f.reveal (12, 12, 2)
+		self.assertEqual (0, f.unexplored_within(12, 12, 2))
+		self.assertEqual (49 - 25, f.unexplored_within(12, 12, 3))
+		f.reveal (12, 12, 30)
+		self.assertEqual (1.0, f.fraction_explored())
@@ -0,0 +1,51 @@
+import unittest
+import unittest.mock
+from game import headless
+from game import display
+import random
+
+class Headless_test (unittest.TestCase):
+
+	def test_script_runs_out (self):
+		p = headless.play (display.ScriptedInput(["status", "go north", "go north"]))
+		self.assertTrue (p.get_world().get_day() >= 1)
+
+	def test_pauses_do_not_use_input (self):
+		out = []
+		d = display.Display (display.ScriptedInput(["yes"]), out.append)
+		display.announce ("press enter")
+		self.assertEqual ("yes", display.get_text_input ("? "))
+		self.assertEqual (["press enter\n", "? ", "yes\n"], out)
+
+	def test_seed_replays (self):
+		runs = []
+		for i in range (2):
+			out = []
+			bot = headless.RandomSailor (random.Random(7))
+			p = headless.play (bot.source(), out.append, seed=42)
+			runs.append ("".join(out))
+		self.assertEqual (runs[0], runs[1])
+
+	def test_frame_is_one_write (self):
+		out = []
+		p = headless.new_game (display.ScriptedInput(["map"]), out.append, seed=3)
+		p.status ()
+		p.print_map ()
+		self.assertEqual (2, len(out))
+		self.assertEqual (p.get_world().worldsize, out[1].count("\n"))
+
+	def test_null_sink_skips_drawing (self):
+		p = headless.new_game (display.ScriptedInput([]), display.null_sink, seed=3)
+		self.assertFalse (display.rendering())
+		p.world = None
+		#would fail if it tried to draw the map
+		p.print_map ()
+
+	def test_keyboard_prompt_shown_once (self):
+		out = []
+		asked = []
+		d = display.Display (display.KeyboardInput(), out.append)
+		with unittest.mock.patch ("builtins.input", lambda *prompt: asked.append (prompt) or "north"):
+			self.assertEqual ("north", d.read ("What now? "))
+		self.assertEqual (["What now? "], out)
+		self.assertEqual ([()], asked)
@@ -0,0 +1,44 @@
+import json
+import random
+import os
+import tempfile
+import unittest
+from game import instrument, headless, display
+
+class Instrument_test (unittest.TestCase):
+
+	def tearDown (self):
+		instrument.stop()
+
+	def test_off_by_default (self):
+		self.assertFalse (instrument.recording())
+		self.assertIs (instrument.span("event", "a"), instrument.span("combat", "b"))
+
+	def test_records_a_game (self):
+		instrument.start()
+		source = headless.RandomSailor(random.Random(1)).source()
+		headless.play (source, seed=1)
+		recorder = instrument.stop()
+		categories = set(s[0] for s in recorder.spans)
+		self.assertIn ("updater", categories)
+		self.assertIn ("event", categories)
+		self.assertIn ("location", categories)
+		names = set(s[1] for s in recorder.spans)
+		self.assertIn ("sea_state_update", names)
+		self.assertIn ("Whirlpool.start_day", names)
+		self.assertIn ("sea_state_update", recorder.summary())
+
+	def test_chrome_trace (self):
+		recorder = instrument.start()
+		with instrument.span ("combat", "outer"):
+			with instrument.span ("event", "inner"):
+				pass
+		instrument.stop()
+		path = os.path.join(tempfile.mkdtemp(), "trace.json")
+		recorder.save_trace (path)
+		with open(path) as f:
+			events = json.load(f)["traceEvents"]
+		self.assertEqual (["inner", "outer"], [e["name"] for e in events])
+		self.assertEqual ("X", events[0]["ph"])
+		self.assertLessEqual (events[0]["dur"], events[1]["dur"])
+		self.assertEqual ({"outer": [1], "inner": [1]}, {n: [t[0]] for (c, n), t in recorder.totals().items()})
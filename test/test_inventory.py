@@ -0,0 +1,39 @@
+import unittest
+from game import inventory, items, config
+from test import helpers
+
+class Inventory_test (unittest.TestCase):
+
+	def test_iterates_like_a_sorted_list (self):
+		loot = [items.Cutlass(), items.BelayingPin(), items.Flintlock(), items.Cutlass(), items.BelayingPin()]
+		inv = inventory.Inventory(loot[:2])
+		inv.extend(loot[2:])
+		self.assertEqual (sorted(loot), list(inv))
+		self.assertEqual ([id(i) for i in sorted(loot)], [id(i) for i in inv])
+		self.assertEqual (5, len(inv))
+		self.assertEqual (2, inv.count("cutlass"))
+
+	def test_take_and_remove (self):
+		first = items.Cutlass()
+		second = items.Cutlass()
+		inv = inventory.Inventory([first, second, items.Flintlock()])
+		self.assertIs (first, inv.find("cutlass"))
+		self.assertIs (first, inv.take("cutlass"))
+		self.assertNotIn (first, inv)
+		inv.remove (second)
+		self.assertIsNone (inv.take("cutlass"))
+		self.assertEqual (["flintlock"], [i.name for i in inv])
+		with self.assertRaises (ValueError):
+			inv.remove (second)
+
+	def test_equip_and_unequip (self):
+		p = helpers.new_game (2)
+		pirate = p.pirates[0]
+		held = len(pirate.items)
+		pins = p.inventory.count("belaying-pin")
+		pirate.process_verb ("equip", ["equip", "belaying-pin"], {})
+		self.assertEqual (pins - 1, p.inventory.count("belaying-pin"))
+		self.assertEqual (held + 1, len(pirate.items))
+		pirate.process_verb ("unequip", ["unequip", "belaying-pin"], {})
+		self.assertEqual (pins, p.inventory.count("belaying-pin"))
+		self.assertEqual (held, len(pirate.items))
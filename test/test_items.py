@@ -0,0 +1,46 @@
+import copy
+import pickle
+import unittest
+from game import items, display
+from test import helpers
+
+class Item_test (unittest.TestCase):
+
+	def test_kind_is_shared (self):
+		a = items.Flintlock()
+		b = items.Flintlock()
+		self.assertFalse (hasattr(a, "__dict__"))
+		self.assertIs (a.damage, b.damage)
+		self.assertEqual (1, a.charges)
+		a.discharge()
+		self.assertEqual (0, a.charges)
+		self.assertEqual (1, b.charges)
+
+	def test_unknown_verb_names_the_item (self):
+		helpers.use_session (self)
+		out = []
+		display.Display (display.ScriptedInput([]), out.append)
+		items.Cutlass().process_verb ("eat", ["eat", "cutlass"], {})
+		self.assertEqual (["cutlass can't eat\n"], out)
+
+	def test_one_name_per_kind (self):
+		with self.assertRaises (TypeError):
+			items.Cutlass ("sabre", 7)
+		t = items.Trinket ("Golden Cutlass", 100)
+		self.assertEqual ("Golden Cutlass (100 shillings)", str(t))
+
+	def test_copies_and_pickles (self):
+		f = items.Flintlock()
+		f.discharge()
+		for g in [copy.deepcopy(f), pickle.loads(pickle.dumps(f))]:
+			self.assertIsInstance (g, items.Flintlock)
+			self.assertEqual (0, g.charges)
+		t = pickle.loads(pickle.dumps(items.Trinket("Golden Cutlass", 100)))
+		self.assertEqual ("Golden Cutlass", t.name)
+
+	def test_old_saved_state (self):
+		#an item saved before items were slotted
+		c = items.Cutlass.__new__(items.Cutlass)
+		c.__setstate__ ({"name": "cutlass", "value": 5, "damage": (10,60), "charges": 0, "usedUp": True, "verbs": {}, "nouns": {}})
+		self.assertTrue (c.usedUp)
+		self.assertEqual ("swords", c.skill)
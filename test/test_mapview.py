@@ -0,0 +1,17 @@
+import unittest
+from test import helpers
+
+class MapView_test (unittest.TestCase):
+
+	def test_only_changed_rows_redrawn (self):
+		p = helpers.new_game (9)
+		view = p.map_view
+		loc = p.ship.get_loc()
+		view.render (p.world, p.seen, loc)
+		self.assertEqual (p.world.worldsize, view.redrawn)
+		view.render (p.world, p.seen, loc)
+		self.assertEqual (0, view.redrawn)
+		p.seen.reveal (loc.get_x(), loc.get_y(), 1)
+		text = view.render (p.world, p.seen, loc)
+		self.assertEqual (3, view.redrawn)
+		self.assertEqual ("S", text.split("\n")[loc.get_y()][loc.get_x()])
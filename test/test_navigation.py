@@ -0,0 +1,50 @@
+import unittest
+from game import navigation, fog, headless, display
+
+class Navigation_test (unittest.TestCase):
+
+	def test_route_wraps_around (self):
+		path = navigation.route ((1, 5), (23, 5), 25, frozenset())
+		self.assertEqual ([(0, 5), (24, 5), (23, 5)], path)
+
+	def test_route_avoids_hazards (self):
+		blocked = frozenset([(2, 5)])
+		path = navigation.route ((0, 5), (4, 5), 25, blocked)
+		self.assertEqual (6, len(path))
+		self.assertNotIn ((2, 5), path)
+		self.assertIsNone (navigation.route ((0, 5), (2, 5), 25, blocked))
+
+	def test_nearest_unexplored (self):
+		f = fog.Fog (25)
+		f.reveal (10, 10, 2)
+		cell = navigation.nearest_unexplored ((10, 10), 25, f, frozenset())
+		self.assertEqual (3, navigation.distance ((10, 10), cell, 25))
+
+	def test_nearest_unexplored_far_away (self):
+		#a big map seen all over but for one cell, and that one behind a hazard
+		f = fog.Fog (1000)
+		f.reveal (0, 0, 500)
+		f.rows[700] &= ~(1 << 300)
+		f.rows[700] &= ~(1 << 302)
+		cell = navigation.nearest_unexplored ((10, 10), 1000, f, frozenset([(300, 700)]))
+		self.assertEqual ((302, 700), cell)
+		f.rows[700] |= 1 << 302
+		self.assertIsNone (navigation.nearest_unexplored ((10, 10), 1000, f, frozenset([(300, 700)])))
+
+	def test_nearest_hidden_wraps (self):
+		f = fog.Fog (10)
+		f.reveal (5, 0, 3)
+		#columns 2 to 8 seen, 9, 0 and 1 not
+		self.assertEqual (-3, f.nearest_hidden (4, 0))
+		self.assertEqual (2, f.nearest_hidden (7, 0))
+		self.assertEqual (3, f.nearest_hidden (7, 0, 1 << 9))
+		self.assertEqual (0, f.nearest_hidden (4, 5))
+
+	def test_autopilot_sails_without_orders (self):
+		commands = ["sail to 12 16"]
+		p = headless.play (display.ScriptedInput(commands), seed=11)
+		self.assertGreater (p.get_world().get_day(), 1)
+		loc = p.ship.get_loc()
+		#sailed south until the script ran out (arrival, or an event that needed an answer)
+		self.assertEqual (12, loc.get_x())
+		self.assertGreater (loc.get_y(), 12)
@@ -5,4 +5,5 @@ class Player_test (unittest.TestCase):
 
 	def test_notdone_initialized (self):
 		p = player.Player (None, None)
-		self.assertEqual (True, p.notdone())
\ No newline at end of file
+		self.assertEqual (True, p.notdone())
+
@@ -0,0 +1,45 @@
+import unittest
+from game import registry, location
+from game.locations import LucciIsland
+from game.events import nothing
+from test import helpers
+
+class Registry_test (unittest.TestCase):
+
+	def test_unknown_name (self):
+		with self.assertRaises (KeyError):
+			registry.locations.get ("atlantis")
+
+	def test_names_by_info (self):
+		self.assertIn ("island", registry.locations.names(random=True))
+		self.assertNotIn ("homeport", registry.locations.names(random=True))
+
+	def test_lazy_location_is_drawn_from_its_registration (self):
+		w = helpers.new_game().world
+		loc = w.get_loc (w.startx, w.starty + 1)
+		self.assertIsInstance (loc, registry.LazyLocation)
+		self.assertEqual ("I", loc.get_symbol())
+		self.assertEqual ("Lucci's island", loc.name)
+
+	def test_entering_makes_the_real_location (self):
+		p = helpers.new_game()
+		w = p.world
+		lazy = w.get_loc (w.startx, w.starty + 1)
+		p.ship.set_loc (lazy)
+		lazy.enter (p.ship)
+		real = w.get_loc (w.startx, w.starty + 1)
+		self.assertIsInstance (real, LucciIsland.Island)
+		self.assertIs (real, p.ship.get_loc())
+
+	def test_locations_with_day_hooks_are_eager (self):
+		for entry in registry.locations:
+			cls = entry.load()
+			hooks = cls.start_day is not location.Location.start_day or cls.end_day is not location.Location.end_day
+			if hooks:
+				self.assertTrue (entry.info.get("eager", False), entry.name)
+
+	def test_world_events_load_when_drawn (self):
+		w = helpers.new_game().world
+		self.assertEqual (7, len(w.events))
+		results = registry.LazyEvent ("nothing").process (w)
+		self.assertEqual (nothing.Nothing().process(w)["message"], results["message"])
@@ -0,0 +1,67 @@
+import datetime
+import os
+import tempfile
+import unittest
+from game import scores
+from test import helpers
+
+LOG = """Wednesday October 15, 2025 1250.0 points
+Anne lived to tell the tale
+Jim Drowned in the whirlpool
+cutlass (15 shillings)
+belaying-pin (5 shillings)
+----------------------
+
+Thursday October 16, 2025 300.0 points
+Yang died of sudden-onset starvation
+----------------------
+
+"""
+
+class Scores_test (unittest.TestCase):
+
+	def setUp (self):
+		self.dir = tempfile.mkdtemp()
+		self.store = scores.ScoreStore (os.path.join(self.dir, "scores.db"))
+
+	def tearDown (self):
+		self.store.close()
+
+	def score (self, day, points, crew=3):
+		crewlist = [{"name": f"c{i}", "alive": True, "death_cause": ""} for i in range(crew)]
+		return scores.Score (datetime.datetime(2026, 10, day), points, day, 10, crewlist, [])
+
+	def test_top_and_ranges (self):
+		with self.store.batch():
+			self.store.add_many ([self.score(d, d * 10, crew=3 + d % 2) for d in range(1, 29)])
+		self.assertEqual (28, len(self.store))
+		self.assertEqual ([280, 270, 260], [s.score for s in self.store.top(3)])
+		week = self.store.top (10, since=datetime.datetime(2026, 10, 5), until=datetime.datetime(2026, 10, 8))
+		self.assertEqual ([70, 60, 50], [s.score for s in week])
+		self.assertEqual ([5, 6, 7], [s.seed for s in self.store.between(datetime.datetime(2026, 10, 5), datetime.datetime(2026, 10, 8))])
+		self.assertEqual ([280, 260], [s.score for s in self.store.top(2, crew_size=3)])
+		self.assertEqual ({3: 150.0, 4: 140.0}, self.store.average_by_crew_size())
+
+	def test_leaderboard_uses_an_index (self):
+		plan = self.store.db.execute ("EXPLAIN QUERY PLAN SELECT * FROM scores WHERE played >= ? ORDER BY score DESC LIMIT 10", ["2026-10-01"]).fetchall()
+		self.assertIn ("INDEX", " ".join(str(row) for row in plan))
+
+	def test_import_log (self):
+		path = os.path.join(self.dir, "scores.log")
+		with open(path, "w") as f:
+			f.write (LOG)
+		self.assertEqual (2, self.store.import_log(path))
+		best = self.store.top(1)[0]
+		self.assertEqual (1250.0, best.score)
+		self.assertEqual (datetime.datetime(2025, 10, 15), best.played)
+		self.assertEqual (1, best.survivors())
+		self.assertEqual ("Drowned in the whirlpool", best.crew[1]["death_cause"])
+		self.assertEqual (["cutlass", "belaying-pin"], best.inventory)
+
+	def test_from_player (self):
+		p = helpers.new_game (4)
+		s = scores.from_player (p)
+		self.assertEqual (4, s.seed)
+		self.assertEqual (len(p.pirates), s.survivors())
+		carried = sum(i.getValue() for i in p.inventory) + sum(i.getValue() for c in p.pirates for i in c.items)
+		self.assertEqual (sum(c.health * 10 for c in p.pirates) + carried, s.score)
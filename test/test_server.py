@@ -0,0 +1,104 @@
+import asyncio
+import socket
+import unittest
+import unittest.mock
+from game import server
+
+async def client(port, commands):
+	'''Connects, sends commands one line at a time (then stops sending, which ends the game once they
+	run out) and returns everything the game sent back.'''
+	reader, writer = await asyncio.open_connection("127.0.0.1", port)
+	for cmd in commands:
+		writer.write((cmd + "\r\n").encode())
+	await writer.drain()
+	writer.write_eof()
+	text = (await reader.read()).decode()
+	writer.close()
+	return text
+
+class Server_test (unittest.TestCase):
+
+	def run_server (self, test):
+		async def run():
+			s = server.Server(max_games=50)
+			listener = await s.start(port=0)
+			port = listener.sockets[0].getsockname()[1]
+			try:
+				return await asyncio.wait_for(test(port), 30)
+			finally:
+				listener.close()
+				s.close()
+		return asyncio.run(run())
+
+	def test_many_games_at_once (self):
+		async def test(port):
+			return await asyncio.gather(*[client(port, ["status", "quit"]) for i in range(30)])
+		for text in self.run_server(test):
+			self.assertIn ("Day 1", text)
+			self.assertIn ("\r\n", text)
+
+	def test_idle_player_does_not_hold_up_others (self):
+		async def test(port):
+			reader, writer = await asyncio.open_connection("127.0.0.1", port)
+			#connected but never types
+			text = await client(port, ["status", "quit"])
+			writer.close()
+			return text
+		self.assertIn ("Day 1", self.run_server(test))
+
+	def test_hanging_up_ends_the_game (self):
+		s = server.Server(max_games=5)
+		async def run():
+			listener = await s.start(port=0)
+			port = listener.sockets[0].getsockname()[1]
+			reader, writer = await asyncio.open_connection("127.0.0.1", port)
+			await reader.readline()
+			writer.close()
+			while s.playing > 0:
+				await asyncio.sleep(0.01)
+			listener.close()
+		asyncio.run(asyncio.wait_for(run(), 30))
+		s.close()
+		self.assertEqual (0, len(s.sources))
+
+	def test_stalled_reader_is_dropped_without_holding_up_others (self):
+		s = server.Server(max_games=5)
+		async def run():
+			listener = await s.start(port=0)
+			port = listener.sockets[0].getsockname()[1]
+			#a client that asks for maps and never reads them, with a small receive buffer so the
+			# output backs up on the server quickly
+			sock = socket.socket()
+			sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+			sock.connect(("127.0.0.1", port))
+			sock.setblocking(False)
+			reader, writer = await asyncio.open_connection(sock=sock)
+			writer.write(("map\r\n" * 20000).encode())
+			await writer.drain()
+			text = await client(port, ["status", "quit"])
+			while s.playing > 0:
+				await asyncio.sleep(0.01)
+			listener.close()
+			writer.close()
+			return text
+		with unittest.mock.patch.object(server, "MAX_BUFFER", 1 << 16):
+			text = asyncio.run(asyncio.wait_for(run(), 30))
+		s.close()
+		self.assertIn ("Day 1", text)
+		self.assertEqual (0, len(s.sources))
+
+	def test_saves_are_per_game (self):
+		async def test(port):
+			saved = await asyncio.gather(*[client(port, ["status", "save", "load"]) for i in range(2)])
+			#a later player has no save of their own, whatever the others saved
+			return saved, await client(port, ["load", "quit"])
+		saved, later = self.run_server(test)
+		for text in saved:
+			self.assertIn ("game saved", text)
+			self.assertNotIn ("There is no saved game", text)
+			self.assertNotIn ("Can't load", text)
+			self.assertIn ("Day 1", text)
+		self.assertIn ("There is no saved game", later)
+
+	def test_clean (self):
+		self.assertEqual ("go north", server.clean(b"\xff\xfb\x01go north\r\n"))
@@ -0,0 +1,35 @@
+import asyncio
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from game import session, config, headless
+
+class Session_test (unittest.TestCase):
+
+	def game (self, seed):
+		p = headless.play_session (headless.RandomSailor(random.Random(seed)).source(), seed=seed)
+		return (p.get_world().get_day(), [c.get_name() for c in p.pirates], p.ship.get_loc().get_x())
+
+	def test_use_restores_the_session (self):
+		outer = config.the_player
+		with session.use() as s:
+			config.the_player = "someone"
+			self.assertIs (s, session.current())
+		self.assertIs (outer, config.the_player)
+
+	def test_threaded_games_match_one_at_a_time (self):
+		seeds = list(range(40))
+		alone = [self.game(s) for s in seeds]
+		with ThreadPoolExecutor(max_workers=8) as pool:
+			together = list(pool.map(self.game, seeds))
+		self.assertEqual (alone, together)
+
+	def test_tasks_have_their_own_players (self):
+		async def player(name):
+			session.bind (session.Session())
+			config.the_player = name
+			await asyncio.sleep (0)
+			return config.the_player
+		async def both():
+			return await asyncio.gather (player("a"), player("b"))
+		self.assertEqual (["a", "b"], asyncio.run(both()))
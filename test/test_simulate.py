@@ -0,0 +1,10 @@
+import unittest
+from game import simulate
+
+class Simulate_test (unittest.TestCase):
+
+	def test_same_seed_same_stats (self):
+		a = simulate.simulate (3, ["game.combat:Drowned*2"], 40, workers=1, seed=3, chunk=15)
+		b = simulate.simulate (3, ["game.combat:Drowned*2"], 40, workers=1, seed=3, chunk=15)
+		self.assertEqual (40, a.fights)
+		self.assertEqual (vars(a), vars(b))
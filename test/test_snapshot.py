@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+import unittest
+from game import snapshot, config, grid
+from test import helpers
+
+class Snapshot_test (unittest.TestCase):
+
+	def test_round_trip (self):
+		p = helpers.new_game()
+		q = snapshot.loads(snapshot.dumps(p))
+		self.assertIs (q, config.the_player)
+		self.assertIs (q.world.rng, config.the_rng)
+		self.assertEqual ([c.get_name() for c in p.pirates], [c.get_name() for c in q.pirates])
+		self.assertEqual (len(p.world.events), len(q.world.events))
+		loc = q.ship.get_loc()
+		self.assertIs (loc, q.world.get_loc(loc.get_x(), loc.get_y()))
+
+	def test_background_save (self):
+		p = helpers.new_game()
+		path = os.path.join(tempfile.mkdtemp(), "save.dat")
+		snapshot.save(p, path)
+		q = snapshot.load(path)
+		self.assertEqual (p.world.seed, q.world.seed)
+
+	def test_saves_from_many_threads (self):
+		p = helpers.new_game()
+		folder = tempfile.mkdtemp()
+		paths = [os.path.join(folder, f"save{i}.dat") for i in range (0, 8)]
+		errors = []
+		def save_twice(path):
+			try:
+				snapshot.save(p, path)
+				snapshot.save(p, path)
+				snapshot.wait()
+			except Exception as e:
+				errors.append(e)
+		threads = [threading.Thread(target=save_twice, args=(path,)) for path in paths]
+		for t in threads:
+			t.start()
+		for t in threads:
+			t.join()
+		snapshot.wait()
+		self.assertEqual ([], errors)
+		self.assertEqual ({}, snapshot._writers)
+		for path in paths:
+			self.assertEqual (p.world.seed, snapshot.load(path).world.seed)
+
+	def test_not_a_save (self):
+		with self.assertRaises (snapshot.SnapshotError):
+			snapshot.loads(b"{}")
+
+	def test_renamed_class (self):
+		state = snapshot.capture(helpers.new_game()).replace(b"game.grid", b"game.gird")
+		snapshot.RENAMES[("game.gird", "Grid")] = ("game.grid", "Grid")
+		try:
+			q = snapshot.loads(snapshot.frame(state))
+			self.assertIsInstance (q.world.locs, grid.Grid)
+		finally:
+			del snapshot.RENAMES[("game.gird", "Grid")]
+
+	def test_old_version_migrated (self):
+		old = snapshot.dumps(helpers.new_game())
+		version = snapshot.VERSION
+		snapshot.VERSION = version + 1
+		snapshot.MIGRATIONS[version] = lambda state: setattr(state["player"], "migrated", True)
+		try:
+			self.assertTrue (snapshot.loads(old).migrated)
+		finally:
+			snapshot.VERSION = version
+			del snapshot.MIGRATIONS[version]
+
+	def test_list_map_migrated (self):
+		p = helpers.new_game()
+		p.seen = [[x == y for y in range (0, 25)] for x in range (0, 25)]
+		old = snapshot.HEADER.pack(snapshot.MAGIC, 1) + snapshot.dumps(p)[snapshot.HEADER.size:]
+		q = snapshot.loads(old)
+		self.assertEqual (25, q.seen.count)
+		self.assertTrue (q.seen.seen(3, 3))
@@ -1,9 +1,62 @@
 
 import unittest
-from game import world
+from game import world, worldgen
 
 class World_test (unittest.TestCase):
 
 	def test_day_initialized (self):
 		w = world.World(None)
-		self.assertEqual (0, w.get_day())
\ No newline at end of file
+		self.assertEqual (0, w.get_day())
+
+	def test_only_active_locations_tick (self):
+		w = world.World(None, seed=1)
+		names = [loc.name for loc in w.active_locs()]
+		self.assertEqual (["whirlpool"], names)
+
+	def test_large_world_wraps (self):
+		w = world.World(None, seed=1, worldsize=10000)
+		self.assertEqual (5000, w.get_startloc().get_x())
+		self.assertEqual (w.get_loc(0, 3), w.get_loc(10000, -9997))
+		self.assertEqual ("ocean", w.get_loc(7, 7).name)
+		self.assertLess (len(w.locs.places), 20)
+
+	def test_islands_placed_apart (self):
+		islands = world.World.island_list
+		world.World.island_list = [islands[0]] * 40
+		try:
+			w = world.World(None, seed=2)
+		finally:
+			world.World.island_list = islands
+		cells = [xy for xy, loc in w.locs.places.items() if loc.name not in ["whirlpool", "Lucci's island"] and loc.symbol != "T"]
+		self.assertEqual (41, len(cells))
+		for a in cells:
+			self.assertGreater (max(abs(a[0] - w.startx), abs(a[1] - w.starty)), 2)
+			for b in cells:
+				if a != b:
+					self.assertGreaterEqual (max(abs(a[0] - b[0]), abs(a[1] - b[1])), 2)
+
+	def test_full_map_fails_instead_of_spinning (self):
+		islands = world.World.island_list
+		world.World.island_list = [islands[0]] * 200
+		try:
+			with self.assertRaises (worldgen.WorldGenError):
+				world.World(None, seed=2)
+		finally:
+			world.World.island_list = islands
+
+	def test_crowded_pick_does_not_scan_map (self):
+		w = world.World(None, seed=3, worldsize=2000)
+		placer = worldgen.Placer(w)
+		asked = []
+		def allowed (x, y):
+			asked.append((x, y))
+			return x < 5
+		x, y = placer.pick(allowed)
+		self.assertLess (x, 5)
+		self.assertLess (len(asked), 50000)
+
+	def test_shuffled_visits_every_cell_once (self):
+		placer = worldgen.Placer(world.World(None, seed=3))
+		cells = list(placer.shuffled(2, 9))
+		self.assertEqual (49, len(cells))
+		self.assertEqual (set((x, y) for x in range(2, 9) for y in range(2, 9)), set(cells))